@@ -1,8 +1,9 @@
 
 from .client import Client
+from .pool import ClientPool
 
 
 VERSION = (0, 0, 18)
 __version__ = '.'.join(str(x) for x in VERSION)
 
-__all__ = ['Client']
+__all__ = ['Client', 'ClientPool']
@@ -0,0 +1,185 @@
+from time import time
+
+from . import errors
+from .compression import get_compressor_cls
+
+
+class MethodStats(object):
+    """
+    Smoothed compression ratio and speed of method.
+
+    :param ratio: compressed size to uncompressed size.
+    :param speed: uncompressed bytes compressed per second.
+    """
+
+    def __init__(self, ratio, speed):
+        self.ratio = ratio
+        self.speed = speed
+
+        super(MethodStats, self).__init__()
+
+    def __repr__(self):
+        return 'ratio={:.3f}, speed={:.0f}'.format(self.ratio, self.speed)
+
+
+class CompressionSelector(object):
+    """
+    Chooses compression method of the next query by estimated time of
+    sending one byte of data. It's time of compression plus time of transfer
+    of compressed data:
+
+        ``1 / speed + ratio / bandwidth``
+
+    Ratio and speed of each method are measured on samples of recently sent
+    blocks. Bandwidth is measured by time of blocking socket writes. Writes
+    that fit into socket buffer don't block and overestimate bandwidth, so
+    it's also limited by TCP window per round trip time.
+
+    :param methods: compression methods to choose from. ``False`` stands for
+                    no compression. Methods which packages aren't installed
+                    are skipped.
+    :param level: compression level used for samples.
+    """
+
+    # Measurements are used until the first sample of method.
+    default_stats = {
+        False: MethodStats(1.0, float('inf')),
+        'lz4': MethodStats(0.5, 500e6),
+        'zstd': MethodStats(0.35, 150e6)
+    }
+
+    # Weight of the last measurement in smoothed values.
+    weight = 0.3
+
+    # Method is changed when it's this much cheaper than current one.
+    switch_threshold = 0.1
+
+    # Samples are cut from the end of block. Smaller samples are skipped:
+    # compression speed of them is dominated by overhead.
+    sample_size = 65536
+    min_sample_size = 4096
+
+    # Transfers smaller than that hardly block and aren't measured.
+    min_transfer_size = 1048576
+
+    # Assumed TCP window: bandwidth can't exceed window per round trip.
+    window_size = 4194304
+
+    def __init__(self, methods=(False, 'lz4', 'zstd'), level=None):
+        self.compressors = {}
+        self.stats = {}
+
+        for method in methods:
+            if method is not False:
+                try:
+                    compressor_cls = get_compressor_cls(method)
+                except (errors.UnknownCompressionMethod, RuntimeError):
+                    continue
+
+                self.compressors[method] = compressor_cls(level=level)
+
+            self.stats[method] = MethodStats(
+                self.default_stats[method].ratio,
+                self.default_stats[method].speed
+            )
+
+        # Nothing is known about network before the first query. The
+        # default method of compression=True is used.
+        self.method = 'lz4' if 'lz4' in self.stats else False
+
+        self.sampled = False
+        self.rtt = None
+        self.bandwidth = None
+
+        super(CompressionSelector, self).__init__()
+
+    def reset(self):
+        """
+        Forgets network measurements, e.g. on connection to other host.
+        Compression stats depend on data and are kept.
+        """
+        self.rtt = None
+        self.bandwidth = None
+
+    def smooth(self, value, new_value):
+        if value is None:
+            return new_value
+
+        return value * (1 - self.weight) + new_value * self.weight
+
+    def add_rtt(self, elapsed):
+        self.rtt = self.smooth(self.rtt, elapsed)
+
+    def add_transfer(self, size, elapsed):
+        """
+        :param size: bytes written to socket.
+        :param elapsed: seconds spent in socket writes.
+        """
+        if size < self.min_transfer_size or elapsed <= 0:
+            return
+
+        self.bandwidth = self.smooth(self.bandwidth, size / float(elapsed))
+
+    def add_sample(self, data):
+        """
+        Compresses data by each method and updates their stats. Only the
+        first sample of query is taken.
+
+        :param data: bytes-like object of uncompressed block data.
+        """
+        if self.sampled or len(data) < self.min_sample_size:
+            return
+
+        self.sampled = True
+        data = memoryview(data)[-self.sample_size:].tobytes()
+
+        for method, compressor in self.compressors.items():
+            start = time()
+            compressed_size = len(compressor.compress(data))
+            # Timer resolution can be coarse.
+            elapsed = max(time() - start, 1e-6)
+
+            stats = self.stats[method]
+            stats.ratio = self.smooth(stats.ratio,
+                                      compressed_size / float(len(data)))
+            stats.speed = self.smooth(stats.speed, len(data) / elapsed)
+
+    def get_bandwidth(self):
+        """
+        :return: estimated bandwidth in bytes per second or ``None`` if
+                 there are no measurements.
+        """
+        bandwidths = []
+        if self.bandwidth is not None:
+            bandwidths.append(self.bandwidth)
+
+        if self.rtt:
+            bandwidths.append(self.window_size / self.rtt)
+
+        return min(bandwidths) if bandwidths else None
+
+    def get_cost(self, method, bandwidth):
+        stats = self.stats[method]
+        return 1.0 / stats.speed + stats.ratio / bandwidth
+
+    def update(self):
+        """
+        Chooses method for the next query.
+
+        :return: ``True`` if method is changed.
+        """
+        self.sampled = False
+
+        bandwidth = self.get_bandwidth()
+        if bandwidth is None:
+            return False
+
+        current_cost = self.get_cost(self.method, bandwidth)
+        method = min(self.stats, key=lambda x: self.get_cost(x, bandwidth))
+
+        cost = self.get_cost(method, bandwidth)
+        if cost >= current_cost * (1 - self.switch_threshold):
+            return False
+
+        self.method = method
+        return True
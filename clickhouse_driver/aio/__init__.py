@@ -0,0 +1,4 @@
+from .client import AsyncClient
+
+
+__all__ = ['AsyncClient']
@@ -0,0 +1,51 @@
+from ..bufferedreader import BufferedReader
+
+
+class NeedMoreData(Exception):
+    """
+    Received data ends in the middle of packet.
+    """
+
+
+class AsyncBufferedReader(BufferedReader):
+    """
+    Accumulates data received from transport. Packets are parsed with the
+    same code as in blocking connection. If packet is not received completely
+    parsing is started again from the packet beginning when more data comes.
+    """
+
+    def __init__(self):
+        # Position of the first byte of packet being parsed.
+        self.start = 0
+        super(AsyncBufferedReader, self).__init__(0)
+
+    def read_into_buffer(self):
+        raise NeedMoreData()
+
+    @property
+    def unparsed_size(self):
+        return self.current_buffer_size - self.start
+
+    def commit(self):
+        self.start = self.position
+
+    def rollback(self):
+        self.position = self.start
+
+    def feed(self, data):
+        # Parsed packets are not needed anymore.
+        start = self.start
+        self.start = 0
+        self.position -= start
+
+        try:
+            self.buffer_view.release()
+            del self.buffer[:start]
+            self.buffer += data
+
+        except BufferError:
+            # Buffer can be still exported by objects that survived parsing.
+            self.buffer = self.buffer[start:] + data
+
+        self.buffer_view = memoryview(self.buffer)
+        self.current_buffer_size = len(self.buffer)
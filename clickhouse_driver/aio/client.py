@@ -0,0 +1,356 @@
+import types
+
+from .. import errors
+from ..block import ColumnOrientedBlock
+from ..client import Client
+from ..protocol import ServerPacketTypes
+from ..result import QueryResult, QueryInfo, SpillingQueryResult
+from .connection import AsyncConnection
+from .result import (
+    AsyncIterQueryResult, AsyncProgressQueryResult,
+    AsyncSpillingProgressQueryResult
+)
+
+
+class AsyncPacketGenerator(object):
+    """
+    Asynchronous iterator over packets of query response.
+
+    :param client: :class:`AsyncClient` instance.
+    :param start: coroutine function that sends query before the first
+                  packet is received. Defaults to ``None``.
+    """
+
+    def __init__(self, client, start=None):
+        self.client = client
+        self.start = start
+        self.finished = False
+
+        super(AsyncPacketGenerator, self).__init__()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.finished:
+            raise StopAsyncIteration
+
+        try:
+            if self.start is not None:
+                start, self.start = self.start, None
+                await start()
+
+            while True:
+                packet = await self.client.receive_packet()
+                if not packet:
+                    break
+
+                if packet is True:
+                    continue
+
+                return packet
+
+        except BaseException:
+            self.finished = True
+            self.client.disconnect()
+            raise
+
+        self.finished = True
+        raise StopAsyncIteration
+
+
+class AsyncClient(Client):
+    """
+    *New in version 0.0.19.*
+
+    Client for communication with the ClickHouse server over :mod:`asyncio`
+    streams. Accepts the same parameters as :class:`~clickhouse_driver.Client`.
+    Requires Python 3.5+.
+
+    Methods that communicate with server are coroutines and must be awaited.
+    :meth:`execute_iter` returns asynchronous iterator. Single connection is
+    established per client: client must not be used by concurrent tasks.
+    """
+
+    connection_cls = AsyncConnection
+
+    async def receive_result(self, with_column_types=False, columnar=False):
+        client_settings = self.connection.context.client_settings
+
+        if client_settings['spill_to_disk']:
+            result_cls = SpillingQueryResult
+        elif client_settings['use_numpy']:
+            from ..numpy.result import NumpyQueryResult
+
+            result_cls = NumpyQueryResult
+        else:
+            result_cls = QueryResult
+
+        # Packets are stored as they come instead of being pulled
+        # from generator.
+        result = result_cls(
+            (), with_column_types=with_column_types, columnar=columnar,
+            row_type=client_settings['row_type'],
+            max_rows=client_settings['max_stored_rows'],
+            max_bytes=client_settings['max_stored_bytes'],
+            cancel=self.connection.send_cancel
+        )
+
+        packets = AsyncPacketGenerator(self)
+        try:
+            async for packet in packets:
+                result.store(packet)
+
+        except errors.ResultLimitExceededError:
+            # Cancel is sent. Skip the rest of packets until END_OF_STREAM.
+            async for _ in packets:
+                pass
+            raise
+
+        return result.get_result()
+
+    async def receive_packet(self):
+        packet = await self.connection.receive_packet()
+        return self.process_packet(packet)
+
+    async def execute(self, query, params=None, with_column_types=False,
+                      external_tables=None, query_id=None, settings=None,
+                      types_check=False, columnar=False):
+        """
+        Coroutine that executes query. Accepts the same parameters and
+        returns the same result as :meth:`~clickhouse_driver.Client.execute`.
+        """
+
+        self.make_query_settings(settings)
+        await self.connection.force_connect()
+        self.last_query = QueryInfo()
+
+        try:
+            # INSERT queries can use list/tuple/generator of list/tuples/dicts.
+            # For SELECT parameters can be passed in only in dict right now.
+            is_insert = isinstance(params, (list, tuple, types.GeneratorType))
+
+            if is_insert:
+                return await self.process_insert_query(
+                    query, params, external_tables=external_tables,
+                    query_id=query_id, types_check=types_check,
+                    columnar=columnar
+                )
+            else:
+                return await self.process_ordinary_query(
+                    query, params=params, with_column_types=with_column_types,
+                    external_tables=external_tables,
+                    query_id=query_id, types_check=types_check,
+                    columnar=columnar
+                )
+
+        # Rest of result is already skipped, connection can be reused.
+        except errors.ResultLimitExceededError:
+            raise
+
+        # Cancelled query leaves unread packets in connection.
+        except BaseException:
+            self.disconnect()
+            raise
+
+    async def execute_with_progress(
+            self, query, params=None, with_column_types=False,
+            external_tables=None, query_id=None, settings=None,
+            types_check=False):
+        """
+        Coroutine that executes SELECT query with progress information.
+        Accepts the same parameters as
+        :meth:`~clickhouse_driver.Client.execute_with_progress`.
+
+            .. code-block:: python
+
+                >>> progress = await client.execute_with_progress('SELECT 1')
+                >>> async for num_rows, total_rows in progress:
+                ...     print(num_rows, total_rows)
+                >>> rv = await progress.get_result()
+
+        :return: asynchronous iterator over progress. Result is returned by
+                 its ``get_result`` coroutine.
+        """
+
+        self.make_query_settings(settings)
+        await self.connection.force_connect()
+        self.last_query = QueryInfo()
+
+        try:
+            await self.send_query(
+                query, params=params, external_tables=external_tables,
+                query_id=query_id, types_check=types_check
+            )
+
+        except BaseException:
+            self.disconnect()
+            raise
+
+        client_settings = self.connection.context.client_settings
+        if client_settings['spill_to_disk']:
+            result_cls = AsyncSpillingProgressQueryResult
+        else:
+            result_cls = AsyncProgressQueryResult
+
+        return result_cls(
+            AsyncPacketGenerator(self), with_column_types=with_column_types,
+            row_type=client_settings['row_type'],
+            max_rows=client_settings['max_stored_rows'],
+            max_bytes=client_settings['max_stored_bytes'],
+            cancel=self.connection.send_cancel
+        )
+
+    def execute_iter(
+            self, query, params=None, with_column_types=False,
+            external_tables=None, query_id=None, settings=None,
+            types_check=False):
+        """
+        Executes SELECT query with results streaming. Accepts the same
+        parameters as :meth:`~clickhouse_driver.Client.execute_iter`.
+        Query is sent on the first iteration.
+
+            .. code-block:: python
+
+                >>> async for row in client.execute_iter('SELECT 1'):
+                ...     print(row)
+
+        :return: asynchronous iterator over rows.
+        """
+
+        async def start():
+            self.make_query_settings(settings)
+            await self.connection.force_connect()
+            self.last_query = QueryInfo()
+
+            await self.send_query(
+                query, params=params, external_tables=external_tables,
+                query_id=query_id, types_check=types_check
+            )
+
+        # Settings are applied on the first iteration. Row type is known
+        # right now.
+        row_type = (settings or {}).get(
+            'row_type', self.client_settings['row_type']
+        )
+        return AsyncIterQueryResult(
+            AsyncPacketGenerator(self, start=start),
+            with_column_types=with_column_types, row_type=row_type
+        )
+
+    async def query_dataframe(self, query, params=None, external_tables=None,
+                              query_id=None, settings=None):
+        """
+        Coroutine version of :meth:`~clickhouse_driver.Client.query_dataframe`.
+        """
+        from ..numpy.helpers import columns_to_dataframe
+
+        settings = dict(settings or {}, use_numpy=True)
+        data, columns = await self.execute(
+            query, params=params, with_column_types=True,
+            external_tables=external_tables, query_id=query_id,
+            settings=settings, columnar=True
+        )
+        return columns_to_dataframe(data, [name for name, _ in columns])
+
+    async def insert_dataframe(self, query, dataframe, external_tables=None,
+                               query_id=None, settings=None,
+                               types_check=False):
+        """
+        Coroutine version of
+        :meth:`~clickhouse_driver.Client.insert_dataframe`.
+        """
+        from ..numpy.helpers import dataframe_to_columns
+
+        def get_columns(sample_block):
+            names = [name for name, _ in sample_block.columns_with_types]
+            return dataframe_to_columns(dataframe, names)
+
+        settings = dict(settings or {}, use_numpy=True)
+        self.make_query_settings(settings)
+        await self.connection.force_connect()
+        self.last_query = QueryInfo()
+
+        try:
+            return await self.process_insert_query(
+                query, get_columns, external_tables=external_tables,
+                query_id=query_id, types_check=types_check, columnar=True
+            )
+
+        except BaseException:
+            self.disconnect()
+            raise
+
+    async def send_query(self, query, params=None, external_tables=None,
+                         query_id=None, types_check=False):
+        if params is not None:
+            query = self.substitute_params(query, params)
+
+        self.connection.send_query(query, query_id=query_id)
+        self.connection.send_external_tables(external_tables,
+                                             types_check=types_check)
+        await self.connection.flush()
+
+    async def process_ordinary_query(
+            self, query, params=None, with_column_types=False,
+            external_tables=None, query_id=None,
+            types_check=False, columnar=False):
+
+        await self.send_query(
+            query, params=params, external_tables=external_tables,
+            query_id=query_id, types_check=types_check
+        )
+        return await self.receive_result(with_column_types=with_column_types,
+                                         columnar=columnar)
+
+    async def process_insert_query(self, query_without_data, data,
+                                   external_tables=None, query_id=None,
+                                   types_check=False, columnar=False):
+        await self.send_query(
+            query_without_data, external_tables=external_tables,
+            query_id=query_id, types_check=types_check
+        )
+
+        sample_block = await self.receive_sample_block()
+        if sample_block:
+            if callable(data):
+                data = data(sample_block)
+
+            await self.send_data(sample_block, data,
+                                 types_check=types_check, columnar=columnar)
+            packet = await self.connection.receive_packet()
+            if packet.exception:
+                raise packet.exception
+
+    async def receive_sample_block(self):
+        packet = await self.connection.receive_packet()
+
+        if packet.type == ServerPacketTypes.DATA:
+            return packet.block
+
+        elif packet.type == ServerPacketTypes.EXCEPTION:
+            raise packet.exception
+
+        else:
+            message = self.connection.unexpected_packet_message('Data',
+                                                                packet.type)
+            raise errors.UnexpectedPacketFromServerError(message)
+
+    async def send_data(self, sample_block, data, types_check=False,
+                        columnar=False):
+        blocks = self.data_blocks(sample_block, data,
+                                  types_check=types_check, columnar=columnar)
+        # Waiting for transport after each block keeps memory usage low.
+        for block in blocks:
+            self.connection.send_data(block)
+            await self.connection.flush()
+
+        # Empty block means end of data.
+        self.connection.send_data(ColumnOrientedBlock())
+        await self.connection.flush()
+
+    async def cancel(self, with_column_types=False):
+        self.connection.send_cancel()
+        await self.connection.flush()
+        # Client must still read until END_OF_STREAM packet.
+        return await self.receive_result(with_column_types=with_column_types)
@@ -0,0 +1,373 @@
+import asyncio
+import logging
+import socket
+import ssl
+from time import time
+
+from .. import errors
+from ..connection import Connection
+from ..protocol import ClientPacketTypes, ServerPacketTypes
+from ..reader import read_varint
+from ..writer import write_varint
+from .bufferedreader import AsyncBufferedReader, NeedMoreData
+
+
+logger = logging.getLogger(__name__)
+
+
+class TransportWriter(object):
+    """
+    Collects written data and passes it to transport on flush. Packets are
+    written by many small pieces, each transport write can be a system call.
+    """
+
+    def __init__(self, transport):
+        self.transport = transport
+        self.buffer = bytearray()
+
+        super(TransportWriter, self).__init__()
+
+    def write(self, data):
+        self.buffer += data
+
+    def flush(self):
+        if self.buffer:
+            self.transport.write(self.buffer)
+            self.buffer = bytearray()
+
+
+class ClickHouseProtocol(asyncio.Protocol):
+    """
+    Passes received data to reader and wakes up connection waiting for it.
+    """
+
+    # Reading from socket is paused when this amount of received data
+    # is not parsed yet.
+    max_unparsed_size = 4 * 1048576
+
+    def __init__(self, reader, loop):
+        self.reader = reader
+        self.loop = loop
+
+        self.transport = None
+        self.closed = False
+        self.reading_paused = False
+        self.writing_paused = False
+
+        self.data_waiter = None
+        self.drain_waiter = None
+
+        super(ClickHouseProtocol, self).__init__()
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def data_received(self, data):
+        self.reader.feed(data)
+        self.wakeup(self.data_waiter)
+
+        if self.data_waiter is None and not self.reading_paused and \
+                self.reader.unparsed_size > self.max_unparsed_size:
+            self.reading_paused = True
+            self.transport.pause_reading()
+
+    def eof_received(self):
+        self.closed = True
+        self.wakeup(self.data_waiter)
+
+    def connection_lost(self, exc):
+        self.closed = True
+        self.wakeup(self.data_waiter)
+        self.wakeup(self.drain_waiter)
+
+    def pause_writing(self):
+        self.writing_paused = True
+
+    def resume_writing(self):
+        self.writing_paused = False
+        self.wakeup(self.drain_waiter)
+
+    def wakeup(self, waiter):
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    async def wait_data(self, unparsed_size):
+        """
+        Waits until more than ``unparsed_size`` bytes are received and not
+        parsed yet.
+        """
+        while self.reader.unparsed_size <= unparsed_size:
+            if self.closed:
+                raise EOFError('Unexpected EOF while reading bytes')
+
+            if self.reading_paused:
+                self.reading_paused = False
+                self.transport.resume_reading()
+
+            self.data_waiter = self.loop.create_future()
+            try:
+                await self.data_waiter
+            finally:
+                self.data_waiter = None
+
+    async def drain(self):
+        """
+        Waits until transport's write buffer is flushed enough.
+        """
+        if self.writing_paused and not self.closed:
+            self.drain_waiter = self.loop.create_future()
+            try:
+                await self.drain_waiter
+            finally:
+                self.drain_waiter = None
+
+        if self.closed:
+            raise ConnectionResetError('Connection lost')
+
+
+class AsyncConnection(Connection):
+    """
+    Represents connection between client and ClickHouse server over
+    :mod:`asyncio` transport. Accepts the same parameters as
+    :class:`~clickhouse_driver.connection.Connection`.
+
+    Packets are parsed by the same code as in blocking connection from
+    received data. When packet is not received completely parsing is
+    started again after more data comes.
+    """
+
+    # Minimal time to wait for the rest of partially received packet before
+    # parsing it again.
+    receive_more_timeout = 0.001
+
+    def __init__(self, *args, **kwargs):
+        self.transport = None
+        self.protocol = None
+
+        super(AsyncConnection, self).__init__(*args, **kwargs)
+
+    async def force_connect(self):
+
+        if not self.connected:
+            await self.connect()
+
+        elif not await self.ping():
+            logger.warning('Connection was closed, reconnecting.')
+            await self.connect()
+
+    def _create_ssl_context(self):
+        ssl_options = self.ssl_options
+
+        if 'ssl_version' in ssl_options:
+            context = ssl.SSLContext(ssl_options['ssl_version'])
+        else:
+            context = ssl.create_default_context()
+            # Blocking connection doesn't check host name too.
+            context.check_hostname = False
+
+        if self.verify_cert:
+            context.verify_mode = ssl.CERT_REQUIRED
+
+            if 'ca_certs' in ssl_options:
+                context.load_verify_locations(ssl_options['ca_certs'])
+            else:
+                context.load_default_certs()
+        else:
+            context.verify_mode = ssl.CERT_NONE
+
+        if 'ciphers' in ssl_options:
+            context.set_ciphers(ssl_options['ciphers'])
+
+        return context
+
+    async def connect(self):
+        if self.connected:
+            self.disconnect()
+
+        logger.debug(
+            'Connecting. Database: %s. User: %s', self.database, self.user
+        )
+
+        for attempt in self.load_balancer.attempts():
+            with attempt:
+                self.host, self.port = attempt.host.host, attempt.host.port
+                await self._init_connection()
+
+    async def _init_connection(self):
+        try:
+            loop = asyncio.get_event_loop()
+            ssl_context = None
+            if self.secure_socket:
+                ssl_context = self._create_ssl_context()
+
+            self.fin = AsyncBufferedReader()
+            self.transport, self.protocol = await self.wait_for(
+                loop.create_connection(
+                    lambda: ClickHouseProtocol(self.fin, loop),
+                    self.host, self.port, ssl=ssl_context
+                ),
+                self.connect_timeout
+            )
+            self.connected = True
+
+            # performance tweak
+            sock = self.transport.get_extra_info('socket')
+            if sock is not None:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            self.fout = TransportWriter(self.transport)
+
+            self.send_hello()
+            await self.flush()
+            await self.read(self.receive_hello)
+
+            self.block_in = self.get_block_in_stream()
+            self.block_out = self.get_block_out_stream()
+
+        except errors.SocketTimeoutError:
+            self.disconnect()
+            raise
+
+        except OSError as e:
+            self.disconnect()
+            raise errors.NetworkError(
+                '{} ({})'.format(e.strerror or e, self.get_description())
+            )
+
+    def reset_state(self):
+        self.transport = None
+        self.protocol = None
+
+        super(AsyncConnection, self).reset_state()
+
+    def disconnect(self):
+        """
+        Closes connection between server and client.
+        Transport is closed in background.
+        """
+
+        if self.transport:
+            self.transport.close()
+
+        self.reset_state()
+
+    async def wait_for(self, coro, timeout):
+        try:
+            return await asyncio.wait_for(coro, timeout)
+
+        except asyncio.TimeoutError:
+            raise errors.SocketTimeoutError(
+                'timed out ({})'.format(self.get_description())
+            )
+
+    async def flush(self, timeout=None):
+        """
+        Sends written data and waits until transport accepts more data.
+        """
+        if timeout is None:
+            timeout = self.send_receive_timeout
+
+        self.fout.flush()
+        await self.wait_for(self.protocol.drain(), timeout)
+
+    async def read(self, parse, timeout=None):
+        """
+        Calls ``parse`` function with blocking-style reading from
+        :attr:`fin` until it succeeds.
+
+        :param parse: function that reads one packet.
+        :param timeout: timeout for waiting data from server.
+                        Defaults to ``send_receive_timeout``.
+        :return: value returned by ``parse``.
+        """
+        if timeout is None:
+            timeout = self.send_receive_timeout
+
+        fin = self.fin
+        started = None
+
+        while True:
+            try:
+                rv = parse()
+                fin.commit()
+                return rv
+
+            except NeedMoreData:
+                fin.rollback()
+                # Compressed stream keeps part of packet in own buffer.
+                self.block_in = self.get_block_in_stream()
+
+            if started is None:
+                started = time()
+
+            await self.receive_more(timeout, started)
+
+    async def receive_more(self, timeout, started):
+        """
+        Waits for more data of partially received packet.
+
+        Packet is parsed from the beginning after each wait. Large packets
+        come by many chunks, so wait goes on until unparsed data is doubled:
+        packet of n bytes is parsed O(log n) times. Packet can be complete
+        before that and server can send nothing more for a while. That's
+        why doubling is awaited no longer than the packet is already being
+        received.
+
+        :param timeout: timeout for waiting any data from server.
+        :param started: time when the packet reading was started.
+        """
+        fin = self.fin
+        unparsed_size = fin.unparsed_size
+
+        await self.wait_for(self.protocol.wait_data(unparsed_size), timeout)
+
+        timeout = max(time() - started, self.receive_more_timeout)
+        try:
+            await asyncio.wait_for(
+                self.protocol.wait_data(2 * unparsed_size - 1), timeout
+            )
+
+        except (asyncio.TimeoutError, EOFError):
+            pass
+
+    def receive_pong(self):
+        packet_type = read_varint(self.fin)
+        while packet_type == ServerPacketTypes.PROGRESS:
+            self.receive_progress()
+            packet_type = read_varint(self.fin)
+
+        return packet_type
+
+    async def ping(self):
+        timeout = self.sync_request_timeout
+        start = time()
+
+        try:
+            write_varint(ClientPacketTypes.PING, self.fout)
+            await self.flush(timeout=timeout)
+
+            packet_type = await self.read(self.receive_pong, timeout=timeout)
+            if packet_type != ServerPacketTypes.PONG:
+                msg = self.unexpected_packet_message('Pong', packet_type)
+                raise errors.UnexpectedPacketFromServerError(msg)
+
+        except errors.SocketTimeoutError as e:
+            logger.warning('Error on %s ping: %s', self.get_description(), e)
+            return False
+
+        except errors.Error:
+            raise
+
+        except (OSError, EOFError) as e:
+            # It's just a warning now.
+            # Current connection will be closed, new will be established.
+            logger.warning('Error on %s ping: %s', self.get_description(), e)
+            return False
+
+        if self.compression_selector is not None:
+            self.compression_selector.add_rtt(time() - start)
+
+        return True
+
+    async def receive_packet(self):
+        return await self.read(super(AsyncConnection, self).receive_packet)
@@ -0,0 +1,96 @@
+from .. import errors
+from ..result import ProgressQueryResult, SpillingQueryResult
+
+
+class AsyncIterQueryResult(object):
+    """
+    Provides asynchronous iteration over returned rows. Blocks are received
+    from server by chunks (streaming by chunks).
+    """
+
+    def __init__(
+            self, packet_generator,
+            with_column_types=False, row_type='tuple'):
+        self.packet_generator = packet_generator
+        self.with_column_types = with_column_types
+        self.row_type = row_type
+
+        self.first_block = True
+        self.rows = iter(())
+        super(AsyncIterQueryResult, self).__init__()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while True:
+            try:
+                return next(self.rows)
+            except StopIteration:
+                pass
+
+            packet = await self.packet_generator.__anext__()
+            block = getattr(packet, 'block', None)
+            if block is None:
+                continue
+
+            if self.first_block and self.with_column_types:
+                self.first_block = False
+                rows = [block.columns_with_types]
+                rows.extend(block.get_rows(self.row_type))
+            else:
+                rows = block.get_rows(self.row_type)
+
+            self.rows = iter(rows)
+
+
+class AsyncProgressQueryResult(ProgressQueryResult):
+    """
+    Stores query result and progress information from multiple blocks.
+    Provides asynchronous iteration over query progress.
+    """
+
+    def __init__(self, packet_generator, **kwargs):
+        # Packets are received asynchronously. Stored result gets no
+        # generator: rest of packets is skipped here on exceeded limits.
+        self.packets = packet_generator
+
+        super(AsyncProgressQueryResult, self).__init__((), **kwargs)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while True:
+            packet = await self.packets.__anext__()
+            progress_packet = getattr(packet, 'progress', None)
+            if progress_packet:
+                return self.store_progress(progress_packet)
+
+            try:
+                self.store(packet)
+
+            except errors.ResultLimitExceededError:
+                # Cancel is sent. Skip the rest of packets until
+                # END_OF_STREAM.
+                async for _ in self.packets:
+                    pass
+                raise
+
+    async def get_result(self):
+        """
+        Coroutine that reads all progress packets and returns stored result.
+        """
+        async for _ in self:
+            pass
+
+        return super(ProgressQueryResult, self).get_result()
+
+
+class AsyncSpillingProgressQueryResult(AsyncProgressQueryResult,
+                                       SpillingQueryResult):
+    """
+    Writes columns of received blocks to temporary file and provides
+    asynchronous iteration over query progress. Result is returned as
+    :class:`~clickhouse_driver.result.SpilledResult`.
+    """
@@ -1,4 +1,10 @@
+from collections import namedtuple
+from functools import partial
+
+from . import defines
 from .reader import read_varint, read_binary_uint8, read_binary_int32
+from .util import compat
+from .util.helpers import LRUCache
 from .writer import write_varint, write_binary_uint8, write_binary_int32
 
 
@@ -29,32 +35,206 @@ class BlockInfo(object):
                 self.bucket_num = read_binary_int32(buf)
 
 
-class Block(object):
-    dict_row_types = (dict, )
-    tuple_row_types = (list, tuple)
-    supported_row_types = dict_row_types + tuple_row_types
+row_types = ('tuple', 'namedtuple', 'dict')
+
+# Row classes are created once per result schema.
+record_classes = LRUCache(defines.RECORD_CLASSES_CACHE_SIZE)
+
+
+def get_record_class(names):
+    """
+    :param names: column names.
+    :return: :func:`~collections.namedtuple` class with fields named after
+             columns. Names that aren't valid identifiers and duplicates
+             are replaced by position: ``_0``, ``_1``, etc.
+    """
+    names = tuple(names)
+    cls = record_classes.get(names)
+
+    if cls is None:
+        cls = namedtuple('Record', names, rename=True)
+        record_classes[names] = cls
+
+    return cls
+
+
+def get_row_factory(row_type, names=None):
+    """
+    :param row_type: one of :data:`row_types`.
+    :param names: column names. Required for named tuples and dicts.
+    :return: function that makes row of given type from sequence of values
+             or ``None`` for tuples: rows are used as is.
+    """
+    if row_type == 'tuple':
+        return None
+
+    elif row_type == 'namedtuple':
+        # Skips length check of ``_make``: rows have field per column.
+        return partial(tuple.__new__, get_record_class(names))
+
+    elif row_type == 'dict':
+        names = tuple(names)
+
+        def make_row(row):
+            return dict(compat.zip(names, row))
+
+        return make_row
+
+    else:
+        raise ValueError(
+            "Unknown row type '{}'. Expected one of: {}".format(
+                row_type, ', '.join(row_types)
+            )
+        )
+
+
+class RowsView(object):
+    """
+    Read-only sequence of rows backed by columns. Rows are built on demand:
+    iteration zips columns without transposing whole block.
+
+    View is internal to blocks and results: results returned to users are
+    materialized into lists. It's not hashable and has no list mutation
+    methods.
+
+    :param columns: list of columns of equal length.
+    :param row_type: one of :data:`row_types`: rows are tuples, named
+                     tuples or dicts with column names as keys.
+    :param names: column names. Required for named tuples and dicts.
+    """
+
+    def __init__(self, columns, row_type='tuple', names=None):
+        self.columns = columns
+        self.make_row = get_row_factory(row_type, names)
 
+        super(RowsView, self).__init__()
+
+    def __len__(self):
+        return len(self.columns[0]) if self.columns else 0
+
+    def __iter__(self):
+        rows = compat.zip(*self.columns)
+        if self.make_row:
+            rows = compat.map(self.make_row, rows)
+
+        return rows
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            rows = compat.zip(*[x[index] for x in self.columns])
+            if self.make_row:
+                rows = compat.map(self.make_row, rows)
+
+            return list(rows)
+
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError('Row index out of range')
+
+        row = tuple(x[index] for x in self.columns)
+        return self.make_row(row) if self.make_row else row
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    # Mutable sequence compared by value, like list.
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class BaseBlock(object):
     def __init__(self, columns_with_types=None, data=None, info=None,
                  types_check=False, received_from_server=False):
         self.columns_with_types = columns_with_types or []
-        self.data = data or []
         self.types_check = types_check
+        self.info = info or BlockInfo()
+        self.data = data or []
 
         if data and not received_from_server:
-            # Guessing about whole data format by first row.
-            first_row = data[0]
+            self.normalize(data)
 
-            if self.types_check:
-                self.check_row_type(first_row)
+        super(BaseBlock, self).__init__()
 
-            if isinstance(first_row, dict):
-                self.dicts_to_rows(data)
-            else:
-                self.check_rows(data)
+    def normalize(self, data):
+        pass
 
-        self.info = info or BlockInfo()
+    def get_columns(self):
+        raise NotImplementedError
+
+    def get_rows(self, row_type='tuple'):
+        raise NotImplementedError
 
-        super(Block, self).__init__()
+    def get_column_by_index(self, index):
+        raise NotImplementedError
+
+    @property
+    def columns(self):
+        raise NotImplementedError
+
+    @property
+    def rows(self):
+        raise NotImplementedError
+
+
+class ColumnOrientedBlock(BaseBlock):
+    def normalize(self, data):
+        expected_n_columns = len(self.columns_with_types)
+
+        got = len(data)
+        if expected_n_columns != got:
+            msg = 'Expected {} columns, got {}'.format(expected_n_columns, got)
+            raise ValueError(msg)
+
+        n_rows = len(data[0])
+        if any(len(column) != n_rows for column in data):
+            raise ValueError('Expected {} rows in all columns'.format(n_rows))
+
+    def get_columns(self):
+        return self.data
+
+    def get_rows(self, row_type='tuple'):
+        if not self.data:
+            return self.data
+
+        # Rows are made from columns on demand.
+        names = [x[0] for x in self.columns_with_types]
+        return RowsView(self.data, row_type=row_type, names=names)
+
+    def get_column_by_index(self, index):
+        return self.data[index]
+
+    @property
+    def columns(self):
+        return len(self.data)
+
+    @property
+    def rows(self):
+        return len(self.data[0]) if self.columns else 0
+
+
+class RowOrientedBlock(BaseBlock):
+    dict_row_types = (dict, )
+    tuple_row_types = (list, tuple)
+    supported_row_types = dict_row_types + tuple_row_types
+
+    def normalize(self, data):
+        # Guessing about whole data format by first row.
+        first_row = data[0]
+
+        if self.types_check:
+            self.check_row_type(first_row)
+
+        if isinstance(first_row, dict):
+            self.dicts_to_rows(data)
+        else:
+            self.check_rows(data)
 
     def dicts_to_rows(self, data):
         column_names = [x[0] for x in self.columns_with_types]
@@ -83,31 +263,21 @@ class Block(object):
                 check_row_type(row)
 
     def get_columns(self):
-        return self.data
+        return [self.get_column_by_index(i) for i in range(self.columns)]
 
-    def get_rows(self):
-        if not self.data:
+    def get_rows(self, row_type='tuple'):
+        names = [x[0] for x in self.columns_with_types]
+        make_row = get_row_factory(row_type, names)
+        if make_row is None:
             return self.data
 
-        # Transpose results: columns -> rows.
-        n_columns = self.columns
-        n_rows = self.rows
-
-        flat_data = [None] * n_columns * n_rows
-
-        for j in range(n_columns):
-            column = self.data[j]
+        return [make_row(row) for row in self.data]
 
-            for i in range(n_rows):
-                flat_data[i * n_columns + j] = column[i]
-
-        # Make rows from slices.
-        rv = [None] * n_rows
-        for i in range(n_rows):
-            offset = i * n_columns
-            rv[i] = tuple(flat_data[offset:offset + n_columns])
-
-        return rv
+    def get_column_by_index(self, index):
+        try:
+            return [row[index] for row in self.data]
+        except IndexError:
+            raise ValueError('Different rows length')
 
     def check_row_type(self, row):
         if not isinstance(row, self.supported_row_types):
@@ -132,8 +302,8 @@ class Block(object):
 
     @property
     def columns(self):
-        return len(self.data)
+        return len(self.data[0]) if self.rows else 0
 
     @property
     def rows(self):
-        return len(self.data[0]) if self.columns else 0
+        return len(self.data)
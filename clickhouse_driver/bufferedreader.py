@@ -3,7 +3,7 @@ from codecs import utf_8_decode
 from .util import compat
 
 
-class BufferedReader(object):
+class PyBufferedReader(object):
     def __init__(self, bufsize):
         self.buffer = bytearray(bufsize)
         self.buffer_view = memoryview(self.buffer)
@@ -11,7 +11,7 @@ class BufferedReader(object):
         self.position = 0
         self.current_buffer_size = 0
 
-        super(BufferedReader, self).__init__()
+        super(PyBufferedReader, self).__init__()
 
     def read_into_buffer(self):
         raise NotImplementedError
@@ -43,6 +43,25 @@ class BufferedReader(object):
 
         return rv
 
+    def read_into(self, buffer, offset, size):
+        """
+        Reads ``size`` bytes into ``buffer`` bytearray starting from
+        ``offset`` without intermediate objects.
+        """
+        view = memoryview(buffer)
+
+        while size > 0:
+            if self.position == self.current_buffer_size:
+                self.read_into_buffer()
+                self.position = 0
+
+            read_bytes = min(size, self.current_buffer_size - self.position)
+            view[offset:offset + read_bytes] = \
+                self.buffer_view[self.position:self.position + read_bytes]
+            self.position += read_bytes
+            offset += read_bytes
+            size -= read_bytes
+
     def read_one(self):
         if self.position == self.current_buffer_size:
             self.read_into_buffer()
@@ -134,6 +153,12 @@ class BufferedReader(object):
         return items
 
 
+try:
+    from .speedups.bufferedreader import BufferedReader
+except ImportError:
+    BufferedReader = PyBufferedReader
+
+
 class BufferedSocketReader(BufferedReader):
     def __init__(self, sock, bufsize):
         self.sock = sock
@@ -152,7 +177,8 @@ class CompressedBufferedReader(BufferedReader):
         super(CompressedBufferedReader, self).__init__(bufsize)
 
     def read_into_buffer(self):
-        self.buffer = bytearray(self.read_block())
+        # Decompressed data is taken as is without copying.
+        self.buffer = self.read_block()
         self.buffer_view = memoryview(self.buffer)
         self.current_buffer_size = len(self.buffer)
 
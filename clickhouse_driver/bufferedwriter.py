@@ -0,0 +1,143 @@
+import socket
+import ssl
+from codecs import utf_8_encode
+from time import time
+
+from .util import compat
+from .writer import py_write_varint
+
+
+class PyBufferedWriter(object):
+    """
+    Collects small writes in preallocated buffer. Write that doesn't fit
+    into buffer and is larger than half of it is passed to stream together
+    with buffered data without concatenation.
+    """
+
+    def __init__(self, bufsize):
+        self.buffer = bytearray(bufsize)
+        self.buffer_view = memoryview(self.buffer)
+
+        self.position = 0
+        self.bufsize = bufsize
+
+        super(PyBufferedWriter, self).__init__()
+
+    def write_into_stream(self, chunks):
+        """
+        :param chunks: list of bytes-like objects to send in order.
+        """
+        raise NotImplementedError
+
+    def write(self, data):
+        position = self.position
+        size = len(data)
+
+        if position + size <= self.bufsize:
+            self.buffer_view[position:position + size] = data
+            self.position = position + size
+
+        elif size > self.bufsize // 2:
+            self.write_into_stream([self.buffer_view[:position], data])
+            self.position = 0
+
+        else:
+            # Buffer is filled up to be sent by full pieces.
+            free = self.bufsize - position
+            self.buffer_view[position:] = data[:free]
+            self.position = self.bufsize
+            self.flush()
+
+            self.buffer_view[:size - free] = data[free:]
+            self.position = size - free
+
+    def write_strings(self, items, encode=False):
+        """
+        Writes strings with sizes. Unicode strings are encoded into UTF-8
+        if ``encode`` is set.
+        """
+        for value in items:
+            if encode and not isinstance(value, bytes):
+                value = utf_8_encode(value)[0]
+
+            py_write_varint(len(value), self)
+            self.write(value)
+
+    def flush(self):
+        if self.position:
+            self.write_into_stream([self.buffer_view[:self.position]])
+            self.position = 0
+
+    def close(self):
+        # Data of broken packet is never sent.
+        self.position = 0
+
+
+try:
+    from .speedups.bufferedwriter import BufferedWriter
+except ImportError:
+    BufferedWriter = PyBufferedWriter
+
+
+class BufferedSocketWriter(BufferedWriter):
+    """
+    Counts sent bytes and time spent in socket writes. Writes block when
+    socket buffer is full, so their time estimates network bandwidth.
+    """
+
+    def __init__(self, sock, bufsize):
+        self.sock = sock
+
+        # TLS sockets can't send many buffers at once.
+        self.use_sendmsg = hasattr(socket.socket, 'sendmsg') and \
+            not isinstance(sock, ssl.SSLSocket)
+
+        self.bytes_sent = 0
+        self.send_time = 0.0
+
+        super(BufferedSocketWriter, self).__init__(bufsize)
+
+    def write_into_stream(self, chunks):
+        start = time()
+        self.send(chunks)
+        self.send_time += time() - start
+
+    def send(self, chunks):
+        if not self.use_sendmsg:
+            for chunk in chunks:
+                self.sock.sendall(chunk)
+                self.bytes_sent += len(chunk)
+            return
+
+        chunks = [memoryview(x) for x in chunks if len(x)]
+
+        while chunks:
+            sent = self.sock.sendmsg(chunks)
+            self.bytes_sent += sent
+
+            # Drop sent chunks and the beginning of partially sent one.
+            while chunks and sent >= len(chunks[0]):
+                sent -= len(chunks[0])
+                chunks.pop(0)
+
+            if sent:
+                chunks[0] = chunks[0][sent:]
+
+
+class CompressedBufferedWriter(BufferedWriter):
+    """
+    Passes written data to ``write_frame`` by pieces of at most ``bufsize``
+    bytes. Each piece is compressed into independent frame.
+    """
+
+    def __init__(self, write_frame, bufsize):
+        self.write_frame = write_frame
+        super(CompressedBufferedWriter, self).__init__(bufsize)
+
+    def write_into_stream(self, chunks):
+        bufsize = self.bufsize
+
+        for chunk in chunks:
+            view = memoryview(chunk)
+            for i in compat.range(0, len(view), bufsize):
+                self.write_frame(view[i:i + bufsize])
@@ -1,14 +1,17 @@
 import types
 
 from . import errors, defines
-from .block import Block
+from .block import ColumnOrientedBlock, RowOrientedBlock
 from .connection import Connection
 from .protocol import ServerPacketTypes
 from .result import (
-    IterQueryResult, ProgressQueryResult, QueryResult, QueryInfo
+    IterQueryResult, ProgressQueryResult, QueryResult, QueryInfo,
+    SpillingProgressQueryResult, SpillingQueryResult
 )
 from .util.escape import escape_params
-from .util.helpers import chunks
+from .util.helpers import (
+    chunks, estimate_item_size, pipeline, sized_chunks
+)
 
 
 class Client(object):
@@ -26,15 +29,81 @@ class Client(object):
         * insert_block_size -- chunk size to split rows for ``INSERT``.
           Defaults to ``1048576``.
 
+        * insert_block_bytes -- approximate chunk size in bytes to split
+          rows for ``INSERT``. Limits memory used by wide rows. Row sizes
+          are estimated by sample of rows.
+          Defaults to ``None`` (chunks are limited by rows count only).
+
+        * insert_pipelining -- serialize and send ``INSERT`` blocks in
+          background thread while the next chunk is pulled from data.
+          Useful with generators that wait for I/O.
+          Defaults to ``False``.
+
         * strings_as_bytes -- turns off string column encoding/decoding.
 
+        * flat_arrays -- read Array columns as
+          :class:`~clickhouse_driver.columns.arraycolumn.FlatArrays`:
+          values of all arrays and end offsets of each array, without
+          slicing values into arrays. Intended to be used with columnar
+          results. Defaults to ``False``.
+
+        * row_type -- type of result rows: ``'tuple'``, ``'namedtuple'``
+          (fields are named after columns, see
+          :func:`~collections.namedtuple` ``rename`` parameter for columns
+          names that aren't valid identifiers) or ``'dict'``.
+          Defaults to ``'tuple'``.
+
+        * max_stored_rows -- maximum number of rows of result stored in
+          memory by :meth:`execute` and :meth:`execute_with_progress`.
+          Query is cancelled and
+          :class:`~clickhouse_driver.errors.ResultLimitExceededError` is
+          raised when it's exceeded. Unlike server's ``max_result_rows``
+          it protects client from queries that bypass server limits.
+          Defaults to ``None`` (no limit).
+
+        * max_stored_bytes -- the same as ``max_stored_rows`` for estimated
+          size of stored result in bytes.
+          Defaults to ``None`` (no limit).
+
+        * spill_to_disk -- :meth:`execute` and
+          :meth:`execute_with_progress` write received blocks to
+          temporary file and return
+          :class:`~clickhouse_driver.result.SpilledResult` instead of list.
+          Result larger than memory can be iterated many times after
+          connection is released. Columnar result is iterated by blocks of
+          columns. With ``use_numpy`` setting blocks are stored as NumPy
+          arrays, but they are not concatenated into columns of the whole
+          result. Defaults to ``False``.
+
+        * compression_level -- level of compression of data sent by the
+          query, e.g. fast level for small interactive ``INSERT`` and high
+          one for bulk load over slow network. Server compresses results by
+          its own ``network_zstd_compression_level`` setting.
+          Defaults to ``None`` (connection's ``compression_level``).
+
+        * use_numpy -- reads [U]Int*, Float*, Date and DateTime columns
+          directly into :class:`numpy.ndarray`. Intended to be used with
+          columnar results. Requires ``numpy`` package.
+          Defaults to ``False``.
+
     """
 
     available_client_settings = (
         'insert_block_size',  # TODO: rename to max_insert_block_size
-        'strings_as_bytes'
+        'insert_block_bytes',
+        'insert_pipelining',
+        'strings_as_bytes',
+        'flat_arrays',
+        'row_type',
+        'max_stored_rows',
+        'max_stored_bytes',
+        'spill_to_disk',
+        'compression_level',
+        'use_numpy'
     )
 
+    connection_cls = Connection
+
     def __init__(self, *args, **kwargs):
         self.settings = kwargs.pop('settings', {}).copy()
 
@@ -42,12 +111,39 @@ class Client(object):
             'insert_block_size': self.settings.pop(
                 'insert_block_size', defines.DEFAULT_INSERT_BLOCK_SIZE,
             ),
+            'insert_block_bytes': self.settings.pop(
+                'insert_block_bytes', None
+            ),
+            'insert_pipelining': self.settings.pop(
+                'insert_pipelining', False
+            ),
             'strings_as_bytes': self.settings.pop(
                 'strings_as_bytes', False
+            ),
+            'flat_arrays': self.settings.pop(
+                'flat_arrays', False
+            ),
+            'row_type': self.settings.pop(
+                'row_type', 'tuple'
+            ),
+            'max_stored_rows': self.settings.pop(
+                'max_stored_rows', None
+            ),
+            'max_stored_bytes': self.settings.pop(
+                'max_stored_bytes', None
+            ),
+            'spill_to_disk': self.settings.pop(
+                'spill_to_disk', False
+            ),
+            'compression_level': self.settings.pop(
+                'compression_level', None
+            ),
+            'use_numpy': self.settings.pop(
+                'use_numpy', False
             )
         }
 
-        self.connection = Connection(*args, **kwargs)
+        self.connection = self.connection_cls(*args, **kwargs)
         self.connection.context.settings = self.settings
         self.connection.context.client_settings = self.client_settings
         self.reset_last_query()
@@ -67,22 +163,48 @@ class Client(object):
                        columnar=False):
 
         gen = self.packet_generator()
+        client_settings = self.connection.context.client_settings
+        kwargs = {
+            'row_type': client_settings['row_type'],
+            'max_rows': client_settings['max_stored_rows'],
+            'max_bytes': client_settings['max_stored_bytes'],
+            'cancel': self.connection.send_cancel
+        }
 
         if progress:
-            return ProgressQueryResult(
-                gen, with_column_types=with_column_types, columnar=columnar
+            if client_settings['spill_to_disk']:
+                result_cls = SpillingProgressQueryResult
+            else:
+                result_cls = ProgressQueryResult
+
+            return result_cls(
+                gen, with_column_types=with_column_types, columnar=columnar,
+                **kwargs
             )
 
         else:
-            result = QueryResult(
-                gen, with_column_types=with_column_types, columnar=columnar
+            if client_settings['spill_to_disk']:
+                result_cls = SpillingQueryResult
+            elif client_settings['use_numpy']:
+                from .numpy.result import NumpyQueryResult
+
+                result_cls = NumpyQueryResult
+            else:
+                result_cls = QueryResult
+
+            result = result_cls(
+                gen, with_column_types=with_column_types, columnar=columnar,
+                **kwargs
             )
             return result.get_result()
 
     def iter_receive_result(self, with_column_types=False):
         gen = self.packet_generator()
+        row_type = self.connection.context.client_settings['row_type']
 
-        for rows in IterQueryResult(gen, with_column_types=with_column_types):
+        result = IterQueryResult(gen, with_column_types=with_column_types,
+                                 row_type=row_type)
+        for rows in result:
             for row in rows:
                 yield row
 
@@ -104,7 +226,9 @@ class Client(object):
 
     def receive_packet(self):
         packet = self.connection.receive_packet()
+        return self.process_packet(packet)
 
+    def process_packet(self, packet):
         if packet.type == ServerPacketTypes.EXCEPTION:
             raise packet.exception
 
@@ -174,7 +298,10 @@ class Client(object):
         :param types_check: enables type checking of data for INSERT queries.
                             Causes additional overhead. Defaults to ``False``.
         :param columnar: if specified the result will be returned in
-                         column-oriented form.
+                         column-oriented form. For INSERT queries data is
+                         expected as a `list` or `tuple` of columns: any
+                         sequence, :class:`numpy.ndarray` or object that
+                         supports buffer protocol.
                          Defaults to ``False`` (row-like form).
 
         :return: * ``None`` for INSERT queries.
@@ -199,7 +326,8 @@ class Client(object):
             if is_insert:
                 return self.process_insert_query(
                     query, params, external_tables=external_tables,
-                    query_id=query_id, types_check=types_check
+                    query_id=query_id, types_check=types_check,
+                    columnar=columnar
                 )
             else:
                 return self.process_ordinary_query(
@@ -209,6 +337,10 @@ class Client(object):
                     columnar=columnar
                 )
 
+        # Rest of result is already skipped, connection can be reused.
+        except errors.ResultLimitExceededError:
+            raise
+
         except Exception:
             self.disconnect()
             raise
@@ -298,6 +430,79 @@ class Client(object):
             self.disconnect()
             raise
 
+    def query_dataframe(self, query, params=None, external_tables=None,
+                        query_id=None, settings=None):
+        """
+        *New in version 0.0.19.*
+
+        Executes SELECT query and returns result as
+        :class:`pandas.DataFrame`. Columns are read with NumPy columns
+        regardless of ``use_numpy`` setting. See :ref:`numpy-support`.
+
+        :param query: query that will be send to server.
+        :param params: substitution parameters.
+                       Defaults to ``None`` (no parameters).
+        :param external_tables: external tables to send.
+                                Defaults to ``None`` (no external tables).
+        :param query_id: the query identifier. If no query id specified
+                         ClickHouse server will generate it.
+        :param settings: dictionary of query settings.
+                         Defaults to ``None`` (no additional settings).
+        :return: :class:`pandas.DataFrame` with column names from query.
+        """
+        from .numpy.helpers import columns_to_dataframe
+
+        settings = dict(settings or {}, use_numpy=True)
+        data, columns = self.execute(
+            query, params=params, with_column_types=True,
+            external_tables=external_tables, query_id=query_id,
+            settings=settings, columnar=True
+        )
+        return columns_to_dataframe(data, [name for name, _ in columns])
+
+    def insert_dataframe(self, query, dataframe, external_tables=None,
+                         query_id=None, settings=None, types_check=False):
+        """
+        *New in version 0.0.19.*
+
+        Inserts :class:`pandas.DataFrame` columns. Columns are picked by
+        names of INSERT query columns, other DataFrame columns are ignored.
+        See :ref:`numpy-support`.
+
+        :param query: INSERT query without data, e.g.
+                      ``INSERT INTO test (x, y) VALUES``.
+        :param dataframe: :class:`pandas.DataFrame` with data.
+        :param external_tables: external tables to send.
+                                Defaults to ``None`` (no external tables).
+        :param query_id: the query identifier. If no query id specified
+                         ClickHouse server will generate it.
+        :param settings: dictionary of query settings.
+                         Defaults to ``None`` (no additional settings).
+        :param types_check: enables type checking of data.
+                            Causes additional overhead. Defaults to ``False``.
+        :return: ``None``.
+        """
+        from .numpy.helpers import dataframe_to_columns
+
+        def get_columns(sample_block):
+            names = [name for name, _ in sample_block.columns_with_types]
+            return dataframe_to_columns(dataframe, names)
+
+        settings = dict(settings or {}, use_numpy=True)
+        self.make_query_settings(settings)
+        self.connection.force_connect()
+        self.last_query = QueryInfo()
+
+        try:
+            return self.process_insert_query(
+                query, get_columns, external_tables=external_tables,
+                query_id=query_id, types_check=types_check, columnar=True
+            )
+
+        except Exception:
+            self.disconnect()
+            raise
+
     def process_ordinary_query_with_progress(
             self, query, params=None, with_column_types=False,
             external_tables=None, query_id=None,
@@ -341,14 +546,20 @@ class Client(object):
 
     def process_insert_query(self, query_without_data, data,
                              external_tables=None, query_id=None,
-                             types_check=False):
+                             types_check=False, columnar=False):
         self.connection.send_query(query_without_data, query_id=query_id)
         self.connection.send_external_tables(external_tables,
                                              types_check=types_check)
 
         sample_block = self.receive_sample_block()
         if sample_block:
-            self.send_data(sample_block, data, types_check=types_check)
+            if callable(data):
+                # Data is made for columns of sample block, e.g. DataFrame
+                # columns are picked by names.
+                data = data(sample_block)
+
+            self.send_data(sample_block, data,
+                           types_check=types_check, columnar=columnar)
             packet = self.connection.receive_packet()
             if packet.exception:
                 raise packet.exception
@@ -367,15 +578,80 @@ class Client(object):
                                                                 packet.type)
             raise errors.UnexpectedPacketFromServerError(message)
 
-    def send_data(self, sample_block, data, types_check=False):
+    def send_data(self, sample_block, data, types_check=False,
+                  columnar=False):
         client_settings = self.connection.context.client_settings
-        for chunk in chunks(data, client_settings['insert_block_size']):
-            block = Block(sample_block.columns_with_types, chunk,
-                          types_check=types_check)
+
+        def send_chunk(chunk):
+            block = self.make_block(sample_block, chunk,
+                                    types_check=types_check,
+                                    columnar=columnar)
             self.connection.send_data(block)
 
+        data_chunks = self.data_chunks(sample_block, data, columnar=columnar)
+
+        if client_settings['insert_pipelining']:
+            # Blocks are serialized and sent in background thread while
+            # the next chunk is pulled from data.
+            pipeline(data_chunks, send_chunk)
+        else:
+            for chunk in data_chunks:
+                send_chunk(chunk)
+
         # Empty block means end of data.
-        self.connection.send_data(Block())
+        self.connection.send_data(ColumnOrientedBlock())
+
+    def make_block(self, sample_block, chunk, types_check=False,
+                   columnar=False):
+        block_cls = ColumnOrientedBlock if columnar else RowOrientedBlock
+        return block_cls(sample_block.columns_with_types, chunk,
+                         types_check=types_check)
+
+    def data_blocks(self, sample_block, data, types_check=False,
+                    columnar=False):
+        for chunk in self.data_chunks(sample_block, data, columnar=columnar):
+            yield self.make_block(sample_block, chunk,
+                                  types_check=types_check, columnar=columnar)
+
+    def data_chunks(self, sample_block, data, columnar=False):
+        client_settings = self.connection.context.client_settings
+        block_size = client_settings['insert_block_size']
+        block_bytes = client_settings['insert_block_bytes']
+
+        if columnar:
+            return self.column_chunks(sample_block, data, block_size,
+                                      block_bytes=block_bytes)
+        elif block_bytes:
+            return sized_chunks(data, block_size, block_bytes)
+        else:
+            return chunks(data, block_size)
+
+    def column_chunks(self, sample_block, columns, block_size,
+                      block_bytes=None):
+        columns_with_types = sample_block.columns_with_types
+
+        if len(columns) != len(columns_with_types):
+            raise ValueError(
+                'Expected {} columns, got {}'.format(
+                    len(columns_with_types), len(columns)
+                )
+            )
+
+        n_rows = len(columns[0]) if columns else 0
+        if any(len(column) != n_rows for column in columns):
+            raise ValueError(
+                'Expected {} rows in all columns'.format(n_rows)
+            )
+
+        if block_bytes:
+            row_size = sum(estimate_item_size(x) for x in columns)
+            block_size = min(block_size, block_bytes // max(row_size, 1))
+            block_size = max(block_size, 1)
+
+        # Slicing keeps arrays and buffers as is without copying rows into
+        # Python tuples.
+        for start in range(0, n_rows, block_size):
+            yield [column[start:start + block_size] for column in columns]
 
     def cancel(self, with_column_types=False):
         # TODO: Add warning if already cancelled.
@@ -1,14 +1,104 @@
+from itertools import chain
 
-from struct import Struct
-
-from ..util import compat
 from .base import Column
 from .intcolumn import UInt64Column
 
-if compat.PY3:
-    from queue import Queue
-else:
-    from Queue import Queue
+
+class FlatArrays(object):
+    """
+    Column of arrays given as values of all arrays and end offsets of each
+    array: ``FlatArrays([1, 2, 3], [2, 2, 3])`` stands for
+    ``[[1, 2], [], [3]]``. Can be passed to columnar INSERT: values and
+    offsets are written as is without iterating over arrays.
+
+    :param values: sequence of values of all arrays: :class:`list`,
+                   :class:`numpy.ndarray`, etc.
+    :param offsets: sequence of end offsets of arrays in ``values``.
+
+    Array columns are read in this form with ``flat_arrays`` setting.
+    """
+
+    def __init__(self, values, offsets):
+        self.values = values
+        self.offsets = offsets
+
+        super(FlatArrays, self).__init__()
+
+    @classmethod
+    def concat(cls, chunks):
+        """
+        Joins columns of a few blocks into one.
+
+        :param chunks: list of :class:`FlatArrays`.
+        """
+        values = [x.values for x in chunks]
+        first_values = values[0]
+
+        if isinstance(first_values, FlatArrays):
+            values = cls.concat(values)
+        elif hasattr(first_values, 'dtype'):
+            import numpy as np
+
+            if isinstance(first_values, np.ma.MaskedArray):
+                values = np.ma.concatenate(values)
+            else:
+                values = np.concatenate(values)
+        else:
+            values = tuple(chain.from_iterable(values))
+
+        offsets = []
+        start = 0
+        for chunk in chunks:
+            # Offsets of each chunk are shifted by values of previous ones.
+            chunk_offsets = chunk.offsets
+            if hasattr(chunk_offsets, 'dtype'):
+                offsets.append(chunk_offsets + start)
+            else:
+                offsets.append(tuple(x + start for x in chunk_offsets))
+
+            if len(chunk_offsets):
+                start += int(chunk_offsets[-1])
+
+        if hasattr(chunks[0].offsets, 'dtype'):
+            import numpy as np
+
+            offsets = np.concatenate(offsets)
+        else:
+            offsets = tuple(chain.from_iterable(offsets))
+
+        return cls(values, offsets)
+
+    def __add__(self, other):
+        return self.concat([self, other])
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __getitem__(self, index):
+        offsets = self.offsets
+
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(offsets))
+            if step != 1:
+                raise ValueError('Slice step is not supported')
+
+            first = offsets[start - 1] if start else 0
+            offsets = offsets[start:stop]
+            last = offsets[-1] if len(offsets) else first
+
+            # Offsets of the slice start from its first value.
+            if isinstance(offsets, (list, tuple)):
+                offsets = [x - first for x in offsets]
+            else:
+                offsets = offsets - first
+
+            return FlatArrays(self.values[first:last], offsets)
+
+        if index < 0:
+            index += len(offsets)
+
+        first = offsets[index - 1] if index else 0
+        return self.values[first:offsets[index]]
 
 
 class ArrayColumn(Column):
@@ -22,167 +112,93 @@ class ArrayColumn(Column):
                    |    |           |    |
     (leaf)        3     4          5     6
 
-    Offsets (sizes) written in breadth-first search order. In example above
-    following sequence of offset will be written: 4 -> 2 -> 4
-    1) size of whole array: 4
+    Offsets (sizes) written level by level. In example above following
+    sequence of offset will be written: 2 -> 2 -> 4
+    1) size of array at depth=0: 2
     2) size of array 1 in depth=1: 2
     3) size of array 2 plus size of all array before in depth=1: 2 + 2 = 4
 
     After sizes info comes flatten data: 3 -> 4 -> 5 -> 6
+
+    Each level is processed at once: offsets of all arrays of the level are
+    packed by single call and items of all arrays are passed to nested
+    column, which is array column of the next level or leaf column.
     """
     py_types = (list, tuple)
-    size_struct = Struct('<Q')
 
-    def __init__(self, nested_column, **kwargs):
+    def __init__(self, nested_column, flat=False, **kwargs):
         self.size_column = UInt64Column()
         self.nested_column = nested_column
-        self._write_depth_0_size = True
+        # Read arrays as :class:`FlatArrays`.
+        self.flat = flat
         super(ArrayColumn, self).__init__(**kwargs)
 
-    def size_pack(self, value):
-        return self.size_struct.pack(value)
-
-    def size_unpack(self, buf):
-        return self.size_struct.unpack(buf.read(self.size_struct.size))[0]
+    def read_state_prefix(self, buf):
+        self.nested_column.read_state_prefix(buf)
 
-    def write_data(self, data, buf):
-        # Column of Array(T) is stored in "compact" format and passed to server
-        # wrapped into another Array without size of wrapper array.
-        self.nested_column = ArrayColumn(self.nested_column)
-        self.nested_column.nullable = self.nullable
-        self.nullable = False
-        self._write_depth_0_size = False
-        self._write(data, buf)
+    def write_state_prefix(self, buf):
+        self.nested_column.write_state_prefix(buf)
 
-    def read_data(self, rows, buf):
-        self.nested_column = ArrayColumn(self.nested_column)
-        self.nested_column.nullable = self.nullable
-        self.nullable = False
-        return self._read(rows, buf)
-
-    def _write_sizes(self, value, buf):
-        q = Queue()
-        q.put((self, value, 0))
-
-        cur_depth = 0
+    def flatten(self, items):
+        """
+        :return: end offsets of arrays and items of all arrays.
+        """
+        offsets = [0] * len(items)
+        nested_items = []
         offset = 0
-        nulls_map = []
-
-        while not q.empty():
-            column, value, depth = q.get_nowait()
 
-            if cur_depth != depth:
-                cur_depth = depth
-                offset = 0
-                if column.nullable:
-                    self._write_nulls_map(nulls_map, buf)
+        for i, x in enumerate(items):
+            # NULL is written as empty array.
+            if x is None:
+                x = ()
 
-                nulls_map = []
+            offset += len(x)
+            offsets[i] = offset
+            nested_items.extend(x)
 
-            if column.nullable:
-                value = value or []
+        return offsets, nested_items
 
-            offset += len(value)
-            if (cur_depth == 0 and self._write_depth_0_size) or cur_depth > 0:
-                buf.write(self.size_pack(offset))
-
-            nested_column = column.nested_column
-            if isinstance(nested_column, ArrayColumn):
-                for x in value:
-                    q.put((nested_column, x, cur_depth + 1))
-                    nulls_map.append(None if x is None else False)
-
-    def _write_data(self, value, buf):
-        if self.nullable:
-            value = value or []
-
-        if isinstance(self.nested_column, ArrayColumn):
-            for x in value:
-                self.nested_column._write_data(x, buf)
-        else:
-            self.nested_column._write_data(value, buf)
-
-    def _write_nulls_data(self, value, buf):
-        if self.nullable:
-            value = value or []
-
-        if isinstance(self.nested_column, ArrayColumn):
-            for x in value:
-                self.nested_column._write_nulls_data(x, buf)
+    def _write_data(self, items, buf):
+        if isinstance(items, FlatArrays):
+            offsets, nested_items = items.offsets, items.values
         else:
-            if self.nested_column.nullable:
-                self.nested_column._write_nulls_map(value, buf)
+            offsets, nested_items = self.flatten(items)
 
-    def _write(self, value, buf):
-        self._write_sizes(value, buf)
-        self._write_nulls_data(value, buf)
-        self._write_data(value, buf)
+        self.size_column.write_data(offsets, buf)
+        self.nested_column.write_data(nested_items, buf)
 
-    def _read(self, size, buf):
-        q = Queue()
-        q.put((self, size, 0))
+    def _read_data(self, n_items, buf, nulls_map=None):
+        # Sizes of all arrays of the level are read at once. Nested column
+        # reads items of all arrays the same way: offsets of the next level
+        # or leaf data.
+        offsets = self.size_column.read_items(n_items, buf)
+        n_nested = offsets[-1] if n_items else 0
+        nested_items = self.nested_column.read_data(n_nested, buf)
 
-        data = []
-        slices_series = []
+        if self.flat:
+            return FlatArrays(nested_items, offsets)
 
-        cur_depth = 0
+        nested_items = tuple(nested_items)
+        items = [None] * n_items
         prev_offset = 0
-        slices = []
+        for i, offset in enumerate(offsets):
+            items[i] = nested_items[prev_offset:offset]
+            prev_offset = offset
 
-        if self.nested_column.nullable:
-            nulls_map = self._read_nulls_map(size, buf)
-        else:
-            nulls_map = [0] * size
-
-        # Read and store info about slices.
-        while not q.empty():
-            column, size, depth = q.get_nowait()
-
-            nested_column = column.nested_column
+        if nulls_map is not None:
+            items = [None if is_null else x
+                     for x, is_null in zip(items, nulls_map)]
 
-            if cur_depth != depth:
-                cur_depth = depth
+        return tuple(items)
 
-                slices_series.append((slices, nulls_map))
 
-                if nested_column.nullable:
-                    nulls_map = self._read_nulls_map(prev_offset, buf)
-                else:
-                    nulls_map = [0] * prev_offset
+def is_flat_arrays(column_options):
+    context = column_options.get('context')
+    return context.client_settings['flat_arrays'] if context else False
 
-                prev_offset = 0
-                slices = []
 
-            if isinstance(nested_column, ArrayColumn):
-                for _i in range(size):
-                    offset = self.size_unpack(buf)
-                    q.put((nested_column, offset - prev_offset, cur_depth + 1))
-                    slices.append((prev_offset, offset))
-                    prev_offset = offset
-
-            # Read data
-            else:
-                data.extend(
-                    nested_column._read_data(
-                        size, buf,
-                        nulls_map=nulls_map[prev_offset:prev_offset + size]
-                    )
-                )
-                prev_offset += size
-
-        # Build nested tuple structure.
-        for slices, nulls_map in reversed(slices_series):
-            nested_data = []
-            for (slice_from, slice_to), is_null in zip(slices, nulls_map):
-                nested_data.append(
-                    None if is_null else tuple(data[slice_from:slice_to])
-                )
-
-            data = nested_data
-
-        return tuple(data)
-
-
-def create_array_column(spec, column_by_spec_getter):
-    inner = spec[6:-1]
-    return ArrayColumn(column_by_spec_getter(inner))
+def create_array_column(spec, column_by_spec_getter, column_options):
+    return ArrayColumn(
+        column_by_spec_getter(spec.args[0]),
+        flat=is_flat_arrays(column_options)
+    )
@@ -1,4 +1,5 @@
-from struct import Struct, error as struct_error
+import sys
+from struct import Struct, calcsize, error as struct_error
 
 from . import exceptions
 
@@ -37,6 +38,16 @@ class Column(object):
         else:
             return value, False
 
+    def read_state_prefix(self, buf):
+        """
+        Reads column's state sent once before data of the block.
+        """
+
+    def write_state_prefix(self, buf):
+        """
+        Writes column's state once before data of the block.
+        """
+
     def check_item_type(self, value):
         if not isinstance(value, self.py_types):
             raise exceptions.ColumnTypeMismatchException(value)
@@ -120,6 +131,16 @@ class Column(object):
         raise NotImplementedError
 
 
+# Struct format characters grouped by kind. Buffers are compared by kind
+# and size, so 'l' and 'q' are the same on platforms with 8-byte long.
+format_kinds = {}
+for kind, chars in [('i', 'bhilq'), ('u', 'BHILQ'), ('f', 'fd')]:
+    for char in chars:
+        format_kinds[char] = kind
+
+native_byte_orders = ('', '@', '=') if sys.byteorder == 'little' else ()
+
+
 class FormatColumn(Column):
     """
     Uses struct.pack for bulk items writing.
@@ -130,6 +151,46 @@ class FormatColumn(Column):
     def make_struct(self, n_items):
         return Struct('<{}{}'.format(n_items, self.format))
 
+    def _write_data(self, items, buf):
+        data = self.get_buffer_data(items)
+
+        if data is not None:
+            buf.write(data)
+        else:
+            super(FormatColumn, self)._write_data(items, buf)
+
+    def get_buffer_data(self, items):
+        """
+        Returns raw bytes of items if they already are in column's binary
+        layout: :class:`array.array`, :class:`numpy.ndarray` and other
+        objects supporting buffer protocol.
+        """
+        if isinstance(items, (list, tuple)):
+            return None
+
+        # Items need per-item processing.
+        if self.before_write_item or self.check_item or \
+                self.types_check_enabled or self.nullable:
+            return None
+
+        try:
+            view = memoryview(items)
+        except TypeError:
+            return None
+
+        item_format = view.format
+        byte_order = item_format[:-1]
+        if byte_order not in native_byte_orders and byte_order != '<':
+            return None
+
+        kind = format_kinds.get(item_format[-1:])
+        if view.ndim != 1 or kind is None or \
+                kind != format_kinds.get(self.format) or \
+                view.itemsize != calcsize('<' + self.format):
+            return None
+
+        return view.tobytes()
+
     def write_items(self, items, buf):
         s = self.make_struct(len(items))
         try:
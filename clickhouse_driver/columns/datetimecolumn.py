@@ -4,6 +4,7 @@ from time import mktime
 
 from pytz import timezone as get_timezone, utc
 
+from ..util import compat
 from .base import FormatColumn
 
 
@@ -43,14 +44,40 @@ class DateTimeColumn(FormatColumn):
             return int(mktime(value.timetuple()))
 
 
-def create_datetime_column(spec, column_options):
-    context = column_options['context']
+class DateTime64Column(DateTimeColumn):
+    """
+    Stores ticks of ``10 ** -scale`` seconds. Values are read with
+    microseconds precision.
+    """
+    ch_type = 'DateTime64'
+    format = 'q'
+
+    def __init__(self, scale=3, **kwargs):
+        self.scale = scale
+        self.multiplier = 10 ** scale
+        super(DateTime64Column, self).__init__(**kwargs)
+
+    def after_read_item(self, value):
+        seconds, ticks = divmod(value, self.multiplier)
+        dt = super(DateTime64Column, self).after_read_item(seconds)
+        return dt.replace(microsecond=ticks * 1000000 // self.multiplier)
+
+    def before_write_item(self, value):
+        if isinstance(value, compat.integer_types):
+            # Raw ticks.
+            return value
 
+        seconds = super(DateTime64Column, self).before_write_item(value)
+        ticks = value.microsecond * self.multiplier // 1000000
+        return seconds * self.multiplier + ticks
+
+
+def get_column_timezone(spec, context):
     tz_name = timezone = None
 
     # Use column's timezone if it's specified.
-    if spec[-1] == ')':
-        tz_name = spec[10:-2]
+    if spec.args and isinstance(spec.args[-1], compat.string_types):
+        tz_name = spec.args[-1]
     else:
         if not context.settings.get('use_client_time_zone', False):
             tz_name = context.server_info.timezone
@@ -58,4 +85,14 @@ def create_datetime_column(spec, column_options):
     if tz_name:
         timezone = get_timezone(tz_name)
 
+    return timezone
+
+
+def create_datetime_column(spec, column_options):
+    timezone = get_column_timezone(spec, column_options['context'])
+
+    if spec.name == 'DateTime64':
+        return DateTime64Column(scale=spec.args[0], timezone=timezone,
+                                **column_options)
+
     return DateTimeColumn(timezone=timezone, **column_options)
@@ -114,14 +114,20 @@ class Decimal128Column(DecimalColumn):
         return int_128_items
 
 
+# Maximum precisions for underlying types are:
+# Int32    9
+# Int64   18
+# Int128  38
+max_precisions = {'Decimal32': 9, 'Decimal64': 18, 'Decimal128': 38}
+
+
 def create_decimal_column(spec, column_options):
-    precision, scale = spec[8:-1].split(',')
-    precision, scale = int(precision), int(scale)
+    if spec.name == 'Decimal':
+        precision, scale = spec.args
+    else:
+        # Decimal32(S) and others have fixed precision.
+        precision, scale = max_precisions[spec.name], spec.args[0]
 
-    # Maximum precisions for underlying types are:
-    # Int32    9
-    # Int64   18
-    # Int128  38
     if precision <= 9:
         cls = Decimal32Column
     elif precision <= 18:
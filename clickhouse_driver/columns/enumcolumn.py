@@ -51,54 +51,5 @@ class Enum16Column(EnumColumn):
 
 
 def create_enum_column(spec, column_options):
-    if spec.startswith('Enum8'):
-        params = spec[6:-1]
-        cls = Enum8Column
-    else:
-        params = spec[7:-1]
-        cls = Enum16Column
-
-    return cls(Enum(cls.ch_type, _parse_options(params)), **column_options)
-
-
-def _parse_options(option_string):
-    options = dict()
-    after_name = False
-    escaped = False
-    quote_character = None
-    name = ''
-    value = ''
-
-    for ch in option_string:
-        if escaped:
-            name += ch
-            escaped = False  # accepting escaped character
-
-        elif after_name:
-            if ch in (' ', '='):
-                pass
-            elif ch == ',':
-                options[name] = int(value)
-                after_name = False
-                name = ''
-                value = ''  # reset before collecting new option
-            else:
-                value += ch
-
-        elif quote_character:
-            if ch == '\\':
-                escaped = True
-            elif ch == quote_character:
-                quote_character = None
-                after_name = True  # start collecting option value
-            else:
-                name += ch
-
-        else:
-            if ch == "'":
-                quote_character = ch
-
-    if after_name:
-        options.setdefault(name, int(value))  # append word after last comma
-
-    return options
+    cls = Enum8Column if spec.name == 'Enum8' else Enum16Column
+    return cls(Enum(cls.ch_type, list(spec.args)), **column_options)
@@ -0,0 +1,139 @@
+from .. import errors
+from ..reader import read_binary_uint64
+from ..writer import write_binary_uint64
+from .base import Column
+from .intcolumn import UInt8Column, UInt16Column, UInt32Column, UInt64Column
+
+
+class LowCardinalityColumn(Column):
+    """
+    Items are stored as dictionary of distinct values and positions (keys)
+    of items in it. Data of block:
+
+    * serialization type: UInt64 with type of keys in the lowest byte
+      and flags in the next ones;
+    * dictionary size: UInt64 and dictionary itself as column of nested type
+      without nulls map;
+    * number of items: UInt64 and keys of items.
+
+    For LowCardinality(Nullable(T)) key 0 stands for NULL.
+
+    Keys serialization version is sent once per column before data of
+    the block, see :meth:`read_state_prefix`.
+    """
+
+    # KeysSerializationVersion::SharedDictionariesWithAdditionalKeys.
+    keys_serialization_version = 1
+
+    # Lowest byte of serialization type is index of keys type.
+    key_columns = (UInt8Column(), UInt16Column(), UInt32Column(),
+                   UInt64Column())
+    key_type_mask = 0xff
+
+    # Dictionary is shared between blocks. Never used in Native format.
+    need_global_dictionary_bit = 1 << 8
+    # Dictionary of block goes before keys.
+    has_additional_keys_bit = 1 << 9
+    # Dictionary differs from the previous block's one.
+    need_update_dictionary_bit = 1 << 10
+
+    serialization_type = has_additional_keys_bit | need_update_dictionary_bit
+
+    def __init__(self, nested_column, **kwargs):
+        # Nullable nested column writes NULL placeholder in dictionary.
+        self.nested_column = nested_column
+        self.nested_nullable = nested_column.nullable
+        super(LowCardinalityColumn, self).__init__(**kwargs)
+
+    def read_state_prefix(self, buf):
+        version = read_binary_uint64(buf)
+
+        if version != self.keys_serialization_version:
+            raise errors.LogicalError(
+                'Unsupported LowCardinality keys serialization '
+                'version: {}'.format(version)
+            )
+
+    def write_state_prefix(self, buf):
+        write_binary_uint64(self.keys_serialization_version, buf)
+
+    def get_key_type(self, dictionary_size):
+        for key_type, column in enumerate(self.key_columns):
+            if dictionary_size <= 1 << (8 * column.int_size):
+                return key_type
+
+        return len(self.key_columns) - 1
+
+    def read_keys(self, key_type, n_keys, buf):
+        return self.key_columns[key_type].read_items(n_keys, buf)
+
+    def write_keys(self, key_type, keys, buf):
+        self.key_columns[key_type].write_items(keys, buf)
+
+    def read_dictionary_and_keys(self, buf):
+        serialization_type = read_binary_uint64(buf)
+
+        key_type = serialization_type & self.key_type_mask
+        if serialization_type & self.need_global_dictionary_bit or \
+                not serialization_type & self.has_additional_keys_bit or \
+                key_type >= len(self.key_columns):
+            raise errors.LogicalError(
+                'Unsupported LowCardinality serialization type: '
+                '{}'.format(serialization_type)
+            )
+
+        dictionary_size = read_binary_uint64(buf)
+        dictionary = self.nested_column._read_data(dictionary_size, buf)
+        if self.nested_nullable:
+            dictionary = (None, ) + tuple(dictionary[1:])
+
+        n_keys = read_binary_uint64(buf)
+        keys = self.read_keys(key_type, n_keys, buf)
+
+        return dictionary, keys
+
+    def write_dictionary_and_keys(self, dictionary, keys, buf):
+        key_type = self.get_key_type(len(dictionary))
+
+        write_binary_uint64(self.serialization_type | key_type, buf)
+        write_binary_uint64(len(dictionary), buf)
+        self.nested_column._write_data(dictionary, buf)
+
+        write_binary_uint64(len(keys), buf)
+        self.write_keys(key_type, keys, buf)
+
+    def _read_data(self, n_items, buf, nulls_map=None):
+        # Nothing is written for empty data, e.g. for empty arrays.
+        if not n_items:
+            return ()
+
+        dictionary, keys = self.read_dictionary_and_keys(buf)
+        return tuple(dictionary[x] for x in keys)
+
+    def _write_data(self, items, buf):
+        if not len(items):
+            return
+
+        # Nullable nested column writes NULL as default value of its type.
+        if self.nested_nullable:
+            dictionary = [None]
+            keys_by_value = {None: 0}
+        else:
+            dictionary = []
+            keys_by_value = {}
+
+        keys = [0] * len(items)
+        for i, x in enumerate(items):
+            key = keys_by_value.get(x)
+
+            if key is None:
+                key = keys_by_value[x] = len(dictionary)
+                dictionary.append(x)
+
+            keys[i] = key
+
+        self.write_dictionary_and_keys(dictionary, keys, buf)
+
+
+def create_low_cardinality_column(spec, column_by_spec_getter):
+    return LowCardinalityColumn(column_by_spec_getter(spec.args[0]))
@@ -0,0 +1,73 @@
+from .base import Column
+from .intcolumn import UInt64Column
+
+
+class MapColumn(Column):
+    """
+    Stored as Array(Tuple(K, V)): offsets of maps followed by keys column
+    and values column of all maps.
+    """
+    py_types = (dict, )
+
+    def __init__(self, key_column, value_column, **kwargs):
+        self.offset_column = UInt64Column()
+        self.key_column = key_column
+        self.value_column = value_column
+        super(MapColumn, self).__init__(**kwargs)
+
+    def read_state_prefix(self, buf):
+        self.key_column.read_state_prefix(buf)
+        self.value_column.read_state_prefix(buf)
+
+    def write_state_prefix(self, buf):
+        self.key_column.write_state_prefix(buf)
+        self.value_column.write_state_prefix(buf)
+
+    def write_data(self, items, buf):
+        # Map can't be nullable.
+        self._write_data(items, buf)
+
+    def _write_data(self, items, buf):
+        offsets = [0] * len(items)
+        keys = []
+        values = []
+        offset = 0
+
+        for i, x in enumerate(items):
+            if self.types_check_enabled:
+                self.check_item_type(x)
+
+            offset += len(x)
+            offsets[i] = offset
+            keys.extend(x.keys())
+            values.extend(x.values())
+
+        self.offset_column.write_items(offsets, buf)
+        self.key_column.write_data(keys, buf)
+        self.value_column.write_data(values, buf)
+
+    def read_data(self, n_items, buf):
+        return self._read_data(n_items, buf)
+
+    def _read_data(self, n_items, buf, nulls_map=None):
+        offsets = self.offset_column.read_items(n_items, buf)
+        n_pairs = offsets[-1] if n_items else 0
+
+        keys = self.key_column.read_data(n_pairs, buf)
+        values = self.value_column.read_data(n_pairs, buf)
+
+        items = [None] * n_items
+        prev_offset = 0
+        for i, offset in enumerate(offsets):
+            items[i] = dict(zip(keys[prev_offset:offset],
+                                values[prev_offset:offset]))
+            prev_offset = offset
+
+        return tuple(items)
+
+
+def create_map_column(spec, column_by_spec_getter):
+    key_spec, value_spec = spec.args
+    return MapColumn(
+        column_by_spec_getter(key_spec), column_by_spec_getter(value_spec)
+    )
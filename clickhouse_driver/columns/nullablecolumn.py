@@ -1,7 +1,6 @@
 
 
 def create_nullable_column(spec, column_by_spec_getter):
-    inner = spec[9:-1]
-    nested = column_by_spec_getter(inner)
+    nested = column_by_spec_getter(spec.args[0])
     nested.nullable = True
     return nested
@@ -0,0 +1,56 @@
+from __future__ import absolute_import
+
+from itertools import chain
+
+import numpy as np
+
+from ..arraycolumn import ArrayColumn, FlatArrays, is_flat_arrays
+
+
+class NumpyArrayColumn(ArrayColumn):
+    """
+    Reads Array(T) into :class:`numpy.ndarray` of objects. Values of all
+    arrays are read into single array of nested column and rows are its
+    views.
+    """
+
+    offsets_dtype = np.dtype('<u8')
+
+    def _read_data(self, n_items, buf, nulls_map=None):
+        offsets = np.frombuffer(
+            buf.read(n_items * self.offsets_dtype.itemsize),
+            dtype=self.offsets_dtype, count=n_items
+        )
+        n_values = int(offsets[-1]) if n_items else 0
+        values = self.nested_column.read_data(n_values, buf)
+
+        if self.flat:
+            return FlatArrays(values, offsets)
+
+        items = np.empty(n_items, dtype=object)
+        prev_offset = 0
+        for i, offset in enumerate(offsets.tolist()):
+            items[i] = values[prev_offset:offset]
+            prev_offset = offset
+
+        return items
+
+    def flatten(self, items):
+        lengths = [len(x) for x in items]
+        offsets = np.cumsum(lengths, dtype=self.offsets_dtype)
+
+        if any(isinstance(x, np.ma.MaskedArray) for x in items):
+            values = np.ma.concatenate(items)
+        elif len(items) and all(isinstance(x, np.ndarray) for x in items):
+            values = np.concatenate(items)
+        else:
+            values = list(chain.from_iterable(items))
+
+        return offsets, values
+
+
+def create_numpy_array_column(spec, column_by_spec_getter, column_options):
+    return NumpyArrayColumn(
+        column_by_spec_getter(spec.args[0]),
+        flat=is_flat_arrays(column_options)
+    )
@@ -0,0 +1,115 @@
+from __future__ import absolute_import
+
+try:
+    import numpy as np
+except ImportError:
+    raise RuntimeError('Package numpy is required to use NumPy columns')
+
+from ..base import Column
+from ..exceptions import ColumnTypeMismatchException
+
+
+class NumpyColumn(Column):
+    """
+    Reads fixed-width items straight into :class:`numpy.ndarray` without
+    building intermediate Python objects and writes arrays as is.
+    """
+    dtype = None
+
+    after_read_items = None
+    before_write_items = None
+
+    def read_items(self, n_items, buf):
+        data = buf.read(n_items * self.dtype.itemsize)
+        return np.frombuffer(data, dtype=self.dtype, count=n_items)
+
+    def _read_nulls_map(self, n_items, buf):
+        return np.frombuffer(buf.read(n_items), dtype=np.bool_, count=n_items)
+
+    def _read_data(self, n_items, buf, nulls_map=None):
+        items = self.read_items(n_items, buf)
+
+        if self.after_read_items:
+            items = self.after_read_items(items)
+
+        if nulls_map is not None:
+            items = np.ma.masked_array(items, mask=nulls_map)
+
+        return items
+
+    def write_data(self, items, buf):
+        if isinstance(items, np.ma.MaskedArray):
+            nulls_map = np.ma.getmaskarray(items)
+            items = np.ma.getdata(items)
+
+        elif self.nullable:
+            nulls_map = np.array([x is None for x in items], dtype=np.bool_)
+
+        else:
+            nulls_map = None
+
+        if self.nullable:
+            buf.write(nulls_map.astype(np.uint8).tobytes())
+
+        self._write_data(items, buf, nulls_map=nulls_map)
+
+    def _write_data(self, items, buf, nulls_map=None):
+        if nulls_map is not None and nulls_map.any():
+            # Nulls are written as zeroes and never reach conversion.
+            present = ~nulls_map
+            if isinstance(items, np.ndarray):
+                values = items[present]
+            else:
+                values = [x for x, is_null in zip(items, nulls_map)
+                          if not is_null]
+
+            prepared = np.zeros(len(items), dtype=self.dtype)
+            prepared[present] = self.prepare_items(values)
+
+        else:
+            prepared = self.prepare_items(items)
+
+        buf.write(prepared.tobytes())
+
+    def prepare_items(self, items):
+        if self.before_write_items:
+            items = self.before_write_items(items)
+
+        if self.types_check_enabled:
+            return self.checked_cast(items)
+
+        return np.asarray(items, dtype=self.dtype)
+
+    def checked_cast(self, items):
+        """
+        Casts items to column's dtype. Items that are not numbers or change
+        their value on cast, e.g. out of range or fractional values for
+        integer column, raise :class:`ColumnTypeMismatchException`. Floats
+        are allowed to lose precision.
+        """
+        items = np.asarray(items)
+
+        if items.dtype.kind not in 'biufO':
+            raise ColumnTypeMismatchException(items[0])
+
+        with np.errstate(invalid='ignore', over='ignore'):
+            try:
+                prepared = items.astype(self.dtype)
+
+            except (TypeError, ValueError, OverflowError):
+                # Find the item that can't be cast.
+                for x in items:
+                    try:
+                        np.array([x]).astype(self.dtype)
+                    except (TypeError, ValueError, OverflowError):
+                        raise ColumnTypeMismatchException(x)
+                raise
+
+            if self.dtype.kind in 'iu':
+                mismatch = prepared != items
+                if mismatch.any():
+                    raise ColumnTypeMismatchException(
+                        items[np.argmax(mismatch)]
+                    )
+
+        return prepared
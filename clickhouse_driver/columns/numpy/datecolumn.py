@@ -0,0 +1,16 @@
+from __future__ import absolute_import
+
+import numpy as np
+
+from .base import NumpyColumn
+
+
+class NumpyDateColumn(NumpyColumn):
+    ch_type = 'Date'
+    dtype = np.dtype('<u2')
+
+    def after_read_items(self, items):
+        return items.astype('datetime64[D]')
+
+    def before_write_items(self, items):
+        return np.asarray(items, dtype='datetime64[D]').astype(np.int64)
@@ -0,0 +1,193 @@
+from __future__ import absolute_import
+from calendar import timegm
+from datetime import datetime, timedelta
+
+import numpy as np
+from pytz import utc
+
+from ..datetimecolumn import get_column_timezone
+from .base import NumpyColumn
+
+
+epoch_start = datetime(1970, 1, 1)
+
+# Step for timezone offset transitions lookup. Real world timezones never
+# change offset twice within one day.
+transition_search_step = 24 * 3600
+
+
+def _make_offset_getter(timezone):
+    if timezone is None:
+        # Client's local time.
+        def get_offset(timestamp):
+            local = datetime.fromtimestamp(timestamp)
+            utc = epoch_start + timedelta(seconds=timestamp)
+            return int((local - utc).total_seconds())
+
+    else:
+        def get_offset(timestamp):
+            dt = datetime.fromtimestamp(timestamp, timezone)
+            return int(dt.utcoffset().total_seconds())
+
+    return get_offset
+
+
+# Offset transitions of timezones: arrays of UTC timestamps of transitions
+# and offsets in effect since each of them.
+transitions_cache = {}
+
+
+def get_transitions(timezone):
+    """
+    :return: transitions of pytz timezone from its transitions table or
+             ``None`` for client's local time.
+    """
+    if timezone is None:
+        return None
+
+    transitions = transitions_cache.get(timezone)
+    if transitions is not None:
+        return transitions
+
+    utc_transition_times = getattr(timezone, '_utc_transition_times', None)
+    if utc_transition_times is None:
+        # Fixed offset timezones: UTC, Etc/GMT+3, etc.
+        starts = [0]
+        offsets = [timezone.utcoffset(epoch_start)]
+    else:
+        starts = [timegm(x.timetuple()) for x in utc_transition_times]
+        offsets = [x[0] for x in timezone._transition_info]
+
+    transitions = (
+        np.array(starts, dtype=np.int64),
+        np.array([int(x.total_seconds()) for x in offsets], dtype=np.int64)
+    )
+    transitions_cache[timezone] = transitions
+    return transitions
+
+
+def get_utc_offsets(timestamps, timezone):
+    """
+    Calculates UTC offsets for each timestamp.
+
+    Offsets of pytz timezones are looked up in timezone's transitions table
+    with binary search. The cost doesn't depend on timestamps range.
+    """
+    transitions = get_transitions(timezone)
+    if transitions is None:
+        return search_utc_offsets(timestamps, timezone)
+
+    starts, offsets = transitions
+    if len(offsets) == 1:
+        return int(offsets[0])
+
+    positions = np.searchsorted(starts, timestamps, side='right') - 1
+    return offsets[np.maximum(positions, 0)]
+
+
+def search_utc_offsets(timestamps, timezone):
+    """
+    Calculates UTC offsets for each timestamp of timezone without
+    transitions table.
+
+    Offsets are calculated only for timezone transitions within timestamps
+    range and then spread over all items, so the cost doesn't depend on the
+    number of items.
+    """
+    get_offset = _make_offset_getter(timezone)
+
+    lo, hi = int(timestamps.min()), int(timestamps.max())
+    starts, offsets = [lo], [get_offset(lo)]
+
+    prev = lo
+    while prev < hi:
+        current = min(prev + transition_search_step, hi)
+        offset = get_offset(current)
+
+        if offset != offsets[-1]:
+            # Bisect the first second with the new offset.
+            left, right = prev, current
+            while right - left > 1:
+                middle = (left + right) // 2
+                if get_offset(middle) == offsets[-1]:
+                    left = middle
+                else:
+                    right = middle
+
+            starts.append(right)
+            offsets.append(offset)
+
+        prev = current
+
+    if len(offsets) == 1:
+        return offsets[0]
+
+    positions = np.searchsorted(starts, timestamps, side='right') - 1
+    return np.array(offsets, dtype=np.int64)[positions]
+
+
+class NumpyDateTimeColumn(NumpyColumn):
+    ch_type = 'DateTime'
+    dtype = np.dtype('<u4')
+
+    def __init__(self, timezone=None, **kwargs):
+        self.timezone = timezone
+        super(NumpyDateTimeColumn, self).__init__(**kwargs)
+
+    def after_read_items(self, items):
+        timestamps = items.astype(np.int64)
+
+        # Same as for generic column: naive datetime in column's, server's or
+        # client's timezone.
+        if len(timestamps):
+            timestamps += get_utc_offsets(timestamps, self.timezone)
+
+        return timestamps.astype('datetime64[s]')
+
+    def before_write_items(self, items):
+        items = np.asarray(items)
+
+        # Raw timestamps are written as is, like in generic column.
+        if items.dtype.kind in 'iu':
+            return items
+
+        if items.dtype.kind == 'O':
+            aware = np.array(
+                [getattr(x, 'tzinfo', None) is not None for x in items],
+                dtype=np.bool_
+            )
+
+            if aware.any():
+                # Offset-aware datetimes are converted to UTC by their own
+                # timezone, like in generic column.
+                naive = ~aware
+                timestamps = np.empty(len(items), dtype=np.int64)
+                timestamps[aware] = [
+                    timegm(x.astimezone(utc).timetuple())
+                    for x in items[aware]
+                ]
+                timestamps[naive] = self.local_to_timestamps(
+                    items[naive].astype('datetime64[s]').astype(np.int64)
+                )
+                return timestamps
+
+        local = items.astype('datetime64[s]').astype(np.int64)
+        return self.local_to_timestamps(local)
+
+    def local_to_timestamps(self, local):
+        """
+        Converts seconds of wall clock time in column's timezone to UTC
+        timestamps.
+        """
+        if not len(local):
+            return local
+
+        # Offsets are looked up by UTC timestamps. Approximate them with
+        # local time first and refine.
+        approximate = local - get_utc_offsets(local, self.timezone)
+        return local - get_utc_offsets(approximate, self.timezone)
+
+
+def create_numpy_datetime_column(spec, column_options):
+    timezone = get_column_timezone(spec, column_options['context'])
+    return NumpyDateTimeColumn(timezone=timezone, **column_options)
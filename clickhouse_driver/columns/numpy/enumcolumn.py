@@ -0,0 +1,71 @@
+from __future__ import absolute_import
+
+import numpy as np
+
+try:
+    import pandas as pd
+except ImportError:
+    raise RuntimeError('Package pandas is required to use NumPy Enum columns')
+
+from ..enumcolumn import create_enum_column
+from .base import NumpyColumn
+
+
+class NumpyEnumColumn(NumpyColumn):
+    """
+    Reads enum values into :class:`pandas.Categorical` with enum names as
+    categories.
+    """
+
+    def __init__(self, enum_column, **kwargs):
+        # Generic column validates single items on write.
+        self.enum_column = enum_column
+        self.dtype = np.dtype('<' + enum_column.format)
+
+        enum_cls = enum_column.enum_cls
+        self.categories = [x.name for x in enum_cls]
+        self.values = np.array([x.value for x in enum_cls], dtype=self.dtype)
+        self.sorter = np.argsort(self.values)
+
+        super(NumpyEnumColumn, self).__init__(**kwargs)
+
+    def _read_data(self, n_items, buf, nulls_map=None):
+        items = self.read_items(n_items, buf)
+
+        # Enum values are sparse and can be negative. Find their positions
+        # in categories. Positions of nulls are arbitrary and replaced below.
+        positions = np.searchsorted(self.values, items, sorter=self.sorter)
+        np.minimum(positions, len(self.values) - 1, out=positions)
+        codes = self.sorter[positions]
+
+        if nulls_map is not None:
+            codes[nulls_map] = -1
+
+        return pd.Categorical.from_codes(codes, self.categories)
+
+    def write_data(self, items, buf):
+        if self.nullable and isinstance(items, pd.Categorical):
+            nulls_map = items.codes == -1
+            buf.write(nulls_map.astype(np.uint8).tobytes())
+            self._write_data(items, buf, nulls_map=nulls_map)
+
+        else:
+            super(NumpyEnumColumn, self).write_data(items, buf)
+
+    def before_write_items(self, items):
+        before_write_item = self.enum_column.before_write_item
+
+        if isinstance(items, pd.Categorical):
+            # Each category is checked once.
+            lookup = np.array(
+                [before_write_item(x) for x in items.categories],
+                dtype=self.dtype
+            )
+            return lookup[items.codes]
+
+        return [before_write_item(x) for x in items]
+
+
+def create_numpy_enum_column(spec, column_options):
+    enum_column = create_enum_column(spec, column_options)
+    return NumpyEnumColumn(enum_column, **column_options)
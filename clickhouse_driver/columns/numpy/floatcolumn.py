@@ -0,0 +1,15 @@
+from __future__ import absolute_import
+
+import numpy as np
+
+from .base import NumpyColumn
+
+
+class NumpyFloat32Column(NumpyColumn):
+    ch_type = 'Float32'
+    dtype = np.dtype('<f4')
+
+
+class NumpyFloat64Column(NumpyColumn):
+    ch_type = 'Float64'
+    dtype = np.dtype('<f8')
@@ -0,0 +1,45 @@
+from __future__ import absolute_import
+
+import numpy as np
+
+from .base import NumpyColumn
+
+
+class NumpyInt8Column(NumpyColumn):
+    ch_type = 'Int8'
+    dtype = np.dtype('<i1')
+
+
+class NumpyInt16Column(NumpyColumn):
+    ch_type = 'Int16'
+    dtype = np.dtype('<i2')
+
+
+class NumpyInt32Column(NumpyColumn):
+    ch_type = 'Int32'
+    dtype = np.dtype('<i4')
+
+
+class NumpyInt64Column(NumpyColumn):
+    ch_type = 'Int64'
+    dtype = np.dtype('<i8')
+
+
+class NumpyUInt8Column(NumpyColumn):
+    ch_type = 'UInt8'
+    dtype = np.dtype('<u1')
+
+
+class NumpyUInt16Column(NumpyColumn):
+    ch_type = 'UInt16'
+    dtype = np.dtype('<u2')
+
+
+class NumpyUInt32Column(NumpyColumn):
+    ch_type = 'UInt32'
+    dtype = np.dtype('<u4')
+
+
+class NumpyUInt64Column(NumpyColumn):
+    ch_type = 'UInt64'
+    dtype = np.dtype('<u8')
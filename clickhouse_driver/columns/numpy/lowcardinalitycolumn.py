@@ -0,0 +1,86 @@
+from __future__ import absolute_import
+
+import numpy as np
+
+try:
+    import pandas as pd
+except ImportError:
+    raise RuntimeError(
+        'Package pandas is required to use NumPy LowCardinality columns'
+    )
+
+from ..exceptions import ColumnTypeMismatchException
+from ..lowcardinalitycolumn import LowCardinalityColumn
+
+
+class NumpyLowCardinalityColumn(LowCardinalityColumn):
+    """
+    Reads items into :class:`pandas.Categorical` with dictionary as
+    categories and keys as codes without expanding dictionary values.
+    Categoricals are written the same way.
+    """
+
+    key_dtypes = (np.dtype('<u1'), np.dtype('<u2'), np.dtype('<u4'),
+                  np.dtype('<u8'))
+
+    def read_keys(self, key_type, n_keys, buf):
+        dtype = self.key_dtypes[key_type]
+        data = buf.read(n_keys * dtype.itemsize)
+        return np.frombuffer(data, dtype=dtype, count=n_keys)
+
+    def write_keys(self, key_type, keys, buf):
+        buf.write(np.asarray(keys, dtype=self.key_dtypes[key_type]).tobytes())
+
+    def _read_data(self, n_items, buf, nulls_map=None):
+        if not n_items:
+            return pd.Categorical([])
+
+        dictionary, keys = self.read_dictionary_and_keys(buf)
+        codes = keys.astype(np.int64)
+
+        # NULL placeholder is not a category, its key becomes code -1.
+        if self.nested_nullable:
+            dictionary = dictionary[1:]
+            codes -= 1
+
+        categories = pd.Index(dictionary)
+
+        # Dictionary written by other client can contain repeated values.
+        if not categories.is_unique:
+            positions, categories = pd.factorize(categories)
+            codes = np.where(codes >= 0, positions[codes], -1)
+
+        return pd.Categorical.from_codes(codes, categories)
+
+    def write_data(self, items, buf):
+        if not isinstance(items, pd.Categorical):
+            return super(NumpyLowCardinalityColumn, self).write_data(
+                items, buf
+            )
+
+        if not len(items):
+            return
+
+        codes = items.codes
+        dictionary = list(items.categories)
+
+        if self.nested_nullable:
+            dictionary.insert(0, None)
+            keys = codes.astype(np.int64) + 1
+
+        elif (codes == -1).any():
+            raise ColumnTypeMismatchException(None)
+
+        else:
+            keys = codes
+
+        self.write_dictionary_and_keys(dictionary, keys, buf)
+
+
+def create_numpy_low_cardinality_column(spec, column_options):
+    from ..service import get_column_by_spec
+
+    # Dictionary is small: generic column reads it into values that
+    # become categories.
+    nested = get_column_by_spec(spec.args[0], column_options, use_numpy=False)
+    return NumpyLowCardinalityColumn(nested, **column_options)
@@ -0,0 +1,56 @@
+from ... import errors
+from ..nullablecolumn import create_nullable_column
+from .arraycolumn import create_numpy_array_column
+from .datecolumn import NumpyDateColumn
+from .datetimecolumn import create_numpy_datetime_column
+from .floatcolumn import NumpyFloat32Column, NumpyFloat64Column
+from .intcolumn import (
+    NumpyInt8Column, NumpyInt16Column, NumpyInt32Column, NumpyInt64Column,
+    NumpyUInt8Column, NumpyUInt16Column, NumpyUInt32Column, NumpyUInt64Column
+)
+
+try:
+    from .enumcolumn import create_numpy_enum_column
+    from .lowcardinalitycolumn import create_numpy_low_cardinality_column
+except RuntimeError:
+    # Categorical columns require pandas. Generic columns are used instead.
+    create_numpy_enum_column = None
+    create_numpy_low_cardinality_column = None
+
+
+column_by_type = {c.ch_type: c for c in [
+    NumpyDateColumn, NumpyFloat32Column, NumpyFloat64Column,
+    NumpyInt8Column, NumpyInt16Column, NumpyInt32Column, NumpyInt64Column,
+    NumpyUInt8Column, NumpyUInt16Column, NumpyUInt32Column, NumpyUInt64Column
+]}
+
+
+def get_numpy_column_by_spec(spec, column_options):
+    def create_column_with_options(x):
+        return get_numpy_column_by_spec(x, column_options)
+
+    name = spec.name
+
+    if name == 'DateTime':
+        return create_numpy_datetime_column(spec, column_options)
+
+    elif name in ('Enum8', 'Enum16') and create_numpy_enum_column:
+        return create_numpy_enum_column(spec, column_options)
+
+    elif name == 'Array':
+        return create_numpy_array_column(
+            spec, create_column_with_options, column_options
+        )
+
+    elif name == 'LowCardinality' and create_numpy_low_cardinality_column:
+        return create_numpy_low_cardinality_column(spec, column_options)
+
+    elif name == 'Nullable':
+        return create_nullable_column(spec, create_column_with_options)
+
+    else:
+        cls = None if spec.args else column_by_type.get(name)
+        if cls is None:
+            raise errors.UnknownTypeError('Unknown type {}'.format(spec))
+
+        return cls(**column_options)
@@ -1,3 +1,5 @@
+import logging
+
 from .. import errors
 from .arraycolumn import create_array_column
 from .datecolumn import DateColumn
@@ -10,10 +12,14 @@ from .intcolumn import (
     Int8Column, Int16Column, Int32Column, Int64Column,
     UInt8Column, UInt16Column, UInt32Column, UInt64Column
 )
+from .lowcardinalitycolumn import create_low_cardinality_column
+from .mapcolumn import create_map_column
 from .nothingcolumn import NothingColumn
 from .nullcolumn import NullColumn
 from .nullablecolumn import create_nullable_column
 from .stringcolumn import create_string_column
+from .tuplecolumn import create_nested_column, create_tuple_column
+from .typespec import TypeSpec, parse_spec
 from .uuidcolumn import UUIDColumn
 from .intervalcolumn import (
     IntervalYearColumn, IntervalMonthColumn, IntervalWeekColumn,
@@ -33,55 +39,142 @@ column_by_type = {c.ch_type: c for c in [
     IntervalSecondColumn, IPv4Column, IPv6Column
 ]}
 
+logger = logging.getLogger(__name__)
+
 
-def get_column_by_spec(spec, column_options=None):
+def get_column_by_spec(spec, column_options=None, use_numpy=None):
+    """
+    :param spec: column type: string or parsed :class:`TypeSpec`.
+    """
     column_options = column_options or {}
 
+    if not isinstance(spec, TypeSpec):
+        spec = parse_spec(spec)
+
+    if use_numpy is None:
+        context = column_options.get('context')
+        use_numpy = context.client_settings['use_numpy'] if context else False
+
+    if use_numpy:
+        from .numpy.service import get_numpy_column_by_spec
+
+        try:
+            return get_numpy_column_by_spec(spec, column_options)
+
+        except errors.UnknownTypeError:
+            # Nested columns are generic too.
+            use_numpy = False
+            logger.debug(
+                'NumPy support is not implemented for %s. '
+                'Using generic column', spec
+            )
+
     def create_column_with_options(x):
-        return get_column_by_spec(x, column_options)
+        return get_column_by_spec(x, column_options, use_numpy=use_numpy)
+
+    name = spec.name
 
-    if spec == 'String' or spec.startswith('FixedString'):
+    if name in ('String', 'FixedString'):
         return create_string_column(spec, column_options)
 
-    elif spec.startswith('Enum'):
+    elif name in ('Enum8', 'Enum16'):
         return create_enum_column(spec, column_options)
 
-    elif spec.startswith('DateTime'):
+    elif name in ('DateTime', 'DateTime64'):
         return create_datetime_column(spec, column_options)
 
-    elif spec.startswith('Decimal'):
+    elif name in ('Decimal', 'Decimal32', 'Decimal64', 'Decimal128'):
         return create_decimal_column(spec, column_options)
 
-    elif spec.startswith('Array'):
-        return create_array_column(spec, create_column_with_options)
+    elif name == 'Array':
+        return create_array_column(
+            spec, create_column_with_options, column_options
+        )
 
-    elif spec.startswith('Nullable'):
+    elif name == 'Nullable':
         return create_nullable_column(spec, create_column_with_options)
 
+    elif name == 'Tuple':
+        return create_tuple_column(spec, create_column_with_options)
+
+    elif name == 'Nested':
+        return create_nested_column(spec, create_column_with_options)
+
+    elif name == 'Map':
+        return create_map_column(spec, create_column_with_options)
+
+    elif name == 'LowCardinality':
+        return create_low_cardinality_column(spec, create_column_with_options)
+
+    elif name == 'SimpleAggregateFunction':
+        # Stored as values of its argument type.
+        return create_column_with_options(spec.args[-1])
+
     else:
-        try:
-            cls = column_by_type[spec]
-            return cls(**column_options)
+        cls = None if spec.args else column_by_type.get(name)
+        if cls is None:
+            raise errors.UnknownTypeError('Unknown type {}'.format(spec))
+
+        return cls(**column_options)
+
 
-        except KeyError as e:
-            raise errors.UnknownTypeError('Unknown type {}'.format(e.args[0]))
+def get_column(context, spec, types_check=False, use_numpy=None):
+    """
+    Returns column for given type from context's cache. Columns don't keep
+    state between reads and writes and are reused for all blocks.
+    """
+    key = (spec, types_check, use_numpy)
+    column = context.columns_cache.get(key)
+
+    if column is None:
+        column_options = {
+            'context': context,
+            'types_check': types_check
+        }
+        column = get_column_by_spec(spec, column_options, use_numpy=use_numpy)
+        context.columns_cache[key] = column
+
+    return column
 
 
 def read_column(context, column_spec, n_items, buf):
-    column_options = {'context': context}
-    column = get_column_by_spec(column_spec, column_options=column_options)
+    column = get_column(context, column_spec)
+    column.read_state_prefix(buf)
     return column.read_data(n_items, buf)
 
 
+def is_array_data(items):
+    """
+    Whether column data is an array written as a whole: NumPy and pandas
+    arrays or objects supporting buffer protocol. Lists and tuples hold
+    Python objects.
+    """
+    if isinstance(items, (list, tuple)):
+        return False
+
+    if hasattr(items, 'dtype'):
+        return True
+
+    try:
+        memoryview(items)
+    except TypeError:
+        return False
+
+    return True
+
+
 def write_column(context, column_name, column_spec, items, buf,
                  types_check=False):
-    column_options = {
-        'context': context,
-        'types_check': types_check
-    }
-    column = get_column_by_spec(column_spec, column_options)
+    use_numpy = None
+    if context.client_settings['use_numpy']:
+        # Python objects are written by generic columns as without NumPy.
+        use_numpy = is_array_data(items)
+
+    column = get_column(context, column_spec, types_check=types_check,
+                        use_numpy=use_numpy)
 
     try:
+        column.write_state_prefix(buf)
         column.write_data(items, buf)
 
     except column_exceptions.ColumnTypeMismatchException as e:
@@ -1,5 +1,6 @@
 
 from .. import errors
+from ..bufferedwriter import BufferedWriter
 from ..writer import write_varint
 from ..util import compat
 from .base import Column
@@ -22,6 +23,10 @@ class String(Column):
             return value, False
 
     def write_items(self, items, buf):
+        if isinstance(buf, BufferedWriter):
+            buf.write_strings(items, encode=True)
+            return
+
         for value in items:
             if not isinstance(value, bytes):
                 value = utf_8_encode(value)[0]
@@ -38,6 +43,10 @@ class ByteString(String):
     null_value = b''
 
     def write_items(self, items, buf):
+        if isinstance(buf, BufferedWriter):
+            buf.write_strings(items)
+            return
+
         for value in items:
             write_varint(len(value), buf)
             buf.write(value)
@@ -130,10 +139,10 @@ def create_string_column(spec, column_options):
     client_settings = column_options['context'].client_settings
     strings_as_bytes = client_settings['strings_as_bytes']
 
-    if spec == 'String':
+    if spec.name == 'String':
         cls = ByteString if strings_as_bytes else String
         return cls(**column_options)
     else:
-        length = int(spec[12:-1])
+        length = spec.args[0]
         cls = ByteFixedString if strings_as_bytes else FixedString
         return cls(length, **column_options)
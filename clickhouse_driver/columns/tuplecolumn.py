@@ -0,0 +1,60 @@
+from .arraycolumn import ArrayColumn
+from .base import Column
+
+
+class TupleColumn(Column):
+    """
+    Elements are stored as separate columns one after another. Each element
+    column is read in bulk and tuples are built by zipping them at the end.
+    """
+    py_types = (list, tuple)
+
+    def __init__(self, nested_columns, **kwargs):
+        self.nested_columns = nested_columns
+        super(TupleColumn, self).__init__(**kwargs)
+
+    def read_state_prefix(self, buf):
+        for column in self.nested_columns:
+            column.read_state_prefix(buf)
+
+    def write_state_prefix(self, buf):
+        for column in self.nested_columns:
+            column.write_state_prefix(buf)
+
+    def write_data(self, items, buf):
+        # Tuple can't be nullable. Elements write their own nulls maps.
+        self._write_data(items, buf)
+
+    def _write_data(self, items, buf):
+        if self.types_check_enabled:
+            for x in items:
+                self.check_item_type(x)
+
+        for i, column in enumerate(self.nested_columns):
+            column.write_data([x[i] for x in items], buf)
+
+    def read_data(self, n_items, buf):
+        return self._read_data(n_items, buf)
+
+    def _read_data(self, n_items, buf, nulls_map=None):
+        columns = [
+            column.read_data(n_items, buf) for column in self.nested_columns
+        ]
+        return tuple(zip(*columns))
+
+
+def get_nested_specs(spec):
+    # Elements can be named: Tuple(a String, b UInt8).
+    return [x[1] if isinstance(x, tuple) else x for x in spec.args]
+
+
+def create_tuple_column(spec, column_by_spec_getter):
+    return TupleColumn(
+        [column_by_spec_getter(x) for x in get_nested_specs(spec)]
+    )
+
+
+def create_nested_column(spec, column_by_spec_getter):
+    # Nested(a T1, b T2) is sent as Array(Tuple(T1, T2)) when it's not
+    # flattened into separate arrays.
+    return ArrayColumn(create_tuple_column(spec, column_by_spec_getter))
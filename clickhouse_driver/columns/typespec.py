@@ -0,0 +1,228 @@
+import re
+
+from .. import errors
+from ..util import compat
+
+
+name_re = re.compile(r'[A-Za-z_][A-Za-z0-9_.]*')
+number_re = re.compile(r'[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?')
+
+
+class TypeSpec(object):
+    """
+    Parsed column type.
+
+    :param name: type name, e.g. ``'Array'``.
+    :param args: tuple of type arguments. Each argument is one of:
+
+                     * :class:`TypeSpec` for nested type.
+                     * ``int`` or ``float`` for numeric parameter.
+                     * ``str`` for quoted literal, e.g. timezone.
+                     * ``(str, int)`` pair for enum element.
+                     * ``(str, TypeSpec)`` pair for named element of
+                       ``Tuple`` or ``Nested``.
+    """
+
+    def __init__(self, name, args=()):
+        self.name = name
+        self.args = tuple(args)
+
+        super(TypeSpec, self).__init__()
+
+    def __eq__(self, other):
+        return isinstance(other, TypeSpec) and \
+            (self.name, self.args) == (other.name, other.args)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash((self.name, self.args))
+
+    def __repr__(self):
+        return 'TypeSpec({!r})'.format(str(self))
+
+    def __str__(self):
+        if not self.args:
+            return self.name
+
+        return '{}({})'.format(
+            self.name, ', '.join(format_arg(x) for x in self.args)
+        )
+
+
+def quote(value, quote_char):
+    value = value.replace('\\', '\\\\').replace(quote_char, '\\' + quote_char)
+    return quote_char + value + quote_char
+
+
+def format_literal(value):
+    return quote(value, "'")
+
+
+def format_name(name):
+    match = name_re.match(name)
+    if match and match.end() == len(name):
+        return name
+
+    return quote(name, '`')
+
+
+def format_arg(arg):
+    if isinstance(arg, tuple):
+        name, value = arg
+        if isinstance(value, TypeSpec):
+            return '{} {}'.format(format_name(name), value)
+
+        return '{} = {}'.format(format_literal(name), value)
+
+    elif isinstance(arg, compat.string_types):
+        return format_literal(arg)
+
+    return str(arg)
+
+
+class TypeSpecParser(object):
+    """
+    Recursive descent parser of column types:
+
+        type := name ['(' arg (',' arg)* ')']
+        arg  := literal ['=' number] | number | name type | type
+    """
+
+    def __init__(self, spec):
+        self.spec = spec
+        self.position = 0
+
+        super(TypeSpecParser, self).__init__()
+
+    def error(self, message):
+        return errors.UnknownTypeError(
+            'Unable to parse type {}: {} at position {}'.format(
+                self.spec, message, self.position
+            )
+        )
+
+    def peek(self):
+        spec, position = self.spec, self.position
+
+        while position < len(spec) and spec[position].isspace():
+            position += 1
+
+        self.position = position
+        return spec[position] if position < len(spec) else ''
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise self.error("'{}' expected".format(char))
+
+        self.position += 1
+
+    def parse(self):
+        rv = self.parse_type()
+        if self.peek():
+            raise self.error('unexpected symbol')
+
+        return rv
+
+    def parse_type(self):
+        return self.parse_type_args(self.parse_name())
+
+    def parse_type_args(self, name):
+        args = []
+
+        if self.peek() == '(':
+            self.position += 1
+
+            if self.peek() != ')':
+                args.append(self.parse_arg())
+
+                while self.peek() == ',':
+                    self.position += 1
+                    args.append(self.parse_arg())
+
+            self.expect(')')
+
+        return TypeSpec(name, args)
+
+    def parse_arg(self):
+        char = self.peek()
+
+        if char == "'":
+            literal = self.parse_literal()
+            if self.peek() != '=':
+                return literal
+
+            self.position += 1
+            return literal, self.parse_number()
+
+        elif char and char in '0123456789+-.':
+            return self.parse_number()
+
+        name = self.parse_name()
+        char = self.peek()
+
+        # Named element: name followed by type.
+        if char == '`' or char.isalpha() or char == '_':
+            return name, self.parse_type()
+
+        return self.parse_type_args(name)
+
+    def parse_name(self):
+        if self.peek() == '`':
+            return self.parse_quoted('`')
+
+        return self.match(name_re, 'name expected')
+
+    def match(self, regexp, message):
+        match = regexp.match(self.spec, self.position)
+        if not match:
+            raise self.error(message)
+
+        self.position = match.end()
+        return match.group()
+
+    def parse_literal(self):
+        return self.parse_quoted("'")
+
+    def parse_quoted(self, quote):
+        self.expect(quote)
+
+        spec = self.spec
+        chars = []
+        escaped = False
+
+        for position in compat.range(self.position, len(spec)):
+            char = spec[position]
+
+            if escaped:
+                chars.append(char)
+                escaped = False
+
+            elif char == '\\':
+                escaped = True
+
+            elif char == quote:
+                self.position = position + 1
+                return ''.join(chars)
+
+            else:
+                chars.append(char)
+
+        raise self.error('unterminated literal')
+
+    def parse_number(self):
+        self.peek()
+        value = self.match(number_re, 'number expected')
+
+        return float(value) if set(value) & set('.eE') else int(value)
+
+
+def parse_spec(spec):
+    """
+    Parses column type.
+
+    :param spec: type as it's sent by server, e.g. ``'Array(String)'``.
+    :return: :class:`TypeSpec`.
+    """
+    return TypeSpecParser(spec).parse()
@@ -1,4 +1,4 @@
-from io import BytesIO
+from struct import Struct
 
 try:
     from clickhouse_cityhash.cityhash import CityHash128
@@ -8,26 +8,52 @@ except ImportError:
     )
 
 from .. import errors
+from ..reader import read_binary_uint32
+
+# Beginning of frame covered by hash.
+method_and_size = Struct('<BI')
+
+# Method byte, size with header and uncompressed size.
+frame_header = Struct('<BII')
 
 
 class BaseCompressor(object):
     """
-    Partial file-like object with write method.
+    Compresses independent frames of data.
+
+    :param level: compression level. ``None`` stands for library's default.
+                  Level can be changed between frames.
     """
     method = None
     method_byte = None
 
-    def __init__(self):
-        self.data = BytesIO()
-
+    def __init__(self, level=None):
+        self.level = level
         super(BaseCompressor, self).__init__()
 
-    def write(self, p_str):
-        self.data.write(p_str)
-
-    def get_compressed_data(self, extra_header_size):
+    def compress(self, data):
+        """
+        :param data: bytes-like object.
+        :return: compressed data.
+        """
         raise NotImplementedError
 
+    def compress_frame(self, data):
+        """
+        :param data: bytes-like object.
+        :return: ``(hash, frame)`` tuple. Frame is bytearray of method byte,
+                 sizes and compressed data covered by hash.
+        """
+        compressed = self.compress(data)
+
+        header_size = frame_header.size
+        frame = bytearray(header_size + len(compressed))
+        frame_header.pack_into(frame, 0, self.method_byte, len(frame),
+                               len(data))
+        frame[header_size:] = compressed
+
+        return CityHash128(frame), frame
+
 
 class BaseDecompressor(object):
     method = None
@@ -41,6 +67,44 @@ class BaseDecompressor(object):
         if CityHash128(compressed_data) != compressed_hash:
             raise errors.ChecksumDoesntMatchError()
 
+    def read_frame(self, method_byte, extra_header_size,
+                   get_buffer=bytearray):
+        """
+        Reads the rest of compressed frame after method byte.
+
+        :param get_buffer: function that returns bytearray of at least
+                           given size to read frame into. Defaults to new
+                           bytearray for each frame.
+        :return: memoryview of frame data covered by hash: method byte,
+                 sizes and compressed data.
+        """
+        size_with_header = read_binary_uint32(self.stream)
+        compressed_size = size_with_header - extra_header_size - 4
+        frame_size = method_and_size.size + compressed_size
+
+        buffer = get_buffer(frame_size)
+        method_and_size.pack_into(buffer, 0, method_byte, size_with_header)
+        self.stream.read_into(buffer, method_and_size.size, compressed_size)
+
+        return memoryview(buffer)[:frame_size]
+
+    def decompress_frame(self, frame, compressed_hash, extra_header_size):
+        """
+        Doesn't touch stream and can be called from other thread.
+        """
+        self.check_hash(frame, compressed_hash)
+        # Method byte and size with header are skipped.
+        return self.decompress(frame[extra_header_size + 4:])
+
+    def decompress(self, data):
+        """
+        :param data: memoryview of uncompressed size and compressed data.
+        :return: decompressed bytearray.
+        """
+        raise NotImplementedError
+
     def get_decompressed_data(self, method_byte, compressed_hash,
                               extra_header_size):
-        raise NotImplementedError
+        frame = self.read_frame(method_byte, extra_header_size)
+        return self.decompress_frame(frame, compressed_hash,
+                                     extra_header_size)
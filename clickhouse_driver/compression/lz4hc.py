@@ -1,9 +1,19 @@
+from __future__ import absolute_import
+from lz4 import block
+
 from .lz4 import Compressor as BaseCompressor, Decompressor as BaseDecompressor
 
 
 class Compressor(BaseCompressor):
     mode = 'high_compression'
 
+    def compress(self, data):
+        if self.level is None:
+            return super(Compressor, self).compress(data)
+
+        return block.compress(data, store_size=False, mode=self.mode,
+                              compression=self.level)
+
 
 class Decompressor(BaseDecompressor):
     pass
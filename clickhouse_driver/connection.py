@@ -2,16 +2,20 @@ import logging
 import socket
 import ssl
 from contextlib import contextmanager
+from multiprocessing.pool import ThreadPool
 from time import time
 
 from . import defines
 from . import errors
-from .block import Block
+from .adaptivecompression import CompressionSelector
+from .block import ColumnOrientedBlock, RowOrientedBlock
 from .blockstreamprofileinfo import BlockStreamProfileInfo
 from .bufferedreader import BufferedSocketReader
+from .bufferedwriter import BufferedSocketWriter, BufferedWriter
 from .clientinfo import ClientInfo
 from .compression import get_compressor_cls
 from .context import Context
+from .loadbalancing import LoadBalancer, parse_hosts
 from .log import log_block
 from .progress import Progress
 from .protocol import Compression, ClientPacketTypes, ServerPacketTypes
@@ -67,7 +71,9 @@ class Connection(object):
                                  Defaults to ``300`` seconds.
     :param sync_request_timeout: timeout for server ping.
                                  Defaults to ``5`` seconds.
-    :param compress_block_size: size of compressed block to send.
+    :param compress_block_size: size of uncompressed data in each
+                                compressed frame sent to server. Block is
+                                cut into frames as it's serialized.
                                 Defaults to ``1048576``.
     :param compression: specifies whether or not use compression.
                         Defaults to ``False``. Possible choices:
@@ -77,7 +83,29 @@ class Connection(object):
                             * ``'lz4hc'`` high-compression variant of
                               ``'lz4'``.
                             * ``'zstd'``.
-
+                            * ``'auto'`` chooses no compression, ``'lz4'``
+                              or ``'zstd'`` before each query by estimated
+                              time of compression and transfer. Compression
+                              ratio and speed are measured on samples of
+                              sent blocks, network by ping round trip time
+                              and time of socket writes.
+
+    :param compression_level: level of ``'zstd'`` (from ``1`` to ``22``,
+                              negative levels are faster) and ``'lz4hc'``
+                              (from ``1`` to ``12``) compression of sent
+                              data. Ignored by ``'lz4'``. Can be overridden
+                              per query by ``compression_level`` setting.
+                              Defaults to ``None`` (library's default level).
+    :param decompression_threads: number of threads to decompress received
+                                  frames on. Frames already received are
+                                  decompressed ahead while current one is
+                                  parsed. Defaults to ``0`` (decompression
+                                  in calling thread).
+    :param compression_threads: number of threads to compress sent frames
+                                on. Frames are compressed while the next
+                                ones are serialized and sent in order.
+                                Defaults to ``0`` (compression in calling
+                                thread).
     :param secure: establish secure connection. Defaults to ``False``.
     :param verify: specifies whether a certificate is required and whether it
                    will be validated after connection.
@@ -85,6 +113,27 @@ class Connection(object):
     :param ssl_version: see :func:`ssl.wrap_socket` docs.
     :param ca_certs: see :func:`ssl.wrap_socket` docs.
     :param ciphers: see :func:`ssl.wrap_socket` docs.
+    :param alt_hosts: replicas of ``host``: comma separated string or list
+                      of ``host[:port]`` strings. Hosts without port use
+                      ``port``. Connection fails over to the next replica
+                      on network errors and timeouts.
+                      Defaults to ``None`` (single host).
+    :param load_balancing: order in which replicas are tried on connection.
+                           Defaults to ``'first_available'``. Possible
+                           choices:
+
+                               * ``'first_available'`` in order of hosts.
+                               * ``'random'``.
+                               * ``'round_robin'`` each connection starts
+                                 from the next host.
+                               * ``'nearest'`` replica with the lowest
+                                 connection establishment time.
+
+    :param host_backoff: seconds replica is skipped after failed
+                         connection. Doubles on each consecutive failure.
+                         Defaults to ``1`` second.
+    :param max_host_backoff: maximum seconds replica is skipped.
+                             Defaults to ``60`` seconds.
 
     """
 
@@ -97,9 +146,14 @@ class Connection(object):
             sync_request_timeout=defines.DBMS_DEFAULT_SYNC_REQUEST_TIMEOUT_SEC,
             compress_block_size=defines.DEFAULT_COMPRESS_BLOCK_SIZE,
             compression=False,
+            compression_level=None,
+            decompression_threads=0,
+            compression_threads=0,
             secure=False,
             # Secure socket parameters.
-            verify=True, ssl_version=None, ca_certs=None, ciphers=None
+            verify=True, ssl_version=None, ca_certs=None, ciphers=None,
+            alt_hosts=None, load_balancing='first_available',
+            host_backoff=1.0, max_host_backoff=60.0
     ):
         self.host = host
 
@@ -108,6 +162,15 @@ class Connection(object):
         else:
             self.port = port or defines.DEFAULT_PORT
 
+        hosts = [(self.host, self.port)]
+        if alt_hosts:
+            hosts.extend(parse_hosts(alt_hosts, self.port))
+
+        self.load_balancer = LoadBalancer(
+            hosts, policy=load_balancing,
+            backoff=host_backoff, max_backoff=max_host_backoff
+        )
+
         self.database = database
         self.user = user
         self.password = password
@@ -129,18 +192,27 @@ class Connection(object):
 
         self.ssl_options = ssl_options
 
+        # Method is chosen before each query.
+        self.compression_selector = None
+        if compression == 'auto':
+            self.compression_selector = CompressionSelector(
+                level=compression_level
+            )
+            compression = self.compression_selector.method
+
         # Use LZ4 compression by default.
         if compression is True:
             compression = 'lz4'
 
-        if compression is False:
-            self.compression = Compression.DISABLED
-            self.compressor_cls = None
-            self.compress_block_size = None
-        else:
-            self.compression = Compression.ENABLED
-            self.compressor_cls = get_compressor_cls(compression)
-            self.compress_block_size = compress_block_size
+        self.compress_block_size = compress_block_size
+        self.set_compression(compression)
+
+        self.compression_level = compression_level
+
+        self.decompression_threads = decompression_threads
+        self.decompression_pool = None
+        self.compression_threads = compression_threads
+        self.compression_pool = None
 
         self.socket = None
         self.fin = None
@@ -157,6 +229,35 @@ class Connection(object):
 
         super(Connection, self).__init__()
 
+    def set_compression(self, compression):
+        if compression is False:
+            self.compression = Compression.DISABLED
+            self.compressor_cls = None
+        else:
+            self.compression = Compression.ENABLED
+            self.compressor_cls = get_compressor_cls(compression)
+
+    def select_compression(self):
+        """
+        Switches compression to method chosen by measurements of previous
+        queries. Compression is enabled per query by query packet.
+        """
+        selector = self.compression_selector
+
+        # Asyncio transport doesn't block and isn't measured.
+        fout = self.fout
+        if isinstance(fout, BufferedSocketWriter):
+            selector.add_transfer(fout.bytes_sent, fout.send_time)
+            fout.bytes_sent = 0
+            fout.send_time = 0.0
+
+        if selector.update():
+            logger.debug('Compression is switched to %s', selector.method)
+
+            self.set_compression(selector.method)
+            self.block_in = self.get_block_in_stream()
+            self.block_out = self.get_block_out_stream()
+
     def get_description(self):
         return '{}:{}'.format(self.host, self.port)
 
@@ -210,14 +311,20 @@ class Connection(object):
             raise socket.error("getaddrinfo returns an empty list")
 
     def connect(self):
-        try:
-            if self.connected:
-                self.disconnect()
+        if self.connected:
+            self.disconnect()
 
-            logger.debug(
-                'Connecting. Database: %s. User: %s', self.database, self.user
-            )
+        logger.debug(
+            'Connecting. Database: %s. User: %s', self.database, self.user
+        )
+
+        for attempt in self.load_balancer.attempts():
+            with attempt:
+                self.host, self.port = attempt.host.host, attempt.host.port
+                self._init_connection()
 
+    def _init_connection(self):
+        try:
             self.socket = self._create_socket()
             self.connected = True
             self.socket.settimeout(self.send_receive_timeout)
@@ -226,7 +333,7 @@ class Connection(object):
             self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
 
             self.fin = BufferedSocketReader(self.socket, defines.BUFFER_SIZE)
-            self.fout = self.socket.makefile('wb')
+            self.fout = BufferedSocketWriter(self.socket, defines.BUFFER_SIZE)
 
             self.send_hello()
             self.receive_hello()
@@ -258,6 +365,18 @@ class Connection(object):
         self.block_in = None
         self.block_out = None
 
+        # The next connection can be established to other replica.
+        if self.compression_selector is not None:
+            self.compression_selector.reset()
+
+        if self.decompression_pool is not None:
+            self.decompression_pool.terminate()
+            self.decompression_pool = None
+
+        if self.compression_pool is not None:
+            self.compression_pool.terminate()
+            self.compression_pool = None
+
     def disconnect(self):
         """
         Closes connection between server and client.
@@ -351,6 +470,7 @@ class Connection(object):
 
     def ping(self):
         timeout = self.sync_request_timeout
+        start = time()
 
         with self.timeout_setter(timeout):
             try:
@@ -377,6 +497,9 @@ class Connection(object):
                 )
                 return False
 
+        if self.compression_selector is not None:
+            self.compression_selector.add_rtt(time() - start)
+
         return True
 
     def receive_packet(self):
@@ -423,24 +546,45 @@ class Connection(object):
         if self.compression:
             from .streams.compressed import CompressedBlockInputStream
 
-            return CompressedBlockInputStream(self.fin, self.context)
+            threads = self.decompression_threads
+            if threads and self.decompression_pool is None:
+                self.decompression_pool = ThreadPool(threads)
+
+            return CompressedBlockInputStream(
+                self.fin, self.context, pool=self.decompression_pool,
+                max_pending=threads
+            )
         else:
             from .streams.native import BlockInputStream
 
             return BlockInputStream(self.fin, self.context)
 
     def get_block_out_stream(self):
+        sampler = None
+        if self.compression_selector is not None:
+            sampler = self.compression_selector.add_sample
+
         if self.compression:
             from .streams.compressed import CompressedBlockOutputStream
 
+            threads = self.compression_threads
+            if threads and self.compression_pool is None:
+                self.compression_pool = ThreadPool(threads)
+
             return CompressedBlockOutputStream(
                 self.compressor_cls, self.compress_block_size,
-                self.fout, self.context
+                self.fout, self.context, pool=self.compression_pool,
+                max_pending=threads, compression_level=self.compression_level,
+                sampler=sampler
             )
         else:
             from .streams.native import BlockOutputStream
 
-            return BlockOutputStream(self.fout, self.context)
+            # Asyncio transport writer has no buffer to take sample from.
+            if not isinstance(self.fout, BufferedWriter):
+                sampler = None
+
+            return BlockOutputStream(self.fout, self.context, sampler=sampler)
 
     def receive_data(self):
         revision = self.server_info.revision
@@ -481,6 +625,9 @@ class Connection(object):
         if not self.connected:
             self.connect()
 
+        if self.compression_selector is not None:
+            self.select_compression()
+
         write_varint(ClientPacketTypes.QUERY, self.fout)
 
         write_binary_str(query_id or '', self.fout)
@@ -510,12 +657,12 @@ class Connection(object):
 
     def send_external_tables(self, tables, types_check=False):
         for table in tables or []:
-            block = Block(table['structure'], table['data'],
-                          types_check=types_check)
+            block = RowOrientedBlock(table['structure'], table['data'],
+                                     types_check=types_check)
             self.send_data(block, table_name=table['name'])
 
         # Empty block, end of data transfer.
-        self.send_data(Block())
+        self.send_data(ColumnOrientedBlock())
 
     @contextmanager
     def timeout_setter(self, new_timeout):
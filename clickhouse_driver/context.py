@@ -1,9 +1,29 @@
 
+from . import defines
+from .util.helpers import LRUCache
+
+
+def settings_changed(old, new, names):
+    if old is None:
+        return True
+
+    return any(old.get(name) != new.get(name) for name in names)
+
+
 class Context(object):
+    # Settings columns depend on. Other settings don't affect cached columns.
+    column_settings = ('use_client_time_zone', )
+    column_client_settings = ('strings_as_bytes', 'use_numpy', 'flat_arrays')
+
     def __init__(self):
         self._server_info = None
         self._settings = None
         self._client_settings = None
+
+        # Columns are created once per type. They depend on some settings
+        # and server info: cache is dropped when any of them is changed.
+        self.columns_cache = LRUCache(defines.COLUMNS_CACHE_SIZE)
+
         super(Context, self).__init__()
 
     @property
@@ -12,6 +32,9 @@ class Context(object):
 
     @server_info.setter
     def server_info(self, value):
+        if value is not self._server_info:
+            self.columns_cache.clear()
+
         self._server_info = value
 
     @property
@@ -20,6 +43,9 @@ class Context(object):
 
     @settings.setter
     def settings(self, value):
+        if settings_changed(self._settings, value, self.column_settings):
+            self.columns_cache.clear()
+
         self._settings = value.copy()
 
     @property
@@ -28,4 +54,8 @@ class Context(object):
 
     @client_settings.setter
     def client_settings(self, value):
+        if settings_changed(self._client_settings, value,
+                            self.column_client_settings):
+            self.columns_cache.clear()
+
         self._client_settings = value.copy()
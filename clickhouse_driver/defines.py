@@ -29,3 +29,9 @@ CLIENT_VERSION_PATCH = 3
 CLIENT_REVISION = 54406
 
 BUFFER_SIZE = 1048576
+
+# Number of column types which readers/writers are kept per connection.
+COLUMNS_CACHE_SIZE = 1024
+
+# Number of result schemas which row classes are kept for.
+RECORD_CLASSES_CACHE_SIZE = 256
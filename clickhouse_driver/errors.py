@@ -457,6 +457,14 @@ class SocketTimeoutError(Error):
     code = ErrorCodes.SOCKET_TIMEOUT
 
 
+class NoFreeConnectionError(Error):
+    code = ErrorCodes.NO_FREE_CONNECTION
+
+
+class UnknownLoadBalancingError(Error):
+    code = ErrorCodes.UNKNOWN_LOAD_BALANCING
+
+
 class UnexpectedPacketFromServerError(Error):
     code = ErrorCodes.UNEXPECTED_PACKET_FROM_SERVER
 
@@ -471,3 +479,7 @@ class CannotParseUuidError(Error):
 
 class CannotParseDomainError(Error):
     code = ErrorCodes.CANNOT_PARSE_DOMAIN_VALUE_FROM_STRING
+
+
+class ResultLimitExceededError(Error):
+    code = ErrorCodes.TOO_MANY_ROWS_OR_BYTES
@@ -0,0 +1,209 @@
+import logging
+import random
+from time import time
+
+from . import errors
+from .util import compat
+
+
+logger = logging.getLogger(__name__)
+
+
+class Host(object):
+    """
+    Replica address and its health state.
+    """
+
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+
+        # Consecutive failed connection attempts.
+        self.failures = 0
+        self.unhealthy_until = 0
+
+        # Smoothed connection establishment time. ``None`` until the first
+        # successful connection.
+        self.latency = None
+
+        super(Host, self).__init__()
+
+    def __repr__(self):
+        return '{}:{}'.format(self.host, self.port)
+
+
+def parse_hosts(hosts, default_port):
+    """
+    :param hosts: comma separated string or list of ``host[:port]`` strings
+                  or ``(host, port)`` tuples.
+    :param default_port: port of hosts specified without port.
+    :return: list of ``(host, port)`` tuples.
+    """
+    if isinstance(hosts, compat.string_types):
+        hosts = [x for x in hosts.split(',') if x.strip()]
+
+    rv = []
+    for item in hosts:
+        if isinstance(item, (list, tuple)):
+            host, port = item
+
+        else:
+            item = item.strip()
+            # IPv6 address can be wrapped in brackets: [::1]:9000.
+            if item.startswith('['):
+                host, _, port = item[1:].partition(']')
+                port = port[1:]
+
+            elif item.count(':') == 1:
+                host, port = item.split(':')
+
+            else:
+                host, port = item, None
+
+        rv.append((host, int(port) if port else default_port))
+
+    return rv
+
+
+class LoadBalancer(object):
+    """
+    Chooses order in which replicas are tried on connection. Replicas failed
+    to connect are skipped for backoff time. Backoff is doubled on each
+    consecutive failure up to ``max_backoff``. Replicas in backoff are still
+    tried after all others.
+
+    :param hosts: list of ``(host, port)`` tuples.
+    :param policy: one of :attr:`policies`.
+    :param backoff: seconds replica is skipped after first failure.
+    :param max_backoff: maximum seconds replica is skipped.
+    """
+
+    policies = ('first_available', 'random', 'round_robin', 'nearest')
+
+    # Weight of the last connection time in smoothed latency.
+    latency_weight = 0.3
+
+    def __init__(self, hosts, policy='first_available', backoff=1.0,
+                 max_backoff=60.0):
+        if policy not in self.policies:
+            raise errors.UnknownLoadBalancingError(
+                "Unknown load balancing policy: '{}'".format(policy)
+            )
+
+        self.hosts = [Host(host, port) for host, port in hosts]
+        self.policy = policy
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+
+        self.next_index = 0
+
+        super(LoadBalancer, self).__init__()
+
+    def get_hosts(self):
+        """
+        :return: list of :class:`Host` in order of connection attempts.
+        """
+        hosts = self.hosts
+
+        if self.policy == 'random':
+            hosts = random.sample(hosts, len(hosts))
+
+        elif self.policy == 'round_robin':
+            index = self.next_index % len(hosts)
+            self.next_index = index + 1
+            hosts = hosts[index:] + hosts[:index]
+
+        elif self.policy == 'nearest':
+            # Replicas with unknown latency are tried first to measure it.
+            hosts = sorted(hosts, key=lambda x: x.latency or 0)
+
+        now = time()
+        healthy = [x for x in hosts if x.unhealthy_until <= now]
+        unhealthy = [x for x in hosts if x.unhealthy_until > now]
+        unhealthy.sort(key=lambda x: x.unhealthy_until)
+
+        return healthy + unhealthy
+
+    def attempts(self):
+        """
+        Yields :class:`ConnectionAttempt` for each host in order of
+        :meth:`get_hosts` until connection succeeds. Connection must be
+        established within attempt's context:
+
+            .. code-block:: python
+
+                for attempt in balancer.attempts():
+                    with attempt:
+                        connect(attempt.host)
+
+        Error of the last attempt is raised when all hosts failed.
+        """
+        error = None
+
+        for host in self.get_hosts():
+            attempt = ConnectionAttempt(self, host)
+            yield attempt
+
+            if attempt.succeeded:
+                return
+
+            error = attempt.error
+
+        raise error
+
+    def mark_failed(self, host):
+        # Exponent is limited to not overflow float.
+        factor = 2 ** min(host.failures, 32)
+        backoff = min(self.backoff * factor, self.max_backoff)
+        host.failures += 1
+        host.unhealthy_until = time() + backoff
+
+    def mark_connected(self, host, elapsed):
+        host.failures = 0
+        host.unhealthy_until = 0
+
+        if host.latency is None:
+            host.latency = elapsed
+        else:
+            weight = self.latency_weight
+            host.latency = host.latency * (1 - weight) + elapsed * weight
+
+
+class ConnectionAttempt(object):
+    """
+    Context of connection to one host. Host is marked as connected when
+    context is left without errors. Network errors mark host as failed and
+    are suppressed to try the next host, other errors are propagated.
+
+    :param balancer: :class:`LoadBalancer` host belongs to.
+    :param host: :class:`Host` to connect to.
+    """
+
+    def __init__(self, balancer, host):
+        self.balancer = balancer
+        self.host = host
+
+        self.start = None
+        self.succeeded = False
+        self.error = None
+
+        super(ConnectionAttempt, self).__init__()
+
+    def __enter__(self):
+        self.start = time()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.balancer.mark_connected(self.host, time() - self.start)
+            self.succeeded = True
+            return False
+
+        if issubclass(exc_type,
+                      (errors.SocketTimeoutError, errors.NetworkError)):
+            logger.warning('Failed to connect to %s: %s', self.host, exc_val)
+            self.balancer.mark_failed(self.host)
+            self.error = exc_val
+            return True
+
+        return False
@@ -0,0 +1,83 @@
+from __future__ import absolute_import
+
+import numpy as np
+
+try:
+    import pandas as pd
+except ImportError:
+    raise RuntimeError('Package pandas is required to use DataFrames')
+
+
+def column_to_series_data(column):
+    if isinstance(column, np.ma.MaskedArray):
+        kind = column.dtype.kind
+
+        # Integers have no NaN. Use pandas nullable integers.
+        if kind in 'iu':
+            return pd.arrays.IntegerArray(
+                np.ma.getdata(column), np.ma.getmaskarray(column)
+            )
+
+        elif kind == 'M':
+            return column.filled(np.datetime64('NaT'))
+
+        return column.filled(np.nan)
+
+    elif isinstance(column, tuple):
+        return list(column)
+
+    return column
+
+
+def columns_to_dataframe(columns, names):
+    data = [column_to_series_data(column) for column in columns]
+
+    # Names are assigned afterwards to keep duplicate names.
+    dataframe = pd.DataFrame(dict(enumerate(data)), columns=range(len(data)))
+    dataframe.columns = names
+    return dataframe
+
+
+def series_to_column(series):
+    if isinstance(series.dtype, pd.DatetimeTZDtype):
+        # Offset-aware datetimes are sent as UTC timestamps.
+        utc = series.dt.tz_convert('UTC').dt.tz_localize(None)
+        return utc.values.astype('datetime64[s]').astype(np.int64)
+
+    values = series.values
+    if isinstance(values, pd.Categorical):
+        return values
+
+    nulls_map = series.isnull().values
+
+    numpy_dtype = getattr(series.dtype, 'numpy_dtype', None)
+    if numpy_dtype is not None and numpy_dtype.kind in 'iufb':
+        # Nullable extension arrays: Int64, Float64, boolean.
+        data = values.to_numpy(dtype=numpy_dtype, na_value=0)
+
+    elif not nulls_map.any():
+        return np.asarray(values)
+
+    elif isinstance(values, np.ndarray) and values.dtype.kind in 'fM':
+        data = values
+
+    else:
+        # Generic columns expect None for NULL.
+        return [
+            None if is_null else x for x, is_null in zip(values, nulls_map)
+        ]
+
+    if nulls_map.any():
+        return np.ma.masked_array(data, mask=nulls_map)
+
+    return data
+
+
+def dataframe_to_columns(dataframe, names):
+    missing = [name for name in names if name not in dataframe.columns]
+    if missing:
+        raise ValueError(
+            'DataFrame missing required columns: {}'.format(missing)
+        )
+
+    return [series_to_column(dataframe[name]) for name in names]
@@ -0,0 +1,69 @@
+from __future__ import absolute_import
+from itertools import chain
+
+import numpy as np
+
+from ..columns.arraycolumn import FlatArrays
+from ..result import QueryResult
+
+
+class NumpyQueryResult(QueryResult):
+    """
+    Stores query result from multiple blocks as :class:`numpy.ndarray`.
+    """
+
+    def store(self, packet):
+        block = getattr(packet, 'block', None)
+        if block is None:
+            return
+
+        # Header block contains no rows. Pick columns from it.
+        if block.rows:
+            self.check_limits(block)
+
+            if self.columnar:
+                # Columns are concatenated once in get_result.
+                self.data.append(block.get_columns())
+            else:
+                self.data.extend(block.get_rows(self.row_type))
+
+        elif not self.columns_with_types:
+            self.columns_with_types = block.columns_with_types
+
+    def get_result(self):
+        """
+        :return: Stored query result.
+        """
+
+        for packet in self.packet_generator:
+            self.store(packet)
+
+        if self.columnar:
+            data = []
+            # Transpose to a list of columns, each column is list of chunks.
+            for column_chunks in zip(*self.data):
+                first_chunk = column_chunks[0]
+
+                if isinstance(first_chunk, np.ma.MaskedArray):
+                    column = np.ma.concatenate(column_chunks)
+                elif isinstance(first_chunk, np.ndarray):
+                    column = np.concatenate(column_chunks)
+                elif isinstance(first_chunk, FlatArrays):
+                    column = FlatArrays.concat(column_chunks)
+                elif hasattr(first_chunk, 'categories'):
+                    # Enum and LowCardinality columns are read into
+                    # pandas.Categorical only when pandas is installed.
+                    from pandas.api.types import union_categoricals
+
+                    column = union_categoricals(column_chunks)
+                else:
+                    column = tuple(chain.from_iterable(column_chunks))
+
+                data.append(column)
+        else:
+            data = self.data
+
+        if self.with_column_types:
+            return data, self.columns_with_types
+        else:
+            return data
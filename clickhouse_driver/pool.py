@@ -0,0 +1,203 @@
+import logging
+import threading
+from contextlib import contextmanager
+from time import time
+
+from . import errors
+from .client import Client
+
+logger = logging.getLogger(__name__)
+
+
+class ClientPool(object):
+    """
+    Thread-safe pool of :class:`~clickhouse_driver.Client` instances.
+    Each client owns one connection which is kept open between queries, so
+    connection establishment and handshake are done once per client.
+
+    Positional and keyword arguments not listed below are passed to
+    :class:`~clickhouse_driver.Client` as is. Pool serves one host: create a
+    pool per host to limit number of connections to each of them.
+
+    :param min_size: number of clients which connections are never closed
+                     by idle timeout. They are connected when pool is
+                     created. Defaults to ``0``.
+    :param max_size: maximum number of clients. :meth:`get_client` waits for
+                     a free client when all of them are in use.
+                     Defaults to ``10``.
+    :param idle_timeout: close connections of clients which were not used
+                         for this number of seconds. Idle clients are
+                         checked when clients are taken and returned.
+                         Defaults to ``None`` (connections are kept open).
+
+    Liveness of connection is checked by ping before each query as usual.
+    Broken connections are reestablished on next query.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.min_size = kwargs.pop('min_size', 0)
+        self.max_size = kwargs.pop('max_size', 10)
+        self.idle_timeout = kwargs.pop('idle_timeout', None)
+
+        if self.max_size < 1 or self.min_size > self.max_size:
+            raise ValueError(
+                'Expected 0 <= min_size <= max_size and max_size >= 1'
+            )
+
+        self.client_args = args
+        self.client_kwargs = kwargs
+
+        self.condition = threading.Condition()
+
+        # Free clients with their release time. The most recently used
+        # client is the last one.
+        self.idle = []
+        self.size = 0
+
+        super(ClientPool, self).__init__()
+
+        try:
+            # Connections are established beforehand, so the first queries
+            # don't wait for handshake.
+            for _ in range(self.min_size):
+                client = self.create_client()
+                self.idle.append((client, time()))
+                self.size += 1
+                client.connection.force_connect()
+
+        except Exception:
+            self.disconnect()
+            raise
+
+    def create_client(self):
+        return Client(*self.client_args, **self.client_kwargs)
+
+    def acquire(self, timeout=None):
+        """
+        Takes client from the pool. Client must be returned with
+        :meth:`release`.
+
+        :param timeout: seconds to wait for free client.
+                        Defaults to ``None`` (wait forever).
+        :return: :class:`~clickhouse_driver.Client` instance.
+        """
+        deadline = time() + timeout if timeout is not None else None
+        client = None
+        expired = []
+
+        with self.condition:
+            while True:
+                # Clients that were idle for too long are closed instead
+                # of being reused.
+                expired.extend(self.pop_expired())
+
+                if self.idle:
+                    client, _ = self.idle.pop()
+                    break
+
+                if self.size < self.max_size:
+                    # Client is created outside of lock.
+                    self.size += 1
+                    break
+
+                remaining = None
+                if deadline is not None:
+                    remaining = deadline - time()
+                    if remaining <= 0:
+                        raise errors.NoFreeConnectionError(
+                            'No free client in pool of {} clients'.format(
+                                self.max_size
+                            )
+                        )
+
+                self.condition.wait(remaining)
+
+        for expired_client in expired:
+            expired_client.disconnect()
+
+        if client is not None:
+            return client
+
+        try:
+            return self.create_client()
+
+        except Exception:
+            with self.condition:
+                self.size -= 1
+                self.condition.notify()
+            raise
+
+    def release(self, client):
+        """
+        Returns client taken by :meth:`acquire` back to the pool.
+
+        :param client: :class:`~clickhouse_driver.Client` instance.
+        """
+        with self.condition:
+            self.idle.append((client, time()))
+            expired = self.pop_expired()
+            self.condition.notify()
+
+        for expired_client in expired:
+            expired_client.disconnect()
+
+    def pop_expired(self):
+        if self.idle_timeout is None:
+            return []
+
+        expired = []
+        threshold = time() - self.idle_timeout
+
+        # The least recently used clients are the first ones.
+        while self.idle and self.size > self.min_size:
+            client, released_at = self.idle[0]
+            if released_at > threshold:
+                break
+
+            self.idle.pop(0)
+            self.size -= 1
+            expired.append(client)
+
+        if expired:
+            logger.debug('Closing %d idle clients', len(expired))
+
+        return expired
+
+    @contextmanager
+    def get_client(self, timeout=None):
+        """
+        Context manager that takes client from the pool and returns it back
+        on exit.
+
+            .. code-block:: python
+
+                >>> with pool.get_client() as client:
+                ...     client.execute('SELECT 1')
+
+        :param timeout: seconds to wait for free client.
+                        Defaults to ``None`` (wait forever).
+        """
+        client = self.acquire(timeout=timeout)
+        try:
+            yield client
+        finally:
+            self.release(client)
+
+    def execute(self, *args, **kwargs):
+        """
+        Executes query with free client. Accepts the same arguments as
+        :meth:`~clickhouse_driver.Client.execute`. Use :meth:`get_client`
+        for streaming and progress results that use connection after
+        this method returns.
+        """
+        with self.get_client() as client:
+            return client.execute(*args, **kwargs)
+
+    def disconnect(self):
+        """
+        Closes connections of all free clients. Clients in use are not
+        affected.
+        """
+        with self.condition:
+            for client, _ in self.idle:
+                client.disconnect()
@@ -19,7 +19,7 @@ def read_binary_bytes_fixed_len(buf, length):
     return buf.read(length)
 
 
-def read_varint(f):
+def py_read_varint(f):
     """
     Reads integer of variable length using LEB128.
     """
@@ -27,6 +27,9 @@ def read_varint(f):
     result = 0
 
     while True:
+        if shift > 63:
+            raise ValueError('Varint is longer than 10 bytes')
+
         i = f.read_one()
         result |= (i & 0x7f) << shift
         shift += 7
@@ -36,6 +39,12 @@ def read_varint(f):
     return result
 
 
+try:
+    from .speedups.varint import read_varint
+except ImportError:
+    read_varint = py_read_varint
+
+
 def read_binary_int(buf, fmt):
     """
     Reads int from buffer with provided format.
@@ -1,23 +1,84 @@
+import mmap
+from tempfile import TemporaryFile
+
+from . import errors
+from .block import RowsView
 from .progress import Progress
+from .util import compat
+from .util.helpers import estimate_item_size
 
 
 class QueryResult(object):
     """
     Stores query result from multiple blocks.
+
+    :param row_type: type of rows: ``'tuple'``, ``'namedtuple'`` or
+                     ``'dict'``. Ignored for columnar result.
+    :param max_rows: maximum number of stored rows.
+    :param max_bytes: maximum estimated size of stored data in bytes.
+    :param cancel: function that sends cancel request to server. It's called
+                   when one of limits is exceeded, rest of packets is
+                   skipped and
+                   :class:`~clickhouse_driver.errors.ResultLimitExceededError`
+                   is raised.
     """
 
     def __init__(
             self, packet_generator,
-            with_column_types=False, columnar=False):
+            with_column_types=False, columnar=False, row_type='tuple',
+            max_rows=None, max_bytes=None, cancel=None):
         self.packet_generator = packet_generator
         self.with_column_types = with_column_types
+        self.row_type = row_type
 
         self.data = []
         self.columns_with_types = []
         self.columnar = columnar
 
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self.cancel = cancel
+        self.rows = 0
+        self.bytes = 0
+
         super(QueryResult, self).__init__()
 
+    def check_limits(self, block):
+        """
+        Counts rows and estimated size of received block before it's stored.
+        """
+        max_rows, max_bytes = self.max_rows, self.max_bytes
+        if max_rows is None and max_bytes is None:
+            return
+
+        self.rows += block.rows
+        if max_bytes is not None:
+            self.bytes += block.rows * sum(
+                estimate_item_size(x) for x in block.get_columns()
+            )
+
+        if max_rows is not None and self.rows > max_rows:
+            message = 'Result exceeds max_stored_rows: {} rows > {}'.format(
+                self.rows, max_rows
+            )
+
+        elif max_bytes is not None and self.bytes > max_bytes:
+            message = 'Result exceeds max_stored_bytes: ' \
+                      '~{} bytes > {}'.format(self.bytes, max_bytes)
+
+        else:
+            return
+
+        if self.cancel is not None:
+            self.cancel()
+
+        # Server still sends packets until END_OF_STREAM after cancel.
+        # Connection can be used for the next query after that.
+        for _ in self.packet_generator:
+            pass
+
+        raise errors.ResultLimitExceededError(message)
+
     def store(self, packet):
         block = getattr(packet, 'block', None)
         if block is None:
@@ -25,6 +86,8 @@ class QueryResult(object):
 
         # Header block contains no rows. Pick columns from it.
         if block.rows:
+            self.check_limits(block)
+
             if self.columnar:
                 columns = block.get_columns()
                 if self.data:
@@ -34,7 +97,7 @@ class QueryResult(object):
                 else:
                     self.data.extend(columns)
             else:
-                self.data.extend(block.get_rows())
+                self.data.extend(block.get_rows(self.row_type))
 
         elif not self.columns_with_types:
             self.columns_with_types = block.columns_with_types
@@ -61,11 +124,13 @@ class ProgressQueryResult(QueryResult):
 
     def __init__(
             self, packet_generator,
-            with_column_types=False, columnar=False):
+            with_column_types=False, columnar=False, row_type='tuple',
+            max_rows=None, max_bytes=None, cancel=None):
         self.progress_totals = Progress()
 
         super(ProgressQueryResult, self).__init__(
-            packet_generator, with_column_types, columnar
+            packet_generator, with_column_types, columnar, row_type,
+            max_rows=max_rows, max_bytes=max_bytes, cancel=cancel
         )
 
     def store_progress(self, progress_packet):
@@ -97,6 +162,163 @@ class ProgressQueryResult(QueryResult):
         return super(ProgressQueryResult, self).get_result()
 
 
+class SpillingQueryResult(QueryResult):
+    """
+    Writes columns of received blocks to temporary file instead of keeping
+    them in memory. Result is returned as :class:`SpilledResult`.
+
+    With ``use_numpy`` setting blocks are spilled as read by NumPy columns.
+    Columns of blocks are not concatenated: :class:`SpilledResult` yields
+    arrays of each block.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.file = TemporaryFile()
+        self.offsets = [0]
+        self.spilled_rows = 0
+
+        super(SpillingQueryResult, self).__init__(*args, **kwargs)
+
+    def store(self, packet):
+        block = getattr(packet, 'block', None)
+        if block is None:
+            return
+
+        # Header block contains no rows. Pick columns from it.
+        if block.rows:
+            self.check_limits(block)
+
+            compat.pickle.dump(
+                block.get_columns(), self.file, compat.pickle.HIGHEST_PROTOCOL
+            )
+            self.offsets.append(self.file.tell())
+            self.spilled_rows += block.rows
+
+        elif not self.columns_with_types:
+            self.columns_with_types = block.columns_with_types
+
+    def get_result(self):
+        """
+        :return: :class:`SpilledResult` with stored query result.
+        """
+
+        try:
+            for packet in self.packet_generator:
+                self.store(packet)
+
+            # Buffered data must be in file before it's mapped.
+            self.file.flush()
+
+        except Exception:
+            self.file.close()
+            raise
+
+        rv = SpilledResult(
+            self.file, self.offsets, self.columns_with_types,
+            self.spilled_rows, row_type=self.row_type, columnar=self.columnar
+        )
+
+        if self.with_column_types:
+            return rv, self.columns_with_types
+        else:
+            return rv
+
+
+class SpilledResult(object):
+    """
+    Query result stored in temporary file. File is memory-mapped and only
+    one block is kept in memory during iteration. Result can be iterated
+    many times after connection is used by other queries.
+
+    Temporary file is removed on :meth:`close` or when result is garbage
+    collected. Result can be used as context manager.
+
+    :param file: temporary file with pickled columns of blocks.
+    :param offsets: positions of blocks in file and file size.
+    :param columns_with_types: list of ``(name, type)`` of columns.
+    :param rows: number of rows.
+    :param row_type: type of rows: ``'tuple'``, ``'namedtuple'`` or
+                     ``'dict'``. Ignored for columnar result.
+    :param columnar: iterate over blocks in columnar form as
+                     :meth:`iter_columns` does instead of rows.
+    """
+
+    def __init__(self, file, offsets, columns_with_types, rows,
+                 row_type='tuple', columnar=False):
+        self.file = file
+        self.offsets = offsets
+        self.columns_with_types = columns_with_types
+        self.rows = rows
+        self.row_type = row_type
+        self.columnar = columnar
+
+        # Empty file can't be mapped.
+        self.map = None
+        if offsets[-1]:
+            self.map = mmap.mmap(
+                file.fileno(), offsets[-1], access=mmap.ACCESS_READ
+            )
+
+        super(SpilledResult, self).__init__()
+
+    def __len__(self):
+        return self.rows
+
+    def __iter__(self):
+        if self.columnar:
+            return self.iter_columns()
+
+        return self.iter_rows()
+
+    def iter_rows(self):
+        """
+        Iterates over rows of result.
+        """
+        names = [x[0] for x in self.columns_with_types]
+
+        for columns in self.iter_columns():
+            rows = RowsView(columns, row_type=self.row_type, names=names)
+            for row in rows:
+                yield row
+
+    def iter_columns(self):
+        """
+        Iterates over blocks of result in columnar form.
+
+        :return: iterator of lists of columns.
+        """
+        if self.file.closed:
+            raise ValueError('Result is closed')
+
+        for offset in self.offsets[:-1]:
+            # Block is unpickled from mapped file as is, without copying
+            # it to bytes first. Position is set on each step: result can
+            # be iterated by a few iterators at once.
+            self.map.seek(offset)
+            yield compat.pickle.load(self.map)
+
+    def close(self):
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class SpillingProgressQueryResult(ProgressQueryResult, SpillingQueryResult):
+    """
+    Writes columns of received blocks to temporary file and provides
+    iteration over query progress. Result is returned as
+    :class:`SpilledResult`.
+    """
+
+
 class IterQueryResult(object):
     """
     Provides iteration over returned data by chunks (streaming by chunks).
@@ -104,9 +326,10 @@ class IterQueryResult(object):
 
     def __init__(
             self, packet_generator,
-            with_column_types=False):
+            with_column_types=False, row_type='tuple'):
         self.packet_generator = packet_generator
         self.with_column_types = with_column_types
+        self.row_type = row_type
 
         self.first_block = True
         super(IterQueryResult, self).__init__()
@@ -123,10 +346,10 @@ class IterQueryResult(object):
         if self.first_block and self.with_column_types:
             self.first_block = False
             rv = [block.columns_with_types]
-            rv.extend(block.get_rows())
+            rv.extend(block.get_rows(self.row_type))
             return rv
         else:
-            return block.get_rows()
+            return list(block.get_rows(self.row_type))
 
     # For Python 3.
     __next__ = next
@@ -254,6 +254,9 @@ settings = {
     'low_cardinality_max_dictionary_size': SettingUInt64,
     'low_cardinality_use_single_dictionary_for_part': SettingBool,
     'allow_experimental_low_cardinality_type': SettingBool,
+    'low_cardinality_allow_in_native_format': SettingBool,
+    'allow_experimental_map_type': SettingBool,
+    'flatten_nested': SettingBool,
     'allow_experimental_decimal_type': SettingBool,
     'decimal_check_overflow': SettingBool,
     'prefer_localhost_replica': SettingBool,
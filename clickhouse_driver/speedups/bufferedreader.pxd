@@ -0,0 +1,6 @@
+cdef class BufferedReader:
+    cdef public bytearray buffer
+    cdef public object buffer_view
+    cdef public Py_ssize_t position, current_buffer_size
+
+    cdef int _read_byte(self) except -1
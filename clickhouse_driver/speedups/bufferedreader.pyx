@@ -0,0 +1,182 @@
+from cpython.bytearray cimport (
+    PyByteArray_AS_STRING, PyByteArray_FromStringAndSize
+)
+from cpython.bytes cimport PyBytes_AS_STRING, PyBytes_FromStringAndSize
+from cpython.list cimport PyList_New, PyList_SET_ITEM
+from cpython.ref cimport Py_INCREF
+from cpython.unicode cimport PyUnicode_DecodeUTF8
+from libc.string cimport memcpy
+
+
+cdef class BufferedReader:
+    """
+    Compiled counterpart of
+    :class:`~clickhouse_driver.bufferedreader.PyBufferedReader`.
+    Subclasses implement ``read_into_buffer`` in Python.
+    """
+
+    def __init__(self, Py_ssize_t bufsize):
+        self.buffer = bytearray(bufsize)
+        self.buffer_view = memoryview(self.buffer)
+
+        self.position = 0
+        self.current_buffer_size = 0
+
+        super(BufferedReader, self).__init__()
+
+    def read_into_buffer(self):
+        raise NotImplementedError
+
+    cdef int _read_byte(self) except -1:
+        cdef unsigned char b
+
+        if self.position == self.current_buffer_size:
+            self.read_into_buffer()
+            self.position = 0
+
+        b = <unsigned char> PyByteArray_AS_STRING(self.buffer)[self.position]
+        self.position += 1
+        return b
+
+    def read(self, Py_ssize_t unread):
+        cdef Py_ssize_t next_position = unread + self.position
+        cdef Py_ssize_t read_bytes, rv_position = 0
+        cdef char* rv_ptr
+
+        if next_position < self.current_buffer_size:
+            rv = PyByteArray_FromStringAndSize(
+                PyByteArray_AS_STRING(self.buffer) + self.position, unread
+            )
+            self.position = next_position
+            return rv
+
+        rv = PyByteArray_FromStringAndSize(NULL, unread)
+        rv_ptr = PyByteArray_AS_STRING(rv)
+
+        while unread > 0:
+            if self.position == self.current_buffer_size:
+                self.read_into_buffer()
+                self.position = 0
+
+            read_bytes = min(unread, self.current_buffer_size - self.position)
+            memcpy(
+                rv_ptr + rv_position,
+                PyByteArray_AS_STRING(self.buffer) + self.position,
+                read_bytes
+            )
+            self.position += read_bytes
+            rv_position += read_bytes
+            unread -= read_bytes
+
+        return rv
+
+    def read_into(self, bytearray buffer, Py_ssize_t offset, Py_ssize_t size):
+        cdef Py_ssize_t read_bytes
+        cdef char* buffer_ptr = PyByteArray_AS_STRING(buffer)
+
+        if offset < 0 or size < 0 or offset + size > len(buffer):
+            raise ValueError('Buffer is too small')
+
+        while size > 0:
+            if self.position == self.current_buffer_size:
+                self.read_into_buffer()
+                self.position = 0
+
+            read_bytes = min(size, self.current_buffer_size - self.position)
+            memcpy(
+                buffer_ptr + offset,
+                PyByteArray_AS_STRING(self.buffer) + self.position,
+                read_bytes
+            )
+            self.position += read_bytes
+            offset += read_bytes
+            size -= read_bytes
+
+    def read_one(self):
+        return self._read_byte()
+
+    def read_strings(self, Py_ssize_t n_items, decode=None):
+        """
+        Python has great overhead between function calls.
+        We inline strings reading logic here to avoid this overhead.
+        """
+        items = PyList_New(n_items)
+
+        # Buffer fields are copied into locals and restored after
+        # ``read_into_buffer`` that can override them.
+        cdef char* buffer_ptr = PyByteArray_AS_STRING(self.buffer)
+        cdef Py_ssize_t position = self.position
+        cdef Py_ssize_t current_buffer_size = self.current_buffer_size
+
+        cdef Py_ssize_t i, size, shift, copied, right
+        cdef unsigned char b
+        cdef char* rv_ptr
+        cdef object rv
+        cdef bint do_decode = bool(decode)
+
+        for i in range(n_items):
+            shift = size = 0
+
+            # Read string size
+            while True:
+                if position == current_buffer_size:
+                    self.read_into_buffer()
+                    buffer_ptr = PyByteArray_AS_STRING(self.buffer)
+                    current_buffer_size = self.current_buffer_size
+                    position = 0
+
+                b = buffer_ptr[position]
+                position += 1
+
+                size |= (b & 0x7f) << shift
+                if b < 0x80:
+                    break
+
+                shift += 7
+
+            right = position + size
+
+            if right > current_buffer_size:
+                # String spans over several buffers.
+                rv = PyBytes_FromStringAndSize(NULL, size)
+                rv_ptr = PyBytes_AS_STRING(rv)
+                copied = 0
+
+                while True:
+                    right = min(size - copied, current_buffer_size - position)
+                    memcpy(rv_ptr + copied, buffer_ptr + position, right)
+                    position += right
+                    copied += right
+
+                    if copied == size:
+                        break
+
+                    self.read_into_buffer()
+                    buffer_ptr = PyByteArray_AS_STRING(self.buffer)
+                    current_buffer_size = self.current_buffer_size
+                    position = 0
+
+            else:
+                rv_ptr = buffer_ptr + position
+                position = right
+                rv = None
+
+            if do_decode:
+                try:
+                    rv = PyUnicode_DecodeUTF8(rv_ptr, size, NULL)
+                except UnicodeDecodeError:
+                    # Do nothing. Just return bytes.
+                    if rv is None:
+                        rv = PyBytes_FromStringAndSize(rv_ptr, size)
+
+            elif rv is None:
+                rv = PyBytes_FromStringAndSize(rv_ptr, size)
+
+            Py_INCREF(rv)
+            PyList_SET_ITEM(items, i, rv)
+
+        # Restore self-variables.
+        self.position = position
+        self.current_buffer_size = current_buffer_size
+
+        return items
@@ -0,0 +1,6 @@
+cdef class BufferedWriter:
+    cdef public bytearray buffer
+    cdef public object buffer_view
+    cdef public Py_ssize_t position, bufsize
+
+    cdef int _write_varint(self, unsigned long long number) except -1
@@ -0,0 +1,134 @@
+from cpython.bytearray cimport PyByteArray_AS_STRING, PyByteArray_GET_SIZE
+from cpython.bytes cimport (
+    PyBytes_AS_STRING, PyBytes_FromStringAndSize, PyBytes_GET_SIZE
+)
+from cpython.unicode cimport PyUnicode_AsUTF8String
+from libc.string cimport memcpy
+
+
+cdef class BufferedWriter:
+    """
+    Compiled counterpart of
+    :class:`~clickhouse_driver.bufferedwriter.PyBufferedWriter`.
+    Subclasses implement ``write_into_stream`` in Python.
+    """
+
+    def __init__(self, Py_ssize_t bufsize):
+        self.buffer = bytearray(bufsize)
+        self.buffer_view = memoryview(self.buffer)
+
+        self.position = 0
+        self.bufsize = bufsize
+
+        super(BufferedWriter, self).__init__()
+
+    def write_into_stream(self, chunks):
+        raise NotImplementedError
+
+    cdef int _write_varint(self, unsigned long long number) except -1:
+        cdef unsigned char num_buf[10]
+        cdef Py_ssize_t i = 0
+
+        while number >= 0x80:
+            num_buf[i] = (number & 0x7f) | 0x80
+            i += 1
+            number >>= 7
+
+        num_buf[i] = number
+        i += 1
+
+        if self.position + i <= self.bufsize:
+            memcpy(
+                PyByteArray_AS_STRING(self.buffer) + self.position,
+                num_buf, i
+            )
+            self.position += i
+        else:
+            self.write(PyBytes_FromStringAndSize(<char *> num_buf, i))
+
+        return 0
+
+    def write(self, data):
+        cdef const char* data_ptr
+        cdef Py_ssize_t size, free
+
+        if isinstance(data, bytes):
+            data_ptr = PyBytes_AS_STRING(data)
+            size = PyBytes_GET_SIZE(data)
+
+        elif isinstance(data, bytearray):
+            data_ptr = PyByteArray_AS_STRING(data)
+            size = PyByteArray_GET_SIZE(data)
+
+        else:
+            self._write_buffer(data)
+            return
+
+        if self.position + size <= self.bufsize:
+            memcpy(
+                PyByteArray_AS_STRING(self.buffer) + self.position,
+                data_ptr, size
+            )
+            self.position += size
+
+        elif size > self.bufsize // 2:
+            self.write_into_stream([self.buffer_view[:self.position], data])
+            self.position = 0
+
+        else:
+            # Buffer is filled up to be sent by full pieces.
+            free = self.bufsize - self.position
+            memcpy(
+                PyByteArray_AS_STRING(self.buffer) + self.position,
+                data_ptr, free
+            )
+            self.position = self.bufsize
+            self.flush()
+
+            memcpy(PyByteArray_AS_STRING(self.buffer), data_ptr + free,
+                   size - free)
+            self.position = size - free
+
+    def _write_buffer(self, data):
+        # Other objects supporting buffer protocol, e.g. memoryview.
+        cdef Py_ssize_t size = len(data)
+
+        if self.position + size <= self.bufsize:
+            self.buffer_view[self.position:self.position + size] = data
+            self.position += size
+
+        else:
+            self.write_into_stream([self.buffer_view[:self.position], data])
+            self.position = 0
+
+    def write_strings(self, items, bint encode=False):
+        cdef Py_ssize_t size
+
+        for value in items:
+            if encode and not isinstance(value, bytes):
+                value = PyUnicode_AsUTF8String(value)
+
+            if not isinstance(value, bytes):
+                self._write_varint(len(value))
+                self.write(value)
+                continue
+
+            size = PyBytes_GET_SIZE(value)
+            self._write_varint(size)
+
+            if self.position + size <= self.bufsize:
+                memcpy(
+                    PyByteArray_AS_STRING(self.buffer) + self.position,
+                    PyBytes_AS_STRING(value), size
+                )
+                self.position += size
+            else:
+                self.write(value)
+
+    def flush(self):
+        if self.position:
+            self.write_into_stream([self.buffer_view[:self.position]])
+            self.position = 0
+
+    def close(self):
+        self.position = 0
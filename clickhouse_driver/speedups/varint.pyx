@@ -0,0 +1,77 @@
+from cpython.bytes cimport PyBytes_FromStringAndSize
+
+from .bufferedreader cimport BufferedReader
+from .bufferedwriter cimport BufferedWriter
+
+
+def read_varint(f):
+    """
+    Reads integer of variable length using LEB128.
+    """
+    cdef BufferedReader reader
+    cdef unsigned long long result = 0
+    cdef unsigned int shift = 0
+    cdef int i
+
+    if not isinstance(f, BufferedReader):
+        # Any other object with read_one method.
+        return _read_varint(f)
+
+    reader = <BufferedReader> f
+
+    while True:
+        # 64-bit integer takes at most 10 bytes. Longer input is malformed
+        # and shifting by 64 bits or more is undefined.
+        if shift > 63:
+            raise ValueError('Varint is longer than 10 bytes')
+
+        i = reader._read_byte()
+        result |= (<unsigned long long> (i & 0x7f)) << shift
+        shift += 7
+        if i < 0x80:
+            break
+
+    return result
+
+
+def _read_varint(f):
+    shift = 0
+    result = 0
+
+    while True:
+        if shift > 63:
+            raise ValueError('Varint is longer than 10 bytes')
+
+        i = f.read_one()
+        result |= (i & 0x7f) << shift
+        shift += 7
+        if i < 0x80:
+            break
+
+    return result
+
+
+def write_varint(unsigned long long number, buf):
+    """
+    Writes integer of variable length using LEB128.
+    """
+    cdef unsigned char num_buf[10]
+    cdef Py_ssize_t i = 0
+
+    if isinstance(buf, BufferedWriter):
+        # Encoded right into writer's buffer.
+        (<BufferedWriter> buf)._write_varint(number)
+        return
+
+    while True:
+        towrite = number & 0x7f
+        number >>= 7
+        if number:
+            num_buf[i] = towrite | 0x80
+            i += 1
+        else:
+            num_buf[i] = towrite
+            i += 1
+            break
+
+    buf.write(PyBytes_FromStringAndSize(<char *> num_buf, i))
@@ -1,7 +1,8 @@
-from io import BytesIO
+from collections import deque
+from struct import Struct
 
 try:
-    from clickhouse_cityhash.cityhash import CityHash128
+    from clickhouse_cityhash.cityhash import CityHash128  # noqa: F401
 except ImportError:
     raise RuntimeError(
         'Package clickhouse-cityhash is required to use compression'
@@ -9,81 +10,221 @@ except ImportError:
 
 from .native import BlockOutputStream, BlockInputStream
 from ..bufferedreader import CompressedBufferedReader
+from ..bufferedwriter import CompressedBufferedWriter
 from ..compression import get_decompressor_cls
-from .. import defines
+from .. import defines, errors
 from ..reader import read_binary_uint8, read_binary_uint128
-from ..writer import write_binary_uint8, write_binary_uint128
+from ..writer import write_binary_uint128
 
 
 class CompressedBlockOutputStream(BlockOutputStream):
-    def __init__(self, compressor_cls, compress_block_size, fout, context):
+    """
+    Compresses block by frames of ``compress_block_size`` bytes as it's
+    serialized. Only one frame is kept in memory.
+
+    :param pool: :class:`~multiprocessing.pool.ThreadPool` to compress
+                 frames on. Defaults to ``None`` (frames are compressed
+                 in writing thread).
+    :param max_pending: maximum number of frames being compressed by pool.
+                        Frames are written in order as they are ready.
+    :param compression_level: default level of compression. Query's
+                              ``compression_level`` setting takes
+                              precedence.
+    :param sampler: function that is called with uncompressed tail of each
+                    block.
+    """
+
+    def __init__(self, compressor_cls, compress_block_size, fout, context,
+                 pool=None, max_pending=0, compression_level=None,
+                 sampler=None):
         self.compressor_cls = compressor_cls
         self.compress_block_size = compress_block_size
         self.raw_fout = fout
+        self.pool = pool
+        self.max_pending = max_pending
+        self.pending = deque()
+        self.compression_level = compression_level
 
-        self.compressor = self.compressor_cls()
-        super(CompressedBlockOutputStream, self).__init__(self.compressor,
-                                                          context)
+        # Compressor is reused by all blocks of connection.
+        self.compressor = self.compressor_cls(level=compression_level)
+        fout = CompressedBufferedWriter(self.write_frame, compress_block_size)
+        super(CompressedBlockOutputStream, self).__init__(fout, context,
+                                                          sampler=sampler)
 
     def reset(self):
-        self.compressor = self.compressor_cls()
-        self.fout = self.compressor
+        self.pending.clear()
 
-    def get_compressed_hash(self, data):
-        return CityHash128(data)
+    def write(self, block):
+        level = self.context.client_settings['compression_level']
+        if level is None:
+            level = self.compression_level
 
-    def finalize(self):
-        compressed = self.get_compressed()
-        compressed_size = len(compressed)
+        # Frames of previous block are already compressed.
+        self.compressor.level = level
+        super(CompressedBlockOutputStream, self).write(block)
 
-        compressed_hash = self.get_compressed_hash(compressed)
-        write_binary_uint128(compressed_hash, self.raw_fout)
+    def write_frame(self, data):
+        if self.pool is None:
+            self.write_compressed(*self.compressor.compress_frame(data))
+            return
 
-        block_size = self.compress_block_size
+        if len(self.pending) >= self.max_pending:
+            self.write_compressed(*self.pending.popleft().get())
 
-        i = 0
-        while i < compressed_size:
-            self.raw_fout.write(compressed[i:i + block_size])
-            i += block_size
+        # Writer's buffer is filled with the next frame meanwhile.
+        self.pending.append(self.pool.apply_async(
+            self.compressor.compress_frame, (data.tobytes(), )
+        ))
 
-        self.raw_fout.flush()
+    def write_compressed(self, compressed_hash, frame):
+        write_binary_uint128(compressed_hash, self.raw_fout)
+        self.raw_fout.write(frame)
 
-    def get_compressed(self):
-        compressed = BytesIO()
+    def finalize(self):
+        self.sample()
 
-        if self.compressor.method_byte is not None:
-            write_binary_uint8(self.compressor.method_byte, compressed)
-            extra_header_size = 1  # method
-        else:
-            extra_header_size = 0
+        # The last frame of block.
+        self.fout.flush()
+
+        while self.pending:
+            self.write_compressed(*self.pending.popleft().get())
+
+        self.raw_fout.flush()
 
-        data = self.compressor.get_compressed_data(extra_header_size)
-        compressed.write(data)
 
-        return compressed.getvalue()
+# Hash, method byte and size with header.
+frame_header = Struct('<QQBI')
 
 
 class CompressedBlockInputStream(BlockInputStream):
-    def __init__(self, fin, context):
+    """
+    :param pool: :class:`~multiprocessing.pool.ThreadPool` to decompress
+                 frames on. Defaults to ``None`` (frames are decompressed
+                 in reading thread).
+    :param max_pending: maximum number of frames read ahead and being
+                        decompressed by pool.
+    """
+
+    def __init__(self, fin, context, pool=None, max_pending=0):
         self.raw_fin = fin
+        self.pool = pool
+        self.max_pending = max_pending
+        # Pairs of frame position in raw stream and pool's result.
+        self.pending = deque()
+
+        # Frames read on demand are read into the same buffer. It grows to
+        # the largest frame size.
+        self.frame_buffer = bytearray()
+
+        # Decompressor per method byte. Decompressors are stateless and
+        # shared with pool.
+        self.decompressors = {}
+
         fin = CompressedBufferedReader(self.read_block, defines.BUFFER_SIZE)
         super(CompressedBlockInputStream, self).__init__(fin, context)
 
-    def get_compressed_hash(self, data):
-        return CityHash128(data)
+    def reset(self):
+        # Frames read ahead after the last frame of block are not frames at
+        # all: hash is checked only in pool. Raw stream is not read since
+        # they were taken from its buffer, so it's rewound to them.
+        if self.pending:
+            self.raw_fin.position = self.pending[0][0]
+
+        self.pending.clear()
 
-    def read_block(self):
+    def get_decompressor(self, method_byte):
+        decompressor = self.decompressors.get(method_byte)
+        if decompressor is None:
+            decompressor_cls = get_decompressor_cls(method_byte)
+            decompressor = decompressor_cls(self.raw_fin)
+            self.decompressors[method_byte] = decompressor
+
+        return decompressor
+
+    def get_frame_buffer(self, size):
+        # Frame from buffer is decompressed before the next one is read.
+        if len(self.frame_buffer) < size:
+            self.frame_buffer = bytearray(size)
+
+        return self.frame_buffer
+
+    def read_frame(self):
         compressed_hash = read_binary_uint128(self.raw_fin)
         method_byte = read_binary_uint8(self.raw_fin)
 
-        decompressor_cls = get_decompressor_cls(method_byte)
-        decompressor = decompressor_cls(self.raw_fin)
+        decompressor = self.get_decompressor(method_byte)
 
         if decompressor.method_byte is not None:
             extra_header_size = 1  # method
         else:
             extra_header_size = 0
 
-        return decompressor.get_decompressed_data(
-            method_byte, compressed_hash, extra_header_size
+        frame = decompressor.read_frame(method_byte, extra_header_size,
+                                        get_buffer=self.get_frame_buffer)
+        return decompressor, frame, compressed_hash, extra_header_size
+
+    def read_block(self):
+        if self.pending:
+            result = self.pending.popleft()[1]
+            self.read_ahead()
+            return result.get()
+
+        # Frame is read completely: its size is in header.
+        decompressor, frame, compressed_hash, extra_header_size = \
+            self.read_frame()
+
+        if self.pool is not None:
+            self.read_ahead()
+
+        # Passing frame to pool is worth only if there is anything to
+        # decompress meanwhile.
+        if not self.pending:
+            return decompressor.decompress_frame(
+                frame, compressed_hash, extra_header_size
+            )
+
+        result = self.pool.apply_async(
+            decompressor.decompress_frame,
+            (frame, compressed_hash, extra_header_size)
         )
+        return result.get()
+
+    def read_ahead(self):
+        """
+        Passes the following frames of the block to pool while current one
+        is parsed. Only frames that are already received are taken: data
+        after the last frame belongs to the next packet and waiting for it
+        can block forever.
+
+        Frames are not copied: raw stream's buffer is not overwritten until
+        all of them are consumed or stream is reset. Hash is checked in pool
+        as well. Data of the next packet that looks like frame header fails
+        the check, but it's never consumed by block.
+        """
+        fin = self.raw_fin
+
+        while len(self.pending) < self.max_pending:
+            position = fin.position
+            available = fin.current_buffer_size - position
+            if available < frame_header.size:
+                break
+
+            hi, lo, method_byte, size_with_header = \
+                frame_header.unpack_from(fin.buffer, position)
+
+            frame_size = 16 + size_with_header
+            if available < frame_size or size_with_header < 9:
+                break
+
+            try:
+                decompressor = self.get_decompressor(method_byte)
+            except errors.UnknownCompressionMethod:
+                break
+
+            # All known methods have method byte.
+            frame = fin.buffer_view[position + 16:position + frame_size]
+            fin.position += frame_size
+
+            self.pending.append((position, self.pool.apply_async(
+                decompressor.decompress_frame, (frame, (hi << 64) + lo, 1)
+            )))
@@ -1,4 +1,4 @@
-from ..block import Block, BlockInfo
+from ..block import ColumnOrientedBlock, BlockInfo
 from ..columns.service import read_column, write_column
 from ..reader import read_varint, read_binary_str
 from ..writer import write_varint, write_binary_str
@@ -6,9 +6,17 @@ from .. import defines
 
 
 class BlockOutputStream(object):
-    def __init__(self, fout, context):
+    """
+    :param sampler: function that is called with tail of each serialized
+                    block, e.g. to measure its compression. ``fout`` must be
+                    :class:`~clickhouse_driver.bufferedwriter.BufferedWriter`
+                    then. Defaults to ``None``.
+    """
+
+    def __init__(self, fout, context, sampler=None):
         self.fout = fout
         self.context = context
+        self.sampler = sampler
 
         super(BlockOutputStream, self).__init__()
 
@@ -20,9 +28,8 @@ class BlockOutputStream(object):
         if revision >= defines.DBMS_MIN_REVISION_WITH_BLOCK_INFO:
             block.info.write(self.fout)
 
-        # We write transposed data.
-        n_columns = block.rows
-        n_rows = block.columns
+        n_columns = len(block.columns_with_types)
+        n_rows = block.rows
 
         write_varint(n_columns, self.fout)
         write_varint(n_rows, self.fout)
@@ -31,18 +38,20 @@ class BlockOutputStream(object):
             write_binary_str(col_name, self.fout)
             write_binary_str(col_type, self.fout)
 
-            if n_columns:
-                try:
-                    items = [row[i] for row in block.data]
-                except IndexError:
-                    raise ValueError('Different rows length')
-
+            if n_rows:
+                items = block.get_column_by_index(i)
                 write_column(self.context, col_name, col_type, items,
                              self.fout, types_check=block.types_check)
 
         self.finalize()
 
+    def sample(self):
+        # Tail of block is still in writer's buffer.
+        if self.sampler is not None:
+            self.sampler(self.fout.buffer_view[:self.fout.position])
+
     def finalize(self):
+        self.sample()
         self.fout.flush()
 
 
@@ -80,7 +89,7 @@ class BlockInputStream(object):
                                      self.fin)
                 data.append(column)
 
-        block = Block(
+        block = ColumnOrientedBlock(
             columns_with_types=list(zip(names, types)),
             data=data,
             info=info,
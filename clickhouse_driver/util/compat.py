@@ -13,6 +13,11 @@ if PY3:
     text_type = str
     binary_type = bytes
     range = range
+    map = map
+    zip = zip
+
+    import pickle
+    import queue
 
 else:
     string_types = basestring,    # noqa: F821
@@ -21,3 +26,7 @@ else:
     text_type = unicode  # noqa: F821
     binary_type = str
     range = xrange  # noqa: F821
+    from itertools import imap as map, izip as zip  # noqa: F401
+
+    import cPickle as pickle  # noqa: F401
+    import Queue as queue  # noqa: F401
@@ -1,5 +1,9 @@
+import threading
+from collections import OrderedDict
 from itertools import islice
 
+from . import compat
+
 
 def chunks(seq, n):
     it = iter(seq)
@@ -7,3 +11,158 @@ def chunks(seq, n):
     while item:
         yield item
         item = list(islice(it, n))
+
+
+def estimate_size(value):
+    """
+    Rough estimation of value size in native format.
+    """
+    if isinstance(value, (compat.string_types, compat.binary_type)):
+        return len(value)
+
+    elif isinstance(value, (list, tuple)):
+        return sum(estimate_size(x) for x in value)
+
+    elif isinstance(value, dict):
+        return sum(estimate_size(x) for x in value.values())
+
+    # NumPy arrays, e.g. items of arrays columns.
+    nbytes = getattr(value, 'nbytes', None)
+    if nbytes is not None:
+        return nbytes
+
+    return 8
+
+
+def sized_chunks(seq, n, max_bytes, sample_step=16):
+    """
+    Splits sequence into chunks of at most ``n`` items and about
+    ``max_bytes`` bytes. Only every ``sample_step``-th item is measured.
+    """
+    it = iter(seq)
+
+    while True:
+        chunk = []
+        size = 0
+
+        for item in it:
+            if len(chunk) % sample_step == 0:
+                size += estimate_size(item) * sample_step
+
+            chunk.append(item)
+            if len(chunk) >= n or size >= max_bytes:
+                break
+
+        if not chunk:
+            return
+
+        yield chunk
+
+
+def estimate_item_size(column, sample_size=16):
+    """
+    Average size of column item. Arrays and buffers of fixed size items
+    know it. Other sequences are measured by a few first items.
+    """
+    itemsize = getattr(column, 'itemsize', None)
+    dtype = getattr(column, 'dtype', None)
+    if itemsize is not None and getattr(dtype, 'kind', None) != 'O':
+        return itemsize
+
+    sample = column[:sample_size]
+    if not len(sample):
+        return 0
+
+    return estimate_size(list(sample)) // len(sample)
+
+
+def pipeline(items, consume, max_pending=1):
+    """
+    Calls ``consume`` for each item in background thread while next items
+    are pulled from ``items`` in current thread. At most ``max_pending``
+    items wait for consumer. Exception raised by consumer is re-raised in
+    current thread.
+    """
+    pending = compat.queue.Queue(max_pending)
+    stop = object()
+    errors = []
+
+    def worker():
+        while True:
+            item = pending.get()
+            if item is stop:
+                break
+
+            # Items are skipped after failure to not block producer.
+            if errors:
+                continue
+
+            try:
+                consume(item)
+            except Exception as e:
+                errors.append(e)
+
+    thread = threading.Thread(target=worker)
+    thread.daemon = True
+    thread.start()
+
+    try:
+        for item in items:
+            if errors:
+                break
+
+            pending.put(item)
+
+    except Exception as e:
+        # Producer failed: pending items must not be consumed.
+        errors.append(e)
+        raise
+
+    finally:
+        pending.put(stop)
+        thread.join()
+
+    if errors:
+        raise errors[0]
+
+
+class LRUCache(object):
+    """
+    Mapping of limited size. Least recently used items are evicted first.
+    Cache can be shared between threads.
+
+    :param max_size: maximum number of items.
+    """
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.items = OrderedDict()
+        self.lock = threading.Lock()
+
+        super(LRUCache, self).__init__()
+
+    def __len__(self):
+        return len(self.items)
+
+    def get(self, key, default=None):
+        with self.lock:
+            try:
+                value = self.items.pop(key)
+            except KeyError:
+                return default
+
+            # Reinserted item becomes the most recently used.
+            self.items[key] = value
+            return value
+
+    def __setitem__(self, key, value):
+        with self.lock:
+            self.items.pop(key, None)
+            self.items[key] = value
+
+            if len(self.items) > self.max_size:
+                self.items.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.items.clear()
@@ -39,19 +39,28 @@ def write_binary_bytes_fixed_len(text, buf, length):
     buf.write(text)
 
 
-def write_varint(number, buf):
+def py_write_varint(number, buf):
     """
     Writes integer of variable length using LEB128.
     """
+    packet = bytearray()
     while True:
         towrite = number & 0x7f
         number >>= 7
         if number:
-            buf.write(_byte(towrite | 0x80))
+            packet.append(towrite | 0x80)
         else:
-            buf.write(_byte(towrite))
+            packet.append(towrite)
             break
 
+    buf.write(packet)
+
+
+try:
+    from .speedups.varint import write_varint
+except ImportError:
+    write_varint = py_write_varint
+
 
 def write_binary_int(number, buf, fmt):
     """
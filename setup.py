@@ -1,20 +1,37 @@
 import os
+import platform
 import sys
 import re
 from codecs import open
+from distutils.errors import (
+    CCompilerError, DistutilsExecError, DistutilsPlatformError
+)
+
+from setuptools import setup, find_packages, Extension
+from setuptools.command.build_ext import build_ext
 
-from setuptools import setup, find_packages
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    cythonize = None
 
 here = os.path.abspath(os.path.dirname(__file__))
 
 
 PY34 = sys.version_info[0:2] >= (3, 4)
+PY35 = sys.version_info[0:2] >= (3, 5)
+CPYTHON = platform.python_implementation() == 'CPython'
 
 install_requires = ['pytz']
 if not PY34:
     install_requires.append('enum34')
     install_requires.append('ipaddress')
 
+exclude_packages = ['tests*']
+# Asyncio client uses async/await syntax.
+if not PY35:
+    exclude_packages.append('clickhouse_driver.aio')
+
 
 def read_version():
     regexp = re.compile(r'^VERSION\W*=\W*\(([^\(\)]*)\)')
@@ -33,6 +50,57 @@ def read_version():
 with open(os.path.join(here, 'README.rst'), encoding='utf-8') as f:
     long_description = f.read()
 
+
+def get_extensions():
+    """
+    Speedups are built from .pyx sources with Cython or from previously
+    generated .c sources. Without both driver works in pure Python.
+    """
+    if not CPYTHON or os.environ.get('CLICKHOUSE_DRIVER_NO_EXTENSIONS'):
+        return []
+
+    ext = '.pyx' if cythonize else '.c'
+    extensions = []
+    for name in ('bufferedreader', 'bufferedwriter', 'varint'):
+        source = os.path.join('clickhouse_driver', 'speedups', name + ext)
+        if not os.path.exists(os.path.join(here, source)):
+            continue
+
+        extensions.append(
+            Extension('clickhouse_driver.speedups.' + name, [source])
+        )
+
+    if cythonize and extensions:
+        extensions = cythonize(extensions, language_level=2)
+
+    return extensions
+
+
+class optional_build_ext(build_ext):
+    """
+    Speedups are optional. Compilation errors are reported and skipped.
+    """
+
+    def run(self):
+        try:
+            build_ext.run(self)
+        except DistutilsPlatformError as e:
+            self.warn_failed(e)
+
+    def build_extension(self, ext):
+        try:
+            build_ext.build_extension(self, ext)
+        except (CCompilerError, DistutilsExecError,
+                DistutilsPlatformError, ValueError) as e:
+            self.warn_failed(e)
+
+    def warn_failed(self, e):
+        sys.stderr.write(
+            'WARNING: speedups are not built, falling back to pure Python '
+            'implementation: {}\n'.format(e)
+        )
+
+
 setup(
     name='clickhouse-driver',
     version=read_version(),
@@ -83,12 +151,15 @@ setup(
 
     keywords='ClickHouse db database cloud analytics',
 
-    packages=find_packages('.', exclude=['tests*']),
+    packages=find_packages('.', exclude=exclude_packages),
+    ext_modules=get_extensions(),
+    cmdclass={'build_ext': optional_build_ext},
     python_requires='>=2.7, !=3.0.*, !=3.1.*, !=3.2.*, !=3.3.*',
     install_requires=install_requires,
     extras_require={
         'lz4': ['lz4', 'clickhouse-cityhash>=1.0.2.1'],
-        'zstd': ['zstd', 'clickhouse-cityhash>=1.0.2.1']
+        'zstd': ['zstd', 'clickhouse-cityhash>=1.0.2.1'],
+        'numpy': ['numpy>=1.12.0', 'pandas>=0.24.0']
     },
     test_suite='nose.collector',
     tests_require=[
@@ -96,6 +167,7 @@ setup(
         'mock',
         'freezegun',
         'lz4', 'zstd',
-        'clickhouse-cityhash>=1.0.2.1'
+        'clickhouse-cityhash>=1.0.2.1',
+        'numpy', 'pandas'
     ],
 )
@@ -0,0 +1,70 @@
+from unittest import TestCase
+
+from clickhouse_driver.reader import read_varint
+from tests.aio.testcase import AsyncClient
+
+if AsyncClient is not None:
+    from clickhouse_driver.aio.bufferedreader import (
+        AsyncBufferedReader, NeedMoreData
+    )
+
+
+class AsyncBufferedReaderTestCase(TestCase):
+    def setUp(self):
+        if AsyncClient is None:
+            self.skipTest('AsyncClient requires Python 3.5+')
+
+        super(AsyncBufferedReaderTestCase, self).setUp()
+
+    def parse(self, reader, parse):
+        try:
+            rv = parse()
+            reader.commit()
+            return rv
+
+        except NeedMoreData:
+            reader.rollback()
+            return NeedMoreData
+
+    def test_parsing_is_restarted(self):
+        data = b'\x03\x01a\x02bc\x83\x01' + b'd' * 131
+        reader = AsyncBufferedReader()
+
+        def parse():
+            return reader.read_strings(read_varint(reader), decode=True)
+
+        # Every split of data leads to restart.
+        for i in range(len(data)):
+            reader.feed(data[i:i + 1])
+            rv = self.parse(reader, parse)
+            if i < len(data) - 1:
+                self.assertIs(rv, NeedMoreData)
+
+        self.assertEqual(rv, ['a', 'bc', 'd' * 131])
+        self.assertEqual(reader.unparsed_size, 0)
+
+    def test_parsed_data_is_dropped(self):
+        reader = AsyncBufferedReader()
+
+        reader.feed(b'\x01\x02\x03')
+        self.assertEqual(self.parse(reader, reader.read_one), 1)
+        self.assertEqual(self.parse(reader, lambda: reader.read(3)),
+                         NeedMoreData)
+        self.assertEqual(reader.unparsed_size, 2)
+
+        reader.feed(b'\x04')
+        self.assertEqual(len(reader.buffer), 3)
+        self.assertEqual(self.parse(reader, lambda: reader.read(3)),
+                         b'\x02\x03\x04')
+        self.assertEqual(reader.unparsed_size, 0)
+
+    def test_buffer_is_exported(self):
+        reader = AsyncBufferedReader()
+        reader.feed(b'\x01\x02')
+        self.assertEqual(self.parse(reader, reader.read_one), 1)
+
+        view = memoryview(reader.buffer)
+        reader.feed(b'\x03')
+        self.assertEqual(self.parse(reader, lambda: reader.read(2)),
+                         b'\x02\x03')
+        view.release()
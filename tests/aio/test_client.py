@@ -0,0 +1,155 @@
+from clickhouse_driver import errors
+from tests.aio.testcase import AsyncBaseTestCase, AsyncClient, asyncio
+
+
+class AsyncClientTestCase(AsyncBaseTestCase):
+    def test_execute(self):
+        rv = self.run_async(self.client.execute(
+            'SELECT number FROM system.numbers LIMIT 3'
+        ))
+        self.assertEqual(rv, [(0, ), (1, ), (2, )])
+
+    def test_with_column_types(self):
+        rv = self.run_async(self.client.execute(
+            'SELECT 1 AS x', with_column_types=True
+        ))
+        self.assertEqual(rv, ([(1, )], [('x', 'UInt8')]))
+
+    def test_params(self):
+        rv = self.run_async(self.client.execute(
+            'SELECT %(x)s', {'x': 'test'}
+        ))
+        self.assertEqual(rv, [('test', )])
+
+    def test_large_result(self):
+        # Packets span over many chunks of received data.
+        query = (
+            'SELECT number, toString(number) FROM system.numbers '
+            'LIMIT 200000'
+        )
+        rv = self.run_async(self.client.execute(query, columnar=True))
+        self.assertEqual(rv[0], tuple(range(200000)))
+        self.assertEqual(rv[1], tuple(str(x) for x in range(200000)))
+
+    def test_insert(self):
+        with self.create_table('a UInt8, b String'):
+            data = [(1, 'a'), (2, 'b')]
+            self.run_async(self.client.execute(
+                'INSERT INTO test (a, b) VALUES', data
+            ))
+            self.run_async(self.client.execute(
+                'INSERT INTO test (a, b) VALUES', [[3, 4], ['c', 'd']],
+                columnar=True
+            ))
+
+            inserted = self.emit_cli('SELECT * FROM test')
+            self.assertEqual(inserted, '1\ta\n2\tb\n3\tc\n4\td\n')
+
+    def test_execute_iter(self):
+        result = self.client.execute_iter(
+            'SELECT number FROM system.numbers LIMIT 3',
+            with_column_types=True
+        )
+        self.assertEqual(
+            self.collect(result),
+            [[('number', 'UInt64')], (0, ), (1, ), (2, )]
+        )
+
+        rv = self.run_async(self.client.execute('SELECT 1'))
+        self.assertEqual(rv, [(1, )])
+
+    def test_execute_with_progress(self):
+        progress = self.run_async(self.client.execute_with_progress(
+            'SELECT 2'
+        ))
+        self.assertEqual(self.collect(progress), [(1, 0)])
+        self.assertEqual(self.run_async(progress.get_result()), [(2, )])
+        self.assertTrue(self.client.connection.connected)
+
+    def test_server_exception(self):
+        with self.assertRaises(errors.ServerException) as e:
+            self.run_async(self.client.execute('SELECT test'))
+
+        self.assertEqual(
+            e.exception.code, errors.ErrorCodes.UNKNOWN_IDENTIFIER
+        )
+
+        rv = self.run_async(self.client.execute('SELECT 1'))
+        self.assertEqual(rv, [(1, )])
+
+    def test_max_stored_rows(self):
+        with self.assertRaises(errors.ResultLimitExceededError):
+            self.run_async(self.client.execute(
+                'SELECT number FROM system.numbers LIMIT 100000 '
+                'SETTINGS max_block_size = 1000',
+                settings={'max_stored_rows': 5000}
+            ))
+
+        rv = self.run_async(self.client.execute('SELECT 1'))
+        self.assertEqual(rv, [(1, )])
+
+    def test_reconnect(self):
+        self.run_async(self.client.execute('SELECT 1'))
+        self.client.disconnect()
+
+        rv = self.run_async(self.client.execute('SELECT 1'))
+        self.assertEqual(rv, [(1, )])
+
+    def test_concurrent_clients(self):
+        client = self._create_client()
+        query = 'SELECT sleep(0.5)'
+
+        try:
+            rv = self.run_async(asyncio.gather(
+                self.client.execute(query), client.execute(query)
+            ))
+            self.assertEqual(rv, [[(0, )], [(0, )]])
+        finally:
+            client.disconnect()
+
+    def test_cancelled_query_closes_connection(self):
+        task = self.loop.create_task(self.client.execute('SELECT sleep(1)'))
+        self.run_async(asyncio.sleep(0.2))
+        task.cancel()
+
+        with self.assertRaises(asyncio.CancelledError):
+            self.run_async(task)
+
+        self.assertFalse(self.client.connection.connected)
+
+        rv = self.run_async(self.client.execute('SELECT 1'))
+        self.assertEqual(rv, [(1, )])
+
+    def test_timeout(self):
+        client = self._create_client(send_receive_timeout=0.1)
+
+        try:
+            with self.assertRaises(errors.SocketTimeoutError):
+                self.run_async(client.execute('SELECT sleep(1)'))
+        finally:
+            client.disconnect()
+
+    def test_network_error(self):
+        client = AsyncClient('localhost', port=1)
+
+        with self.assertRaises(errors.NetworkError):
+            self.run_async(client.execute('SELECT 1'))
+
+
+class AsyncCompressionTestCase(AsyncBaseTestCase):
+    client_kwargs = {'compression': 'lz4'}
+
+    def test_large_result(self):
+        query = 'SELECT toString(number) FROM system.numbers LIMIT 200000'
+        rv = self.run_async(self.client.execute(query, columnar=True))
+        self.assertEqual(rv[0], tuple(str(x) for x in range(200000)))
+
+    def test_insert(self):
+        with self.create_table('a String'):
+            data = [('x' * i, ) for i in range(1000)]
+            self.run_async(
+                self.client.execute('INSERT INTO test VALUES', data)
+            )
+
+            rv = self.run_async(self.client.execute('SELECT * FROM test'))
+            self.assertEqual(rv, data)
@@ -0,0 +1,80 @@
+from math import log2
+from unittest import TestCase
+
+from tests.aio.testcase import AsyncClient, asyncio
+
+if AsyncClient is not None:
+    from clickhouse_driver.aio.bufferedreader import AsyncBufferedReader
+    from clickhouse_driver.aio.connection import (
+        AsyncConnection, ClickHouseProtocol
+    )
+
+
+class Transport(object):
+    def pause_reading(self):
+        pass
+
+    def resume_reading(self):
+        pass
+
+
+class AsyncConnectionReadTestCase(TestCase):
+    def setUp(self):
+        if AsyncClient is None:
+            self.skipTest('AsyncClient requires Python 3.5+')
+
+        self.loop = asyncio.new_event_loop()
+
+        self.connection = AsyncConnection('localhost')
+        self.connection.fin = AsyncBufferedReader()
+        self.connection.protocol = ClickHouseProtocol(
+            self.connection.fin, self.loop
+        )
+        self.connection.protocol.connection_made(Transport())
+
+        super(AsyncConnectionReadTestCase, self).setUp()
+
+    def tearDown(self):
+        self.loop.close()
+        super(AsyncConnectionReadTestCase, self).tearDown()
+
+    def feed_later(self, chunks, delay):
+        protocol = self.connection.protocol
+
+        for i, chunk in enumerate(chunks, 1):
+            self.loop.call_later(delay * i, protocol.data_received, chunk)
+
+    def read(self, size):
+        calls = []
+
+        def parse():
+            calls.append(self.connection.fin.unparsed_size)
+            return self.connection.fin.read(size)
+
+        rv = self.loop.run_until_complete(self.connection.read(parse))
+        return rv, calls
+
+    def test_large_packet_by_delayed_chunks(self):
+        n_chunks = 64
+        data = bytes(range(256)) * n_chunks
+        self.feed_later(
+            [data[i:i + 256] for i in range(0, len(data), 256)], 0.005
+        )
+
+        rv, calls = self.read(len(data))
+        self.assertEqual(rv, data)
+        self.assertEqual(self.connection.fin.unparsed_size, 0)
+
+        # Packet is parsed again when received data is doubled, not for
+        # every chunk.
+        self.assertLessEqual(len(calls), 2 * log2(n_chunks) + 2)
+
+    def test_complete_packet_is_not_delayed(self):
+        # Server sends nothing after packet: parsing is not postponed until
+        # any timeout.
+        self.feed_later([b'\x01' * 100, b'\x02' * 10], 0.05)
+
+        started = self.loop.time()
+        rv, calls = self.read(110)
+        self.assertEqual(rv, b'\x01' * 100 + b'\x02' * 10)
+        self.assertLess(self.loop.time() - started, 1)
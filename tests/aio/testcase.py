@@ -0,0 +1,40 @@
+from tests.testcase import BaseTestCase
+
+try:
+    import asyncio
+    from clickhouse_driver.aio import AsyncClient
+
+# async/await syntax requires Python 3.5+.
+except (ImportError, SyntaxError):
+    asyncio = AsyncClient = None
+
+
+class AsyncBaseTestCase(BaseTestCase):
+    def setUp(self):
+        if AsyncClient is None:
+            self.skipTest('AsyncClient requires Python 3.5+')
+
+        self.loop = asyncio.new_event_loop()
+        super(AsyncBaseTestCase, self).setUp()
+
+    def tearDown(self):
+        super(AsyncBaseTestCase, self).tearDown()
+        self.loop.close()
+
+    def _create_client(self, **kwargs):
+        return AsyncClient(
+            self.host, self.port, self.database, self.user, self.password,
+            **kwargs
+        )
+
+    def run_async(self, coro):
+        return self.loop.run_until_complete(coro)
+
+    def collect(self, async_iterator):
+        rv = []
+
+        while True:
+            try:
+                rv.append(self.run_async(async_iterator.__anext__()))
+            except StopAsyncIteration:
+                return rv
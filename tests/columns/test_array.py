@@ -1,7 +1,9 @@
+from unittest import TestCase
 from uuid import UUID
 
 from tests.testcase import BaseTestCase
 from clickhouse_driver import errors
+from clickhouse_driver.columns.arraycolumn import FlatArrays
 
 
 class ArrayTestCase(BaseTestCase):
@@ -207,3 +209,88 @@ class ArrayTestCase(BaseTestCase):
 
             inserted = self.client.execute(query)
             self.assertEqual(inserted, data)
+
+    def test_insert_flat_arrays(self):
+        columns = 'a Array(Int32), b Array(Array(String))'
+
+        a = FlatArrays([1, 2, 3], [2, 2, 3])
+        b = FlatArrays(
+            FlatArrays(['x', 'y', 'z'], [1, 1, 3]), [1, 3, 3]
+        )
+        with self.create_table(columns):
+            self.client.execute(
+                'INSERT INTO test (a, b) VALUES', [a, b], columnar=True
+            )
+
+            query = 'SELECT * FROM test'
+            inserted = self.emit_cli(query)
+            self.assertEqual(
+                inserted,
+                "[1,2]\t[['x']]\n[]\t[[],['y','z']]\n[3]\t[]\n"
+            )
+
+    def test_select_flat_arrays(self):
+        columns = 'a Array(Int32), b Array(Array(String))'
+        settings = {'flat_arrays': True, 'max_block_size': 1}
+
+        with self.create_table(columns):
+            self.emit_cli(
+                "INSERT INTO test VALUES ([1, 2], [['x']]), "
+                "([], [[], ['y', 'z']]), ([3], [])"
+            )
+
+            query = 'SELECT * FROM test'
+            a, b = self.client.execute(
+                query, columnar=True, settings=settings
+            )
+
+            self.assertIsInstance(a, FlatArrays)
+            self.assertEqual(a.values, (1, 2, 3))
+            self.assertEqual(a.offsets, (2, 2, 3))
+
+            self.assertEqual(b.values.values, ('x', 'y', 'z'))
+            self.assertEqual(b.values.offsets, (1, 1, 3))
+            self.assertEqual(b.offsets, (1, 3, 3))
+
+            inserted = self.client.execute(query, settings=settings)
+            self.assertEqual(inserted[0][0], (1, 2))
+            self.assertEqual(inserted[2][0], (3, ))
+
+
+class FlatArraysTestCase(TestCase):
+    def test_items(self):
+        arrays = FlatArrays([1, 2, 3, 4], [2, 2, 4])
+
+        self.assertEqual(len(arrays), 3)
+        self.assertEqual(arrays[0], [1, 2])
+        self.assertEqual(arrays[1], [])
+        self.assertEqual(arrays[-1], [3, 4])
+
+    def test_slice(self):
+        arrays = FlatArrays([1, 2, 3, 4], [2, 2, 4])
+
+        tail = arrays[1:]
+        self.assertEqual(tail.values, [3, 4])
+        self.assertEqual(tail.offsets, [0, 2])
+        self.assertEqual(list(tail), [[], [3, 4]])
+
+        self.assertEqual(len(arrays[3:]), 0)
+
+    def test_concat(self):
+        arrays = FlatArrays.concat([
+            FlatArrays((1, 2), (2, 2)), FlatArrays((3, ), (1, ))
+        ])
+        self.assertEqual(arrays.values, (1, 2, 3))
+        self.assertEqual(arrays.offsets, (2, 2, 3))
+
+        arrays += FlatArrays((), (0, ))
+        self.assertEqual(list(arrays), [(1, 2), (), (3, ), ()])
+
+    def test_concat_nested(self):
+        arrays = FlatArrays.concat([
+            FlatArrays(FlatArrays(('x', ), (1, )), (1, )),
+            FlatArrays(FlatArrays(('y', 'z'), (0, 2)), (2, 2))
+        ])
+        self.assertEqual(arrays.values.values, ('x', 'y', 'z'))
+        self.assertEqual(arrays.values.offsets, (1, 1, 3))
+        self.assertEqual(arrays.offsets, (1, 3, 3))
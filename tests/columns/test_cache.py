@@ -0,0 +1,74 @@
+from io import BytesIO
+from unittest import TestCase
+
+from clickhouse_driver.context import Context
+from clickhouse_driver.columns.service import (
+    get_column, read_column, write_column
+)
+from tests.util import BytesReader
+
+
+class ServerInfo(object):
+    timezone = 'Europe/Moscow'
+
+
+class ColumnsCacheTestCase(TestCase):
+    def setUp(self):
+        self.context = Context()
+        self.context.settings = {}
+        self.context.client_settings = {
+            'strings_as_bytes': False, 'use_numpy': False,
+            'flat_arrays': False
+        }
+        self.context.server_info = ServerInfo()
+
+    def test_column_is_reused(self):
+        spec = 'Array(Nullable(Int32))'
+        column = get_column(self.context, spec)
+
+        self.assertIs(get_column(self.context, spec), column)
+        self.assertIsNot(get_column(self.context, 'Array(Int32)'), column)
+        self.assertIsNot(
+            get_column(self.context, spec, types_check=True), column
+        )
+
+    def test_array_reuse(self):
+        spec = 'Array(Nullable(Int32))'
+        data = [(1, None), (), (2, )]
+
+        for _ in range(2):
+            buf = BytesIO()
+            write_column(self.context, 'a', spec, data, buf)
+
+            rv = read_column(self.context, spec, 3, BytesReader(
+                buf.getvalue(), 1024
+            ))
+            self.assertEqual(rv, tuple(data))
+
+    def test_cache_is_dropped_on_settings_change(self):
+        column = get_column(self.context, 'DateTime')
+        self.assertEqual(column.timezone.zone, 'Europe/Moscow')
+
+        self.context.settings = {}
+        self.assertIs(get_column(self.context, 'DateTime'), column)
+
+        # Settings that columns don't depend on keep cache.
+        self.context.settings = {'max_block_size': 1}
+        self.context.client_settings = {
+            'strings_as_bytes': False, 'use_numpy': False,
+            'flat_arrays': False, 'row_type': 'dict'
+        }
+        self.assertIs(get_column(self.context, 'DateTime'), column)
+
+        self.context.settings = {'use_client_time_zone': True}
+        self.assertIsNone(get_column(self.context, 'DateTime').timezone)
+
+        self.context.client_settings = {
+            'strings_as_bytes': True, 'use_numpy': False,
+            'flat_arrays': False
+        }
+        rv = read_column(self.context, 'String', 1, BytesReader(b'\x01a', 8))
+        self.assertEqual(rv, (b'a', ))
+
+        self.context.server_info = ServerInfo()
+        self.assertEqual(len(self.context.columns_cache), 0)
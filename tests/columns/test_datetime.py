@@ -64,6 +64,24 @@ class DateTimeTestCase(BaseTestCase):
             inserted = self.client.execute(query)
             self.assertEqual(inserted, data)
 
+    @require_server_version(20, 1, 2)
+    def test_datetime64(self):
+        with self.create_table("a DateTime64(3, 'UTC'), b DateTime64(6)"):
+            data = [(
+                datetime(2012, 10, 25, 14, 7, 19, 125000),
+                datetime(1969, 12, 31, 23, 59, 59, 999999)
+            )]
+            self.client.execute(
+                'INSERT INTO test (a, b) VALUES', data
+            )
+
+            query = "SELECT toString(a, 'UTC') FROM test"
+            inserted = self.emit_cli(query)
+            self.assertEqual(inserted, '2012-10-25 14:07:19.125\n')
+
+            inserted = self.client.execute('SELECT * FROM test')
+            self.assertEqual(inserted, data)
+
 
 class DateTimeTimezonesTestCase(BaseTestCase):
     @contextmanager
@@ -0,0 +1,74 @@
+from tests.testcase import BaseTestCase
+from tests.util import require_server_version
+
+
+class LowCardinalityTestCase(BaseTestCase):
+    required_server_version = (19, 3, 3)
+
+    @require_server_version(*required_server_version)
+    def test_string(self):
+        columns = 'a LowCardinality(String)'
+
+        data = [('hello', ), ('world', ), ('hello', ), ('', )]
+        with self.create_table(columns):
+            self.client.execute('INSERT INTO test (a) VALUES', data)
+
+            query = 'SELECT * FROM test'
+            inserted = self.emit_cli(query)
+            self.assertEqual(inserted, 'hello\nworld\nhello\n\n')
+
+            inserted = self.client.execute(query)
+            self.assertEqual(inserted, data)
+
+    @require_server_version(*required_server_version)
+    def test_nullable_string(self):
+        columns = 'a LowCardinality(Nullable(String))'
+
+        data = [('hello', ), (None, ), ('', ), (None, )]
+        with self.create_table(columns):
+            self.client.execute('INSERT INTO test (a) VALUES', data)
+
+            query = 'SELECT * FROM test'
+            inserted = self.emit_cli(query)
+            self.assertEqual(inserted, 'hello\n\\N\n\n\\N\n')
+
+            inserted = self.client.execute(query)
+            self.assertEqual(inserted, data)
+
+    @require_server_version(*required_server_version)
+    def test_int(self):
+        columns = 'a LowCardinality(Int32)'
+
+        data = [(x % 300, ) for x in range(1000)]
+        with self.create_table(columns):
+            self.client.execute('INSERT INTO test (a) VALUES', data)
+
+            query = 'SELECT * FROM test'
+            inserted = self.client.execute(query)
+            self.assertEqual(inserted, data)
+
+    @require_server_version(*required_server_version)
+    def test_array(self):
+        columns = 'a Array(LowCardinality(String))'
+
+        data = [(('a', 'b', 'a'), ), ((), ), (('b', ), )]
+        with self.create_table(columns):
+            self.client.execute('INSERT INTO test (a) VALUES', data)
+
+            query = 'SELECT * FROM test'
+            inserted = self.emit_cli(query)
+            self.assertEqual(inserted, "['a','b','a']\n[]\n['b']\n")
+
+            inserted = self.client.execute(query)
+            self.assertEqual(inserted, data)
+
+    @require_server_version(*required_server_version)
+    def test_empty_arrays(self):
+        columns = 'a Array(LowCardinality(String))'
+
+        data = [((), ), ((), )]
+        with self.create_table(columns):
+            self.client.execute('INSERT INTO test (a) VALUES', data)
+
+            inserted = self.client.execute('SELECT * FROM test')
+            self.assertEqual(inserted, data)
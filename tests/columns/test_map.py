@@ -0,0 +1,37 @@
+from tests.testcase import BaseTestCase
+from tests.util import require_server_version
+
+
+class MapTestCase(BaseTestCase):
+    def create_table(self, columns, **kwargs):
+        return super(MapTestCase, self).create_table(
+            columns, allow_experimental_map_type=1, **kwargs
+        )
+
+    @require_server_version(21, 1, 2)
+    def test_simple(self):
+        columns = 'a Map(String, UInt64)'
+
+        data = [({}, ), ({'key1': 1}, ), ({'key1': 2, 'key2': 20}, )]
+        with self.create_table(columns):
+            self.client.execute('INSERT INTO test (a) VALUES', data)
+
+            query = 'SELECT * FROM test'
+            inserted = self.emit_cli(query)
+            self.assertEqual(
+                inserted, "{}\n{'key1':1}\n{'key1':2,'key2':20}\n"
+            )
+
+            inserted = self.client.execute(query)
+            self.assertEqual(inserted, data)
+
+    @require_server_version(21, 1, 2)
+    def test_nullable_and_array_values(self):
+        columns = 'a Map(String, Nullable(Int32)), b Map(UInt8, Array(String))'
+
+        data = [({'x': None, 'y': 1}, {1: ('a', 'b'), 2: ()})]
+        with self.create_table(columns):
+            self.client.execute('INSERT INTO test (a, b) VALUES', data)
+
+            inserted = self.client.execute('SELECT * FROM test')
+            self.assertEqual(inserted, data)
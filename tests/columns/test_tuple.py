@@ -0,0 +1,68 @@
+from tests.testcase import BaseTestCase
+from tests.util import require_server_version
+
+
+class TupleTestCase(BaseTestCase):
+    def test_simple(self):
+        columns = 'a Tuple(Int32, String)'
+
+        data = [((1, 'a'), ), ((2, 'b'), )]
+        with self.create_table(columns):
+            self.client.execute('INSERT INTO test (a) VALUES', data)
+
+            query = 'SELECT * FROM test'
+            inserted = self.emit_cli(query)
+            self.assertEqual(inserted, "(1,'a')\n(2,'b')\n")
+
+            inserted = self.client.execute(query)
+            self.assertEqual(inserted, data)
+
+    def test_nullable_and_array_elements(self):
+        columns = 'a Tuple(Nullable(Int32), Array(String))'
+
+        data = [((None, ('x', 'y')), ), ((3, ()), )]
+        with self.create_table(columns):
+            self.client.execute('INSERT INTO test (a) VALUES', data)
+
+            query = 'SELECT * FROM test'
+            inserted = self.emit_cli(query)
+            self.assertEqual(inserted, "(NULL,['x','y'])\n(3,[])\n")
+
+            inserted = self.client.execute(query)
+            self.assertEqual(inserted, data)
+
+    def test_array_of_tuples(self):
+        columns = 'a Array(Tuple(UInt8, String))'
+
+        data = [(((1, 'a'), (2, 'b')), ), ((), )]
+        with self.create_table(columns):
+            self.client.execute('INSERT INTO test (a) VALUES', data)
+
+            query = 'SELECT * FROM test'
+            inserted = self.emit_cli(query)
+            self.assertEqual(inserted, "[(1,'a'),(2,'b')]\n[]\n")
+
+            inserted = self.client.execute(query)
+            self.assertEqual(inserted, data)
+
+    @require_server_version(20, 1, 2)
+    def test_named_elements(self):
+        columns = 'a Tuple(x Int8, y LowCardinality(String))'
+
+        data = [((1, 'a'), ), ((-1, 'a'), )]
+        with self.create_table(columns):
+            self.client.execute('INSERT INTO test (a) VALUES', data)
+
+            inserted = self.client.execute('SELECT * FROM test')
+            self.assertEqual(inserted, data)
+
+    @require_server_version(21, 3, 2)
+    def test_nested(self):
+        columns = 'a Nested(x UInt8, y String)'
+
+        data = [(((1, 'a'), (2, 'b')), ), ((), )]
+        with self.create_table(columns, flatten_nested=0):
+            self.client.execute('INSERT INTO test (a) VALUES', data)
+
+            inserted = self.client.execute('SELECT * FROM test')
+            self.assertEqual(inserted, data)
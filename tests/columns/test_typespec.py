@@ -0,0 +1,110 @@
+from datetime import datetime
+from io import BytesIO
+from unittest import TestCase
+
+from clickhouse_driver import errors
+from clickhouse_driver.context import Context
+from clickhouse_driver.columns.service import (
+    get_column_by_spec, read_column, write_column
+)
+from clickhouse_driver.columns.typespec import TypeSpec, parse_spec
+from tests.util import BytesReader
+
+
+class TypeSpecParserTestCase(TestCase):
+    def test_simple(self):
+        self.assertEqual(parse_spec('UInt8'), TypeSpec('UInt8'))
+        self.assertEqual(parse_spec(' UInt8 '), TypeSpec('UInt8'))
+
+    def test_nested(self):
+        spec = parse_spec('Array(Nullable(String))')
+        self.assertEqual(
+            spec,
+            TypeSpec('Array', [TypeSpec('Nullable', [TypeSpec('String')])])
+        )
+
+    def test_literals(self):
+        spec = parse_spec("DateTime64(3, 'Europe/Moscow')")
+        self.assertEqual(spec.args, (3, 'Europe/Moscow'))
+
+        spec = parse_spec("Enum8('a' = 1, 'b\\'c' = -2, 'd, e' = 3)")
+        self.assertEqual(spec.args, (('a', 1), ("b'c", -2), ('d, e', 3)))
+
+        spec = parse_spec('SimpleAggregateFunction(quantiles(0.5), Float64)')
+        self.assertEqual(spec.args[0].args, (0.5, ))
+
+    def test_named_elements(self):
+        spec = parse_spec('Tuple(a UInt8, `b c` Array(String))')
+        self.assertEqual(spec.args, (
+            ('a', TypeSpec('UInt8')),
+            ('b c', TypeSpec('Array', [TypeSpec('String')]))
+        ))
+
+    def test_str(self):
+        for spec in ('Map(String, Array(UInt64))', 'Decimal(18, 4)',
+                     "Enum16('a\\\\b' = 1, 'c\\'' = 2)",
+                     'Tuple(a UInt8, `b c` String)'):
+            self.assertEqual(str(parse_spec(spec)), spec)
+
+    def test_errors(self):
+        for spec in ('', 'Array(', 'Array(String', "Enum8('a", 'UInt8)',
+                     'Array(String,)', "Enum8('a' = b)"):
+            with self.assertRaises(errors.UnknownTypeError):
+                parse_spec(spec)
+
+    def test_unknown_type_with_arguments(self):
+        with self.assertRaises(errors.UnknownTypeError) as e:
+            get_column_by_spec('UInt8(1)')
+
+        self.assertIn('UInt8(1)', str(e.exception))
+
+
+class ServerInfo(object):
+    timezone = 'UTC'
+
+
+class ColumnsByTypeSpecTestCase(TestCase):
+    def setUp(self):
+        self.context = Context()
+        self.context.settings = {}
+        self.context.client_settings = {
+            'strings_as_bytes': False, 'use_numpy': False,
+            'flat_arrays': False
+        }
+        self.context.server_info = ServerInfo()
+
+    def write_read(self, spec, data):
+        buf = BytesIO()
+        write_column(self.context, 'a', spec, data, buf)
+
+        return read_column(self.context, spec, len(data), BytesReader(
+            buf.getvalue(), 1024
+        ))
+
+    def test_datetime64(self):
+        data = [
+            datetime(2012, 10, 25, 14, 7, 19, 125000),
+            datetime(1969, 12, 31, 23, 59, 59, 999000)
+        ]
+        rv = self.write_read("DateTime64(3, 'Europe/Moscow')", data)
+        self.assertEqual(rv, tuple(data))
+
+        column = get_column_by_spec("DateTime64(3, 'Europe/Moscow')", {
+            'context': self.context
+        })
+        self.assertEqual(column.timezone.zone, 'Europe/Moscow')
+        self.assertEqual(column.before_write_item(1500), 1500)
+
+    def test_simple_aggregate_function(self):
+        data = [1, 2, 3]
+        rv = self.write_read('SimpleAggregateFunction(sum, UInt64)', data)
+        self.assertEqual(rv, tuple(data))
+
+    def test_decimal_with_fixed_precision(self):
+        column = get_column_by_spec('Decimal64(4)')
+        self.assertEqual((column.precision, column.scale), (18, 4))
+
+    def test_enum_with_comma(self):
+        data = ['a, b', 'c']
+        rv = self.write_read("Enum8('a, b' = 1, 'c' = -1)", data)
+        self.assertEqual(rv, tuple(data))
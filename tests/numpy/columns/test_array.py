@@ -0,0 +1,71 @@
+from clickhouse_driver.columns.arraycolumn import FlatArrays
+from tests.numpy.testcase import NumpyBaseTestCase, np
+
+
+class ArrayTestCase(NumpyBaseTestCase):
+    def test_simple(self):
+        with self.create_table('a Array(Float64)'):
+            self.emit_cli('INSERT INTO test VALUES ([1.5, 2]), ([]), ([3])')
+
+            query = 'SELECT * FROM test'
+            inserted = self.client.execute(query, columnar=True)
+            column = inserted[0]
+
+            self.assertEqual(column.dtype, np.object_)
+            self.assertEqual(len(column), 3)
+            self.assertArraysEqual(column[0], [1.5, 2.0])
+            self.assertArraysEqual(column[1], [])
+            self.assertArraysEqual(column[2], [3.0])
+
+            # Rows are views of single array.
+            self.assertIs(column[0].base, column[2].base)
+
+    def test_nested_and_nullable(self):
+        columns = 'a Array(Array(Int32)), b Array(Nullable(UInt8))'
+
+        with self.create_table(columns):
+            self.emit_cli(
+                'INSERT INTO test VALUES ([[1, 2], []], [1, NULL]), ([], [])'
+            )
+
+            query = 'SELECT * FROM test'
+            a, b = self.client.execute(query, columnar=True)
+
+            self.assertEqual([x.tolist() for x in a[0]], [[1, 2], []])
+            self.assertEqual(len(a[1]), 0)
+            self.assertTrue(isinstance(b[0], np.ma.MaskedArray))
+            self.assertEqual(b[0].tolist(), [1, None])
+
+    def test_flat_arrays(self):
+        settings = {'flat_arrays': True, 'max_block_size': 1}
+
+        with self.create_table('a Array(Float64), b Array(Array(Int32))'):
+            self.emit_cli(
+                'INSERT INTO test VALUES ([1.5, 2], [[1, 2], []]), '
+                '([], []), ([3], [[3]])'
+            )
+
+            query = 'SELECT * FROM test'
+            a, b = self.client.execute(
+                query, columnar=True, settings=settings
+            )
+
+            self.assertIsInstance(a, FlatArrays)
+            self.assertArraysEqual(a.values, [1.5, 2.0, 3.0])
+            self.assertArraysEqual(a.offsets, [2, 2, 3])
+            self.assertArraysEqual(a[2], [3.0])
+
+            self.assertArraysEqual(b.values.values, [1, 2, 3])
+            self.assertArraysEqual(b.values.offsets, [2, 2, 3])
+            self.assertArraysEqual(b.offsets, [2, 2, 3])
+
+    def test_insert(self):
+        with self.create_table('a Array(Int32), b Array(Nullable(Int8))'):
+            data = [
+                [np.array([1, 2], dtype=np.int32), np.array([], np.int32)],
+                [[1, None], []]
+            ]
+            self.client.execute('INSERT INTO test VALUES', data, columnar=True)
+
+            inserted = self.emit_cli('SELECT * FROM test')
+            self.assertEqual(inserted, '[1,2]\t[1,NULL]\n[]\t[]\n')
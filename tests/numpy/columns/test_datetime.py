@@ -0,0 +1,80 @@
+from datetime import date, datetime
+from unittest import TestCase
+
+from pytz import timezone
+
+from tests.numpy.testcase import NumpyBaseTestCase, np
+
+
+class DateTestCase(NumpyBaseTestCase):
+    def test_simple(self):
+        with self.create_table('a Date'):
+            self.emit_cli(
+                "INSERT INTO test VALUES ('2012-10-25'), ('1970-01-01')"
+            )
+
+            query = 'SELECT * FROM test'
+            inserted = self.client.execute(query, columnar=True)
+            self.assertArraysEqual(
+                inserted[0], [date(2012, 10, 25), date(1970, 1, 1)]
+            )
+            self.assertEqual(inserted[0].dtype, 'datetime64[D]')
+
+
+class DateTimeTestCase(NumpyBaseTestCase):
+    def test_simple(self):
+        with self.create_table('a DateTime'):
+            self.emit_cli("INSERT INTO test VALUES ('2012-10-25 14:07:19')")
+
+            query = 'SELECT * FROM test'
+            inserted = self.client.execute(query, columnar=True)
+            self.assertArraysEqual(
+                inserted[0], [datetime(2012, 10, 25, 14, 7, 19)]
+            )
+            self.assertEqual(inserted[0].dtype, 'datetime64[s]')
+
+    def test_column_timezone(self):
+        # Daylight saving time transition in Europe/Moscow timezone.
+        columns = "a DateTime('Europe/Moscow')"
+
+        with self.create_table(columns):
+            self.emit_cli(
+                "INSERT INTO test VALUES "
+                "('2010-03-28 01:30:00'), ('2010-03-28 03:30:00'), "
+                "('2011-03-27 03:30:00')"
+            )
+
+            query = 'SELECT * FROM test'
+            expected = self.client.execute(
+                query, columnar=True, settings={'use_numpy': False}
+            )
+            inserted = self.client.execute(query, columnar=True)
+            self.assertArraysEqual(inserted[0], expected[0])
+
+
+class UTCOffsetsTestCase(TestCase):
+    def setUp(self):
+        if np is None:
+            self.skipTest('NumPy package is not installed')
+
+        super(UTCOffsetsTestCase, self).setUp()
+
+    def test_offsets_by_transitions_table(self):
+        from clickhouse_driver.columns.numpy.datetimecolumn import (
+            get_utc_offsets, transitions_cache
+        )
+
+        # Decades with many transitions in one block.
+        timestamps = np.linspace(-2 ** 31, 2 ** 32, 1000).astype(np.int64)
+
+        for tz_name in ('Europe/Moscow', 'America/New_York', 'UTC'):
+            tz = timezone(tz_name)
+            offsets = np.broadcast_to(
+                get_utc_offsets(timestamps, tz), timestamps.shape
+            )
+            expected = [
+                datetime.fromtimestamp(x, tz).utcoffset().total_seconds()
+                for x in timestamps.tolist()
+            ]
+            self.assertEqual(offsets.tolist(), expected)
+            self.assertIn(tz, transitions_cache)
@@ -0,0 +1,54 @@
+from tests.numpy.testcase import NumpyBaseTestCase
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+
+class EnumTestCase(NumpyBaseTestCase):
+    def setUp(self):
+        if pd is None:
+            self.skipTest('pandas package is not installed')
+
+        super(EnumTestCase, self).setUp()
+
+    def test_simple(self):
+        columns = "a Enum8('hello' = -1, 'world' = 5)"
+
+        with self.create_table(columns):
+            self.emit_cli(
+                "INSERT INTO test VALUES ('world'), ('hello'), ('world')"
+            )
+
+            query = 'SELECT * FROM test'
+            inserted = self.client.execute(query, columnar=True)
+            column = inserted[0]
+
+            self.assertTrue(isinstance(column, pd.Categorical))
+            self.assertEqual(list(column.categories), ['hello', 'world'])
+            self.assertEqual(list(column), ['world', 'hello', 'world'])
+
+    def test_nullable(self):
+        columns = "a Nullable(Enum16('hello' = -300, 'world' = 300))"
+
+        with self.create_table(columns):
+            self.emit_cli(
+                "INSERT INTO test VALUES ('world'), (NULL), ('hello')"
+            )
+
+            query = 'SELECT * FROM test'
+            inserted = self.client.execute(query, columnar=True)
+            self.assertEqual(list(inserted[0].codes), [1, -1, 0])
+
+    def test_insert_categorical(self):
+        columns = "a Nullable(Enum8('hello' = 1, 'world' = 2))"
+
+        with self.create_table(columns):
+            data = [pd.Categorical(['world', None, 'hello'])]
+            self.client.execute(
+                'INSERT INTO test VALUES', data, columnar=True
+            )
+
+            inserted = self.emit_cli('SELECT * FROM test')
+            self.assertEqual(inserted, 'world\n\\N\nhello\n')
@@ -0,0 +1,16 @@
+from tests.numpy.testcase import NumpyBaseTestCase
+
+
+class FloatTestCase(NumpyBaseTestCase):
+    def test_float(self):
+        with self.create_table('a Float32, b Float64'):
+            self.emit_cli(
+                'INSERT INTO test VALUES (3.5, 1.25), (-0.5, 1e300)'
+            )
+
+            query = 'SELECT * FROM test'
+            inserted = self.client.execute(query, columnar=True)
+            self.assertArraysEqual(inserted[0], [3.5, -0.5])
+            self.assertArraysEqual(inserted[1], [1.25, 1e300])
+            self.assertEqual(inserted[0].dtype, 'float32')
+            self.assertEqual(inserted[1].dtype, 'float64')
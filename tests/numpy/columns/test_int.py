@@ -0,0 +1,55 @@
+from tests.numpy.testcase import NumpyBaseTestCase
+
+
+class IntTestCase(NumpyBaseTestCase):
+    def test_chop_to_type(self):
+        columns = (
+            'a UInt8, b UInt16, c UInt32, d UInt64, '
+            'e Int8, f Int16, g Int32, h Int64'
+        )
+
+        data = [
+            (255, 65535, 4294967295, 18446744073709551615,
+             -128, -32768, -2147483648, -9223372036854775808),
+            (0, 0, 0, 0, 127, 32767, 2147483647, 9223372036854775807)
+        ]
+
+        with self.create_table(columns):
+            self.emit_cli(
+                'INSERT INTO test VALUES ({}), ({})'.format(
+                    ', '.join(str(x) for x in data[0]),
+                    ', '.join(str(x) for x in data[1])
+                )
+            )
+
+            query = 'SELECT * FROM test'
+            inserted = self.client.execute(query, columnar=True)
+
+            dtypes = [
+                'uint8', 'uint16', 'uint32', 'uint64',
+                'int8', 'int16', 'int32', 'int64'
+            ]
+            for column, expected, dtype in zip(inserted, zip(*data), dtypes):
+                self.assertArraysEqual(column, expected)
+                self.assertEqual(column.dtype, dtype)
+
+    def test_multiple_blocks(self):
+        rv = self.client.execute(
+            'SELECT toInt32(number) FROM system.numbers LIMIT 10',
+            columnar=True, settings={'max_block_size': 3}
+        )
+        self.assertEqual(len(rv), 1)
+        self.assertArraysEqual(rv[0], range(10))
+
+    def test_rows(self):
+        rv = self.client.execute(
+            'SELECT toUInt8(number) FROM system.numbers LIMIT 3'
+        )
+        self.assertEqual(rv, [(0, ), (1, ), (2, )])
+
+    def test_generic_column_fallback(self):
+        rv = self.client.execute(
+            "SELECT toInt16(1) AS x, 'abc' AS y", columnar=True
+        )
+        self.assertArraysEqual(rv[0], [1])
+        self.assertEqual(rv[1], ('abc', ))
@@ -0,0 +1,61 @@
+from tests.numpy.testcase import NumpyBaseTestCase
+from tests.util import require_server_version
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+
+class LowCardinalityTestCase(NumpyBaseTestCase):
+    def setUp(self):
+        if pd is None:
+            self.skipTest('pandas package is not installed')
+
+        super(LowCardinalityTestCase, self).setUp()
+
+    @require_server_version(19, 3, 3)
+    def test_simple(self):
+        columns = 'a LowCardinality(String)'
+
+        with self.create_table(columns):
+            self.emit_cli(
+                "INSERT INTO test VALUES ('world'), ('hello'), ('world')"
+            )
+
+            query = 'SELECT * FROM test'
+            inserted = self.client.execute(query, columnar=True)
+            column = inserted[0]
+
+            self.assertTrue(isinstance(column, pd.Categorical))
+            self.assertEqual(list(column), ['world', 'hello', 'world'])
+
+    @require_server_version(19, 3, 3)
+    def test_nullable(self):
+        columns = 'a LowCardinality(Nullable(String))'
+
+        with self.create_table(columns):
+            self.emit_cli(
+                "INSERT INTO test VALUES ('world'), (NULL), ('world')"
+            )
+
+            query = 'SELECT * FROM test'
+            inserted = self.client.execute(query, columnar=True)
+            column = inserted[0]
+
+            self.assertEqual(list(column.codes == -1), [False, True, False])
+            self.assertEqual(column[0], 'world')
+            self.assertEqual(column[2], 'world')
+
+    @require_server_version(19, 3, 3)
+    def test_insert_categorical(self):
+        columns = 'a LowCardinality(Nullable(String))'
+
+        with self.create_table(columns):
+            data = [pd.Categorical(['world', None, 'hello'])]
+            self.client.execute(
+                'INSERT INTO test VALUES', data, columnar=True
+            )
+
+            inserted = self.emit_cli('SELECT * FROM test')
+            self.assertEqual(inserted, 'world\n\\N\nhello\n')
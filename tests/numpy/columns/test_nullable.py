@@ -0,0 +1,15 @@
+from tests.numpy.testcase import NumpyBaseTestCase, np
+
+
+class NullableTestCase(NumpyBaseTestCase):
+    def test_simple(self):
+        with self.create_table('a Nullable(Int32)'):
+            self.emit_cli('INSERT INTO test VALUES (3), (NULL), (2)')
+
+            query = 'SELECT * FROM test'
+            inserted = self.client.execute(query, columnar=True)
+            column = inserted[0]
+
+            self.assertTrue(isinstance(column, np.ma.MaskedArray))
+            self.assertEqual(column.tolist(), [3, None, 2])
+            self.assertEqual(column.mask.tolist(), [False, True, False])
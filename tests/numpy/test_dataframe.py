@@ -0,0 +1,89 @@
+from datetime import date
+
+from clickhouse_driver import errors
+from tests.numpy.testcase import NumpyBaseTestCase, np
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+
+class DataFrameTestCase(NumpyBaseTestCase):
+    client_kwargs = {}
+
+    def setUp(self):
+        if pd is None:
+            self.skipTest('pandas package is not installed')
+
+        super(DataFrameTestCase, self).setUp()
+
+    def test_query_dataframe(self):
+        columns = (
+            "a Int32, b String, c Nullable(Int64), d Nullable(Float64), "
+            "e Date, f Enum8('x' = 1, 'y' = 2)"
+        )
+
+        with self.create_table(columns):
+            self.emit_cli(
+                "INSERT INTO test VALUES "
+                "(1, 'a', 5, NULL, '2012-10-25', 'x'), "
+                "(2, 'b', NULL, 0.5, '1970-01-01', 'y')"
+            )
+
+            df = self.client.query_dataframe('SELECT * FROM test')
+
+            self.assertEqual(list(df.columns), list('abcdef'))
+            self.assertEqual(df['a'].dtype, np.int32)
+            self.assertEqual(df['a'].tolist(), [1, 2])
+            self.assertEqual(df['b'].tolist(), ['a', 'b'])
+            self.assertEqual(df['c'].dtype, 'Int64')
+            self.assertEqual(df['c'].isnull().tolist(), [False, True])
+            self.assertEqual(df['d'].isnull().tolist(), [True, False])
+            self.assertEqual(df['e'].dt.date.tolist(),
+                             [date(2012, 10, 25), date(1970, 1, 1)])
+            self.assertEqual(df['f'].dtype, 'category')
+            self.assertEqual(df['f'].tolist(), ['x', 'y'])
+
+    def test_insert_dataframe(self):
+        columns = 'a Int32, b String, c Nullable(Int64), d Nullable(Float64)'
+
+        with self.create_table(columns):
+            df = pd.DataFrame({
+                'd': [None, 0.5],
+                'c': pd.Series([5, None], dtype='Int64'),
+                'b': ['a', 'b'],
+                'a': np.array([1, 2], dtype=np.int32),
+                'extra': [1, 2]
+            })
+
+            with self.assertRaises(ValueError) as e:
+                self.client.insert_dataframe(
+                    'INSERT INTO test (a, b, c, d) VALUES', df[['a']]
+                )
+            self.assertIn('DataFrame missing required columns',
+                          str(e.exception))
+
+            self.client.insert_dataframe(
+                'INSERT INTO test (a, b, c, d) VALUES', df
+            )
+
+            inserted = self.emit_cli('SELECT * FROM test')
+            self.assertEqual(inserted, '1\ta\t5\t\\N\n2\tb\t\\N\t0.5\n')
+
+    def test_insert_dataframe_types_check(self):
+        with self.create_table('a Int8'):
+            df = pd.DataFrame({'a': np.array([1, 1000], dtype=np.int64)})
+
+            with self.assertRaises(errors.TypeMismatchError):
+                self.client.insert_dataframe(
+                    'INSERT INTO test (a) VALUES', df, types_check=True
+                )
+
+            self.client.insert_dataframe(
+                'INSERT INTO test (a) VALUES', df[:1], types_check=True,
+                settings={'insert_block_size': 1}
+            )
+
+            inserted = self.emit_cli('SELECT * FROM test')
+            self.assertEqual(inserted, '1\n')
@@ -0,0 +1,140 @@
+from datetime import date, datetime
+
+from pytz import utc
+
+from clickhouse_driver import errors
+from tests.numpy.testcase import NumpyBaseTestCase, np
+
+
+class InsertTestCase(NumpyBaseTestCase):
+    def test_insert_arrays(self):
+        with self.create_table('a Int32, b UInt64, c Float32'):
+            data = [
+                np.array([1, 2, 3], dtype=np.int32),
+                np.array([0, 18446744073709551615, 5], dtype=np.uint64),
+                np.array([0.5, 1.5, 2.5], dtype=np.float32)
+            ]
+            self.client.execute(
+                'INSERT INTO test VALUES', data, columnar=True
+            )
+
+            query = 'SELECT * FROM test'
+            inserted = self.emit_cli(query)
+            self.assertEqual(
+                inserted,
+                '1\t0\t0.5\n2\t18446744073709551615\t1.5\n3\t5\t2.5\n'
+            )
+
+            inserted = self.client.execute(query, columnar=True)
+            for column, expected in zip(inserted, data):
+                self.assertArraysEqual(column, expected)
+
+    def test_insert_casts_to_column_type(self):
+        with self.create_table('a Int8'):
+            data = [np.array([1, 2, 3], dtype=np.int64)]
+            self.client.execute(
+                'INSERT INTO test VALUES', data, columnar=True
+            )
+
+            inserted = self.emit_cli('SELECT * FROM test')
+            self.assertEqual(inserted, '1\n2\n3\n')
+
+    def test_insert_masked_array(self):
+        with self.create_table('a Nullable(Int32)'):
+            data = [np.ma.masked_array([1, 0, 3], mask=[False, True, False])]
+            self.client.execute(
+                'INSERT INTO test VALUES', data, columnar=True
+            )
+
+            query = 'SELECT * FROM test'
+            inserted = self.emit_cli(query)
+            self.assertEqual(inserted, '1\n\\N\n3\n')
+
+            inserted = self.client.execute(query, columnar=True)
+            self.assertEqual(inserted[0].tolist(), [1, None, 3])
+
+    def test_insert_rows_with_nulls(self):
+        with self.create_table('a Nullable(Float64)'):
+            data = [(1.5, ), (None, )]
+            self.client.execute('INSERT INTO test VALUES', data)
+
+            inserted = self.emit_cli('SELECT * FROM test')
+            self.assertEqual(inserted, '1.5\n\\N\n')
+
+    def test_insert_dates(self):
+        with self.create_table('a Date, b DateTime'):
+            data = [
+                np.array(['2012-10-25', '1970-01-01'], dtype='datetime64[D]'),
+                np.array(
+                    ['2012-10-25T14:07:19', '1970-01-02T00:00:00'],
+                    dtype='datetime64[s]'
+                )
+            ]
+            self.client.execute(
+                'INSERT INTO test VALUES', data, columnar=True
+            )
+
+            query = 'SELECT * FROM test'
+            inserted = self.client.execute(
+                query, settings={'use_numpy': False}
+            )
+            self.assertEqual(inserted, [
+                (date(2012, 10, 25), datetime(2012, 10, 25, 14, 7, 19)),
+                (date(1970, 1, 1), datetime(1970, 1, 2))
+            ])
+
+    def test_insert_datetime_column_timezone(self):
+        # Daylight saving time transition in Europe/Moscow timezone.
+        with self.create_table("a DateTime('Europe/Moscow')"):
+            data = [
+                datetime(2010, 3, 28, 1, 30), datetime(2010, 3, 28, 3, 30),
+                datetime(2011, 3, 27, 3, 30)
+            ]
+            self.client.execute(
+                'INSERT INTO test VALUES',
+                [np.array(data, dtype='datetime64[s]')], columnar=True
+            )
+
+            query = 'SELECT * FROM test'
+            inserted = self.client.execute(
+                query, columnar=True, settings={'use_numpy': False}
+            )
+            self.assertEqual(inserted[0], tuple(data))
+
+    def test_insert_offset_aware_datetimes(self):
+        with self.create_table("a DateTime('Europe/Moscow')"):
+            dt = datetime(2020, 1, 1, tzinfo=utc)
+            data = [np.array([dt, datetime(2020, 1, 1, 3)], dtype=object)]
+            self.client.execute(
+                'INSERT INTO test VALUES', data, columnar=True
+            )
+            self.client.execute('INSERT INTO test VALUES', [(dt, )])
+
+            inserted = self.emit_cli('SELECT toUInt32(a) FROM test')
+            self.assertEqual(inserted, '1577836800\n' * 3)
+
+    def test_insert_rows_with_generic_columns(self):
+        with self.create_table('a UInt8, b Date'):
+            data = [(1, date(2012, 10, 25)), (2, date(1970, 1, 1))]
+            self.client.execute('INSERT INTO test VALUES', data)
+
+            inserted = self.emit_cli('SELECT * FROM test')
+            self.assertEqual(inserted, '1\t2012-10-25\n2\t1970-01-01\n')
+
+    def test_insert_types_check(self):
+        with self.create_table('a Int8'):
+            data = [np.array([1, 1000], dtype=np.int64)]
+            with self.assertRaises(errors.TypeMismatchError):
+                self.client.execute(
+                    'INSERT INTO test VALUES', data, columnar=True,
+                    types_check=True
+                )
+
+            data = [np.array([1, 2], dtype=np.int64)]
+            self.client.execute(
+                'INSERT INTO test VALUES', data, columnar=True,
+                types_check=True
+            )
+
+            inserted = self.emit_cli('SELECT * FROM test')
+            self.assertEqual(inserted, '1\n2\n')
@@ -0,0 +1,20 @@
+from tests.testcase import BaseTestCase
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class NumpyBaseTestCase(BaseTestCase):
+    client_kwargs = {'settings': {'use_numpy': True}}
+
+    def setUp(self):
+        if np is None:
+            self.skipTest('NumPy package is not installed')
+
+        super(NumpyBaseTestCase, self).setUp()
+
+    def assertArraysEqual(self, first, second):
+        self.assertTrue(isinstance(first, np.ndarray))
+        self.assertEqual(first.tolist(), list(second))
@@ -0,0 +1,125 @@
+from unittest import TestCase
+
+from clickhouse_driver.adaptivecompression import (
+    CompressionSelector, MethodStats
+)
+from clickhouse_driver.client import Client
+from tests.testcase import BaseTestCase
+
+
+class CompressionSelectorTestCase(TestCase):
+    def get_selector(self):
+        selector = CompressionSelector()
+        # Measurements on samples are replaced by fixed ones.
+        selector.stats = {
+            False: MethodStats(1.0, float('inf')),
+            'lz4': MethodStats(0.5, 1e9),
+            'zstd': MethodStats(0.25, 2e8)
+        }
+        return selector
+
+    def test_no_measurements(self):
+        selector = self.get_selector()
+        self.assertEqual(selector.method, 'lz4')
+        self.assertFalse(selector.update())
+        self.assertEqual(selector.method, 'lz4')
+
+    def test_fast_network(self):
+        selector = self.get_selector()
+        selector.add_rtt(0.0001)
+
+        self.assertTrue(selector.update())
+        self.assertIs(selector.method, False)
+
+    def test_slow_network(self):
+        selector = self.get_selector()
+        selector.add_rtt(0.1)
+
+        self.assertTrue(selector.update())
+        self.assertEqual(selector.method, 'zstd')
+
+    def test_bandwidth(self):
+        selector = self.get_selector()
+        selector.add_rtt(0.0001)
+        selector.update()
+        self.assertIs(selector.method, False)
+
+        # Small transfers don't block and aren't measured.
+        selector.add_transfer(1000, 0.1)
+        self.assertIsNone(selector.bandwidth)
+
+        selector.add_transfer(10 * 1048576, 0.125)
+        self.assertEqual(selector.get_bandwidth(), 80 * 1048576)
+        self.assertTrue(selector.update())
+        self.assertEqual(selector.method, 'lz4')
+
+        # Bandwidth is limited by window per round trip.
+        selector.reset()
+        selector.add_rtt(0.1)
+        selector.add_transfer(10 * 1048576, 0.001)
+        self.assertEqual(selector.get_bandwidth(), 4194304 / 0.1)
+
+    def test_switch_threshold(self):
+        selector = self.get_selector()
+        # zstd is cheaper by 5% only.
+        selector.stats['lz4'] = MethodStats(0.5, 1e9)
+        selector.stats['zstd'] = MethodStats(0.475, 1e9)
+        selector.add_transfer(2 * 1048576, 1.0)
+
+        self.assertFalse(selector.update())
+        self.assertEqual(selector.method, 'lz4')
+
+    def test_sample(self):
+        selector = CompressionSelector()
+        lz4_stats = selector.stats['lz4']
+        ratio = lz4_stats.ratio
+
+        # Too small sample.
+        selector.add_sample(b'a' * 100)
+        self.assertFalse(selector.sampled)
+
+        selector.add_sample(bytearray(b'abc' * 10000))
+        self.assertTrue(selector.sampled)
+        self.assertLess(lz4_stats.ratio, ratio)
+
+        # The only sample per query is taken.
+        ratio = lz4_stats.ratio
+        selector.add_sample(b'abc' * 10000)
+        self.assertEqual(lz4_stats.ratio, ratio)
+
+        selector.update()
+        self.assertFalse(selector.sampled)
+
+    def test_unavailable_method(self):
+        selector = CompressionSelector(methods=(False, 'lz4', 'unknown'))
+        self.assertEqual(sorted(selector.compressors), ['lz4'])
+
+
+class AutoCompressionTestCase(BaseTestCase):
+    def _create_client(self):
+        return Client(
+            self.host, self.port, self.database, self.user, self.password,
+            compression='auto'
+        )
+
+    def test_switch(self):
+        connection = self.client.connection
+        selector = connection.compression_selector
+
+        with self.create_table('a UInt32, b String'):
+            data = [(i, str(i)) for i in range(10000)]
+
+            for method in ['zstd', False, 'lz4']:
+                selector.method = method
+                connection.set_compression(method)
+                connection.block_in = connection.get_block_in_stream()
+                connection.block_out = connection.get_block_out_stream()
+                selector.update = lambda: False
+
+                self.client.execute('INSERT INTO test (a, b) VALUES', data)
+                inserted = self.client.execute('SELECT count() FROM test')
+                self.assertEqual(inserted, [(len(data), )])
+
+                self.client.execute('TRUNCATE TABLE test')
+
+            self.assertIsNotNone(selector.rtt)
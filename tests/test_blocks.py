@@ -1,5 +1,7 @@
 import types
+from unittest import TestCase
 
+from clickhouse_driver.block import ColumnOrientedBlock, RowOrientedBlock
 from clickhouse_driver.errors import ServerException
 from tests.testcase import BaseTestCase
 from tests.util import capture_logging, require_server_version
@@ -154,3 +156,78 @@ class LogTestCase(BaseTestCase):
             query = 'SELECT 1'
             self.client.execute(query, settings=settings)
             self.assertIn(query, buffer.getvalue())
+
+
+class RowsViewTestCase(TestCase):
+    def setUp(self):
+        self.block = ColumnOrientedBlock(
+            [('a', 'UInt8'), ('b', 'String')],
+            [(1, 2, 3), ('x', 'y', 'z')],
+            received_from_server=True
+        )
+
+    def test_iterate(self):
+        rows = self.block.get_rows()
+
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(list(rows), [(1, 'x'), (2, 'y'), (3, 'z')])
+        self.assertEqual(rows, [(1, 'x'), (2, 'y'), (3, 'z')])
+
+    def test_unhashable(self):
+        with self.assertRaises(TypeError):
+            hash(self.block.get_rows())
+
+    def test_getitem(self):
+        rows = self.block.get_rows()
+
+        self.assertEqual(rows[0], (1, 'x'))
+        self.assertEqual(rows[-1], (3, 'z'))
+        self.assertEqual(rows[1:], [(2, 'y'), (3, 'z')])
+
+        with self.assertRaises(IndexError):
+            rows[3]
+
+    def test_namedtuple(self):
+        rows = self.block.get_rows(row_type='namedtuple')
+
+        row = rows[0]
+        self.assertEqual(row, (1, 'x'))
+        self.assertEqual((row.a, row.b), (1, 'x'))
+        self.assertEqual([x.b for x in rows], ['x', 'y', 'z'])
+        self.assertEqual(rows[1:][0].a, 2)
+
+    def test_namedtuple_invalid_names(self):
+        block = ColumnOrientedBlock(
+            [('count()', 'UInt8'), ('a', 'UInt8'), ('a', 'UInt8')],
+            [(1, ), (2, ), (3, )],
+            received_from_server=True
+        )
+        row = block.get_rows(row_type='namedtuple')[0]
+
+        self.assertEqual(row._fields, ('_0', 'a', '_2'))
+        self.assertEqual(row, (1, 2, 3))
+
+    def test_dict(self):
+        rows = self.block.get_rows(row_type='dict')
+
+        self.assertEqual(rows[0], {'a': 1, 'b': 'x'})
+        self.assertEqual(list(rows)[-1], {'a': 3, 'b': 'z'})
+        self.assertEqual(rows[:1], [{'a': 1, 'b': 'x'}])
+
+    def test_unknown_row_type(self):
+        with self.assertRaises(ValueError) as e:
+            self.block.get_rows(row_type='list')
+
+        self.assertIn("Unknown row type 'list'", str(e.exception))
+
+    def test_row_oriented_block(self):
+        block = RowOrientedBlock(
+            [('a', 'UInt8'), ('b', 'String')], [(1, 'x'), (2, 'y')]
+        )
+
+        self.assertEqual(block.get_rows(), [(1, 'x'), (2, 'y')])
+        self.assertEqual(block.get_rows(row_type='namedtuple')[1].b, 'y')
+        self.assertEqual(
+            block.get_rows(row_type='dict'),
+            [{'a': 1, 'b': 'x'}, {'a': 2, 'b': 'y'}]
+        )
@@ -0,0 +1,36 @@
+from unittest import TestCase
+
+from .util import BytesReader, PyBytesReader
+
+
+class BufferedReaderTestCase(TestCase):
+    reader_cls = BytesReader
+
+    def test_read_into(self):
+        data = bytes(bytearray(range(100)))
+        reader = self.reader_cls(data, 7)
+
+        buffer = bytearray(b'x' * 102)
+        reader.read_into(buffer, 1, 50)
+        reader.read_into(buffer, 51, 50)
+
+        self.assertEqual(buffer, b'x' + data + b'x')
+
+    def test_read_into_mixed_with_read(self):
+        reader = self.reader_cls(b'abcdefghij', 3)
+        buffer = bytearray(4)
+
+        self.assertEqual(reader.read(2), b'ab')
+        reader.read_into(buffer, 0, 4)
+        self.assertEqual(buffer, b'cdef')
+        self.assertEqual(reader.read_one(), ord('g'))
+
+    def test_read_into_eof(self):
+        reader = self.reader_cls(b'abc', 2)
+
+        with self.assertRaises(EOFError):
+            reader.read_into(bytearray(4), 0, 4)
+
+
+class PyBufferedReaderTestCase(BufferedReaderTestCase):
+    reader_cls = PyBytesReader
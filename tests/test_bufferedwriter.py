@@ -0,0 +1,118 @@
+# coding: utf-8
+import socket
+import threading
+from unittest import TestCase
+
+from clickhouse_driver.bufferedwriter import BufferedSocketWriter
+from clickhouse_driver.writer import write_varint
+from .util import BytesWriter, PyBytesWriter
+
+
+class BufferedWriterTestCase(TestCase):
+    writer_cls = BytesWriter
+
+    def test_small_writes_are_buffered(self):
+        writer = self.writer_cls(8)
+
+        writer.write(b'abc')
+        writer.write(bytearray(b'def'))
+        self.assertEqual(writer.chunks, [])
+
+        writer.write(b'gh')
+        writer.flush()
+        self.assertEqual(writer.chunks, [[b'abcdefgh']])
+
+        # Nothing to send.
+        writer.flush()
+        self.assertEqual(len(writer.chunks), 1)
+
+    def test_buffer_overflow(self):
+        writer = self.writer_cls(8)
+
+        writer.write(b'abcdef')
+        writer.write(b'ghi')
+        writer.flush()
+
+        # Buffer is sent full.
+        self.assertEqual(writer.chunks, [[b'abcdefgh'], [b'i']])
+
+    def test_large_write_is_not_copied(self):
+        writer = self.writer_cls(8)
+
+        writer.write(b'ab')
+        writer.write(b'x' * 20)
+        writer.write(memoryview(b'cd'))
+        writer.flush()
+
+        self.assertEqual(writer.chunks, [[b'ab', b'x' * 20], [b'cd']])
+
+    def test_varint(self):
+        writer = self.writer_cls(8)
+
+        for number in (0, 127, 128, 300, 1 << 63):
+            write_varint(number, writer)
+        writer.flush()
+
+        self.assertEqual(
+            writer.getvalue(),
+            b'\x00\x7f\x80\x01\xac\x02' +
+            b'\x80\x80\x80\x80\x80\x80\x80\x80\x80\x01'
+        )
+
+    def test_write_strings(self):
+        writer = self.writer_cls(8)
+
+        writer.write_strings([u'ab', u'тест', b'x' * 10], encode=True)
+        writer.write_strings([b'', bytearray(b'cd')])
+        writer.flush()
+
+        self.assertEqual(
+            writer.getvalue(),
+            b'\x02ab\x08' + u'тест'.encode('utf-8') + b'\x0a' + b'x' * 10 +
+            b'\x00\x02cd'
+        )
+
+    def test_close_drops_buffered_data(self):
+        writer = self.writer_cls(8)
+
+        writer.write(b'abc')
+        writer.close()
+        writer.flush()
+
+        self.assertEqual(writer.chunks, [])
+
+
+class PyBufferedWriterTestCase(BufferedWriterTestCase):
+    writer_cls = PyBytesWriter
+
+
+class BufferedSocketWriterTestCase(TestCase):
+    def test_partial_sends(self):
+        # Socket buffer is much smaller than data: sends are partial.
+        sock, peer = socket.socketpair()
+        self.addCleanup(sock.close)
+        self.addCleanup(peer.close)
+        sock.settimeout(10)
+
+        received = []
+
+        def receive():
+            while True:
+                data = peer.recv(65536)
+                if not data:
+                    break
+                received.append(data)
+
+        thread = threading.Thread(target=receive)
+        thread.start()
+
+        data = bytes(bytearray(range(256))) * 16384
+        writer = BufferedSocketWriter(sock, 1024)
+        writer.write(b'abc')
+        writer.write(data)
+        writer.write(b'def')
+        writer.flush()
+        sock.shutdown(socket.SHUT_WR)
+        thread.join()
+
+        self.assertEqual(b''.join(received), b'abc' + data + b'def')
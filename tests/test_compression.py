@@ -1,11 +1,17 @@
 from datetime import date, datetime
+from io import BytesIO
+from multiprocessing.pool import ThreadPool
+from threading import Lock
+from time import sleep
 from unittest import TestCase
 
 from clickhouse_driver import errors
 from clickhouse_driver.client import Client
 from clickhouse_driver.compression import get_compressor_cls
 from clickhouse_driver.compression.lz4 import Compressor
+from clickhouse_driver.writer import write_binary_uint128
 from .testcase import BaseTestCase, file_config
+from .util import BytesReader
 
 
 class BaseCompressionTestCase(BaseTestCase):
@@ -76,6 +82,45 @@ class MiscCompressionTestCase(TestCase):
             e.exception.code, errors.ErrorCodes.UNKNOWN_COMPRESSION_METHOD
         )
 
+    def test_compression_level(self):
+        data = b''.join(
+            '{},{};'.format(i, 'abc' * (i % 7)).encode() for i in range(10000)
+        )
+
+        for alg, fast, high in [('zstd', 1, 19), ('lz4hc', 1, 12)]:
+            compressor = get_compressor_cls(alg)(level=fast)
+            fast_size = len(compressor.compress(data))
+
+            compressor.level = high
+            self.assertLess(len(compressor.compress(data)), fast_size)
+
+
+class CompressionLevelTestCase(BaseCompressionTestCase):
+    compression = 'zstd'
+
+    def _create_client(self):
+        return Client(
+            self.host, self.port, self.database, self.user, self.password,
+            compression=self.compression, compression_level=1
+        )
+
+    def test_query_level(self):
+        with self.create_table('a String'):
+            data = [('abc' * i, ) for i in range(100)]
+
+            self.client.execute(
+                'INSERT INTO test (a) VALUES', data,
+                settings={'compression_level': 19}
+            )
+            compressor = self.client.connection.block_out.compressor
+            self.assertEqual(compressor.level, 19)
+
+            self.client.execute('INSERT INTO test (a) VALUES', data)
+            self.assertEqual(compressor.level, 1)
+
+            inserted = self.client.execute('SELECT * FROM test')
+            self.assertEqual(inserted, data * 2)
+
 
 class ReadByBlocksTestCase(BaseCompressionTestCase):
     compression = 'lz4'
@@ -92,3 +137,178 @@ class ReadByBlocksTestCase(BaseCompressionTestCase):
 
             inserted = self.client.execute(query)
             self.assertEqual(inserted, data)
+
+
+class DecompressionThreadsTestCase(ReadByBlocksTestCase):
+    def _create_client(self):
+        return Client(
+            self.host, self.port, self.database, self.user, self.password,
+            compression=self.compression, decompression_threads=4
+        )
+
+
+class CompressionThreadsTestCase(BaseCompressionTestCase):
+    compression = 'lz4'
+
+    def _create_client(self):
+        return Client(
+            self.host, self.port, self.database, self.user, self.password,
+            compression=self.compression, compress_block_size=1024,
+            compression_threads=4
+        )
+
+
+class ReadAheadTestCase(TestCase):
+    def make_frame(self, data):
+        compressed_hash, frame = Compressor().compress_frame(data)
+
+        rv = BytesIO()
+        write_binary_uint128(compressed_hash, rv)
+        rv.write(frame)
+        return rv.getvalue()
+
+    def read(self, raw, size, max_pending, decompressor=None):
+        from clickhouse_driver.streams.compressed import (
+            CompressedBlockInputStream
+        )
+
+        pool = ThreadPool(2)
+        try:
+            stream = CompressedBlockInputStream(
+                raw, None, pool=pool, max_pending=max_pending
+            )
+            if decompressor is not None:
+                stream.decompressors[decompressor.method_byte] = decompressor
+
+            return stream.fin.read(size), stream
+        finally:
+            pool.terminate()
+
+    def test_frames_are_read_ahead(self):
+        frames = [self.make_frame(bytes(bytearray([i])) * 100)
+                  for i in range(4)]
+        # End of stream packet follows the last frame.
+        raw = BytesReader(b''.join(frames) + b'\x05', 1048576)
+
+        data, stream = self.read(raw, 400, max_pending=2)
+        self.assertEqual(data, b''.join(bytes(bytearray([i])) * 100
+                                        for i in range(4)))
+        self.assertEqual(raw.read_one(), 5)
+        # Decompressor is shared by frames.
+        self.assertEqual(len(stream.decompressors), 1)
+
+    def test_partially_received_frame(self):
+        frames = [self.make_frame(b'a' * 100), self.make_frame(b'b' * 100)]
+        # The second frame doesn't fit into buffer and is read on demand.
+        raw = BytesReader(b''.join(frames), len(frames[0]) + 10)
+
+        data, stream = self.read(raw, 100, max_pending=2)
+        self.assertEqual(data, b'a' * 100)
+        self.assertEqual(len(stream.pending), 0)
+        self.assertEqual(raw.position, len(frames[0]))
+
+    def test_frames_in_flight(self):
+        from clickhouse_driver.compression.lz4 import Decompressor
+
+        lock = Lock()
+        in_flight = []
+
+        class TrackingDecompressor(Decompressor):
+            active = 0
+
+            def decompress_frame(self, *args):
+                with lock:
+                    self.active += 1
+                    in_flight.append(self.active)
+
+                sleep(0.05)
+                try:
+                    return super(TrackingDecompressor, self).decompress_frame(
+                        *args
+                    )
+                finally:
+                    with lock:
+                        self.active -= 1
+
+        frames = [self.make_frame(bytes(bytearray([i])) * 100)
+                  for i in range(4)]
+        raw = BytesReader(b''.join(frames), 1048576)
+
+        data, stream = self.read(
+            raw, 400, max_pending=2, decompressor=TrackingDecompressor(raw)
+        )
+        self.assertEqual(data, b''.join(bytes(bytearray([i])) * 100
+                                        for i in range(4)))
+        self.assertEqual(max(in_flight), 2)
+
+    def test_packet_after_block(self):
+        frame = self.make_frame(b'a' * 100)
+        # Next packet looks like frame header, but hash doesn't match.
+        packet = b'\x00' * 16 + b'\x82' + b'\x09\x00\x00\x00' * 2 + b'\x05'
+        raw = BytesReader(frame + packet, 1048576)
+
+        data, stream = self.read(raw, 100, max_pending=2)
+        self.assertEqual(data, b'a' * 100)
+        self.assertEqual(len(stream.pending), 1)
+
+        stream.reset()
+        self.assertEqual(len(stream.pending), 0)
+        self.assertEqual(raw.position, len(frame))
+
+
+class CompressedOutputTestCase(TestCase):
+    pool = None
+    max_pending = 0
+
+    def write(self, pieces, compress_block_size):
+        from clickhouse_driver.streams.compressed import (
+            CompressedBlockOutputStream
+        )
+
+        raw = BytesIO()
+        stream = CompressedBlockOutputStream(
+            Compressor, compress_block_size, raw, None, pool=self.pool,
+            max_pending=self.max_pending
+        )
+        for piece in pieces:
+            stream.fout.write(piece)
+        stream.finalize()
+
+        self.assertEqual(len(stream.pending), 0)
+        return raw.getvalue()
+
+    def read_frames(self, raw):
+        from clickhouse_driver.streams.compressed import (
+            CompressedBlockInputStream
+        )
+
+        stream = CompressedBlockInputStream(BytesReader(raw, 1048576), None)
+        frames = []
+        while stream.raw_fin.position < len(raw):
+            frames.append(bytes(stream.read_block()))
+
+        return frames
+
+    def test_frames_are_cut_while_writing(self):
+        pieces = [bytes(bytearray([i % 256])) * 30 for i in range(10)]
+        raw = self.write(pieces, 100)
+
+        frames = self.read_frames(raw)
+        self.assertEqual(b''.join(frames), b''.join(pieces))
+        self.assertEqual([len(x) for x in frames], [100, 100, 100])
+
+    def test_large_write_is_split(self):
+        data = bytes(bytearray(range(256))) * 10
+        raw = self.write([b'ab', data], 1000)
+
+        frames = self.read_frames(raw)
+        self.assertEqual(b''.join(frames), b'ab' + data)
+        self.assertEqual([len(x) for x in frames], [2, 1000, 1000, 560])
+
+
+class CompressedOutputThreadsTestCase(CompressedOutputTestCase):
+    max_pending = 2
+
+    def setUp(self):
+        self.pool = ThreadPool(2)
+        self.addCleanup(self.pool.terminate)
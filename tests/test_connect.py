@@ -7,8 +7,8 @@ from io import BytesIO
 from clickhouse_driver import errors
 from clickhouse_driver.client import Client
 from clickhouse_driver.protocol import ClientPacketTypes, ServerPacketTypes
-from clickhouse_driver.bufferedreader import BufferedReader
-from clickhouse_driver.writer import write_binary_str
+from clickhouse_driver.bufferedreader import BufferedReader, PyBufferedReader
+from clickhouse_driver.writer import write_binary_str, write_varint
 from tests.testcase import BaseTestCase
 from unittest import TestCase
 
@@ -127,9 +127,9 @@ class ConnectTestCase(BaseTestCase):
             self.assertEqual(rv, [(1, )])
 
 
-class FakeBufferedReader(BufferedReader):
+class FakeBufferedReaderMixin(object):
     def __init__(self, inputs, bufsize=128):
-        super(FakeBufferedReader, self).__init__(bufsize)
+        super(FakeBufferedReaderMixin, self).__init__(bufsize)
         self._inputs = inputs
         self._counter = 0
 
@@ -148,10 +148,19 @@ class FakeBufferedReader(BufferedReader):
             raise EOFError('Unexpected EOF while reading bytes')
 
 
+class FakeBufferedReader(FakeBufferedReaderMixin, BufferedReader):
+    pass
+
+
+class FakePyBufferedReader(FakeBufferedReaderMixin, PyBufferedReader):
+    pass
+
+
 class TestBufferedReader(TestCase):
+    reader_cls = FakeBufferedReader
 
     def test_corner_case_read(self):
-        rdr = FakeBufferedReader([
+        rdr = self.reader_cls([
             b'\x00' * 10,
             b'\xff' * 10,
         ])
@@ -163,7 +172,7 @@ class TestBufferedReader(TestCase):
         self.assertRaises(EOFError, rdr.read, 10)
 
     def test_cornder_case_read_to_end_of_buffer(self):
-        rdr = FakeBufferedReader([
+        rdr = self.reader_cls([
             b'\x00' * 10,
             b'\xff' * 10,
         ])
@@ -176,7 +185,7 @@ class TestBufferedReader(TestCase):
         self.assertRaises(EOFError, rdr.read, 10)
 
     def test_corner_case_exact_buffer(self):
-        rdr = FakeBufferedReader([
+        rdr = self.reader_cls([
             b'\x00' * 10,
             b'\xff' * 10,
         ], bufsize=10)
@@ -206,6 +215,21 @@ class TestBufferedReader(TestCase):
                     buf[split:split_2],
                     buf[split_2:],
                 ]
-                rdr = FakeBufferedReader(bufs, bufsize=4096)
+                rdr = self.reader_cls(bufs, bufsize=4096)
                 read_values = rdr.read_strings(2)
                 self.assertEqual(repr(ref_values), repr(read_values))
+
+    def test_read_strings_decode(self):
+        buf = BytesIO()
+        write_binary_str(u'Тест', buf)
+        write_varint(2, buf)
+        buf.write(b'\xff\xfe')
+        buf = buf.getvalue()
+
+        rdr = self.reader_cls([buf[:3], buf[3:]])
+        self.assertEqual(rdr.read_strings(2, decode=True),
+                         [u'Тест', b'\xff\xfe'])
+
+
+class TestPyBufferedReader(TestBufferedReader):
+    reader_cls = FakePyBufferedReader
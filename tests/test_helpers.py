@@ -0,0 +1,118 @@
+from threading import Thread, current_thread
+from unittest import TestCase
+
+from clickhouse_driver.util.helpers import (
+    LRUCache, chunks, estimate_item_size, estimate_size, pipeline,
+    sized_chunks
+)
+
+
+class ChunksTestCase(TestCase):
+    def test_chunks(self):
+        self.assertEqual(list(chunks(range(5), 2)), [[0, 1], [2, 3], [4]])
+
+    def test_estimate_size(self):
+        self.assertEqual(estimate_size((1, 'abc', b'de', [1.5, None])), 29)
+        self.assertEqual(estimate_size({'a': 'xyz'}), 3)
+
+    def test_sized_chunks(self):
+        rows = [('x' * 10, )] * 100
+        rv = list(sized_chunks(iter(rows), 1000, 200, sample_step=1))
+        self.assertEqual([len(x) for x in rv], [20] * 5)
+
+        # Rows count limit is still applied.
+        rv = list(sized_chunks(rows, 30, 10000))
+        self.assertEqual([len(x) for x in rv], [30, 30, 30, 10])
+
+    def test_estimate_item_size(self):
+        from array import array
+
+        self.assertEqual(estimate_item_size(array('q', [1, 2])), 8)
+        self.assertEqual(estimate_item_size(array('h', [1, 2])), 2)
+        self.assertEqual(estimate_item_size(['ab', 'abcd']), 3)
+        self.assertEqual(estimate_item_size([]), 0)
+
+
+class PipelineTestCase(TestCase):
+    def test_items_are_consumed_in_background(self):
+        consumed = []
+
+        def consume(item):
+            consumed.append((item, current_thread()))
+
+        pipeline(iter(range(5)), consume)
+
+        self.assertEqual([x for x, _ in consumed], list(range(5)))
+        self.assertTrue(all(x is not current_thread() for _, x in consumed))
+
+    def test_consumer_error(self):
+        pulled = []
+
+        def items():
+            for x in range(100):
+                pulled.append(x)
+                yield x
+
+        def consume(item):
+            raise ValueError(item)
+
+        with self.assertRaises(ValueError) as e:
+            pipeline(items(), consume)
+
+        self.assertEqual(e.exception.args, (0, ))
+        # Producer stops soon after failure.
+        self.assertLess(len(pulled), 100)
+
+    def test_producer_error(self):
+        consumed = []
+
+        def items():
+            yield 1
+            raise ZeroDivisionError()
+
+        with self.assertRaises(ZeroDivisionError):
+            pipeline(items(), consumed.append)
+
+
+class LRUCacheTestCase(TestCase):
+    def test_least_recently_used_is_evicted(self):
+        cache = LRUCache(2)
+        cache['a'] = 1
+        cache['b'] = 2
+
+        self.assertEqual(cache.get('a'), 1)
+        cache['c'] = 3
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.get('c'), 3)
+
+    def test_clear(self):
+        cache = LRUCache(2)
+        cache['a'] = 1
+        cache.clear()
+
+        self.assertEqual(cache.get('a', 0), 0)
+
+    def test_threads(self):
+        cache = LRUCache(4)
+        errors = []
+
+        def run(offset):
+            try:
+                for i in range(1000):
+                    key = (offset + i) % 8
+                    cache[key] = key
+                    cache.get(key)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [Thread(target=run, args=(x, )) for x in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertLessEqual(len(cache), 4)
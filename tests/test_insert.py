@@ -1,3 +1,4 @@
+from array import array
 from datetime import date
 
 from tests.testcase import BaseTestCase
@@ -135,3 +136,112 @@ class InsertTestCase(BaseTestCase):
                 'SELECT number FROM system.numbers LIMIT 5'
             )
             self.assertEqual(inserted, [])
+
+
+class InsertStreamingTestCase(BaseTestCase):
+    def test_block_bytes(self):
+        with self.create_table('a String'):
+            data = (('x' * 100, ) for _ in range(100))
+            self.client.execute(
+                'INSERT INTO test (a) VALUES', data,
+                settings={'insert_block_bytes': 1000}
+            )
+
+            inserted = self.client.execute('SELECT * FROM test')
+            self.assertEqual(inserted, [('x' * 100, )] * 100)
+
+    def test_pipelining(self):
+        with self.create_table('a Int32'):
+            data = ((x, ) for x in range(10))
+            self.client.execute(
+                'INSERT INTO test (a) VALUES', data,
+                settings={'insert_pipelining': True, 'insert_block_size': 3}
+            )
+
+            inserted = self.client.execute('SELECT * FROM test')
+            self.assertEqual(inserted, [(x, ) for x in range(10)])
+
+    def test_pipelining_error(self):
+        with self.create_table('a Int32'):
+            data = [(1, ), ('a', )]
+            with self.assertRaises(errors.TypeMismatchError):
+                self.client.execute(
+                    'INSERT INTO test (a) VALUES', data, types_check=True,
+                    settings={'insert_pipelining': True,
+                              'insert_block_size': 1}
+                )
+
+            self.assertEqual(self.client.execute('SELECT 1'), [(1, )])
+
+    def test_generator_error(self):
+        def data():
+            yield (1, )
+            raise ZeroDivisionError()
+
+        with self.create_table('a Int32'):
+            with self.assertRaises(ZeroDivisionError):
+                self.client.execute(
+                    'INSERT INTO test (a) VALUES', data(),
+                    settings={'insert_pipelining': True,
+                              'insert_block_size': 1}
+                )
+
+            self.assertEqual(self.client.execute('SELECT 1'), [(1, )])
+
+
+class InsertColumnarTestCase(BaseTestCase):
+    def test_insert_tuple_ok(self):
+        with self.create_table('a Int8, b Int8'):
+            data = [(1, 2, 3), (4, 5, 6)]
+            self.client.execute(
+                'INSERT INTO test (a, b) VALUES', data, columnar=True
+            )
+
+            query = 'SELECT * FROM test'
+            inserted = self.emit_cli(query)
+            self.assertEqual(inserted, '1\t4\n2\t5\n3\t6\n')
+            inserted = self.client.execute(query)
+            self.assertEqual(inserted, [(1, 4), (2, 5), (3, 6)])
+            inserted = self.client.execute(query, columnar=True)
+            self.assertEqual(inserted, [(1, 2, 3), (4, 5, 6)])
+
+    def test_insert_buffer(self):
+        with self.create_table('a Int64, b Float64'):
+            data = [array('q', [1, 2, 3]), array('d', [0.5, 1.5, 2.5])]
+            self.client.execute(
+                'INSERT INTO test (a, b) VALUES', data, columnar=True
+            )
+
+            query = 'SELECT * FROM test'
+            inserted = self.client.execute(query, columnar=True)
+            self.assertEqual(inserted, [(1, 2, 3), (0.5, 1.5, 2.5)])
+
+    def test_insert_multiple_blocks(self):
+        with self.create_table('a Int8'):
+            data = [list(range(10))]
+            self.client.execute(
+                'INSERT INTO test (a) VALUES', data, columnar=True,
+                settings={'insert_block_size': 3}
+            )
+
+            inserted = self.client.execute('SELECT * FROM test')
+            self.assertEqual(inserted, [(x, ) for x in range(10)])
+
+    def test_data_less_columns_then_expected(self):
+        with self.create_table('a Int8, b Int8'):
+            with self.assertRaises(ValueError) as e:
+                data = [(1, 2)]
+                self.client.execute(
+                    'INSERT INTO test (a, b) VALUES', data, columnar=True
+                )
+            self.assertEqual(str(e.exception), 'Expected 2 columns, got 1')
+
+    def test_data_different_columns_length(self):
+        with self.create_table('a Int8, b Int8'):
+            with self.assertRaises(ValueError) as e:
+                data = [(1, 2), (3, )]
+                self.client.execute(
+                    'INSERT INTO test (a, b) VALUES', data, columnar=True
+                )
+            self.assertEqual(str(e.exception),
+                             'Expected 2 rows in all columns')
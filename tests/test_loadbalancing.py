@@ -0,0 +1,156 @@
+from unittest import TestCase
+
+from mock import patch
+
+from clickhouse_driver import errors
+from clickhouse_driver.client import Client
+from clickhouse_driver.loadbalancing import LoadBalancer, parse_hosts
+from tests.testcase import BaseTestCase
+
+
+class ParseHostsTestCase(TestCase):
+    def test_string(self):
+        self.assertEqual(
+            parse_hosts('host1:9001, host2,[::1]:9002,[::2]', 9000),
+            [('host1', 9001), ('host2', 9000), ('::1', 9002), ('::2', 9000)]
+        )
+
+    def test_list(self):
+        self.assertEqual(
+            parse_hosts(['host1:9001', ('host2', 9002), 'host3'], 9000),
+            [('host1', 9001), ('host2', 9002), ('host3', 9000)]
+        )
+
+
+class LoadBalancerTestCase(TestCase):
+    hosts = [('host1', 9000), ('host2', 9000), ('host3', 9000)]
+
+    def get_names(self, balancer):
+        return [x.host for x in balancer.get_hosts()]
+
+    def test_unknown_policy(self):
+        with self.assertRaises(errors.UnknownLoadBalancingError):
+            LoadBalancer(self.hosts, policy='unknown')
+
+    def test_first_available(self):
+        balancer = LoadBalancer(self.hosts)
+        self.assertEqual(self.get_names(balancer), ['host1', 'host2', 'host3'])
+        self.assertEqual(self.get_names(balancer), ['host1', 'host2', 'host3'])
+
+    def test_round_robin(self):
+        balancer = LoadBalancer(self.hosts, policy='round_robin')
+        first = [self.get_names(balancer)[0] for _ in range(4)]
+        self.assertEqual(first, ['host1', 'host2', 'host3', 'host1'])
+
+    def test_random(self):
+        balancer = LoadBalancer(self.hosts, policy='random')
+        self.assertEqual(sorted(self.get_names(balancer)),
+                         ['host1', 'host2', 'host3'])
+
+    def test_nearest(self):
+        balancer = LoadBalancer(self.hosts, policy='nearest')
+        host1, host2, host3 = balancer.hosts
+
+        balancer.mark_connected(host1, 0.3)
+        balancer.mark_connected(host2, 0.1)
+        # Host with unknown latency goes first.
+        self.assertEqual(self.get_names(balancer), ['host3', 'host2', 'host1'])
+
+        balancer.mark_connected(host3, 0.2)
+        self.assertEqual(self.get_names(balancer), ['host2', 'host3', 'host1'])
+
+        # Latency is smoothed.
+        balancer.mark_connected(host2, 1.1)
+        self.assertAlmostEqual(host2.latency, 0.4)
+        self.assertEqual(self.get_names(balancer), ['host3', 'host1', 'host2'])
+
+    def test_failed_host_is_skipped(self):
+        balancer = LoadBalancer(self.hosts, backoff=10, max_backoff=30)
+        host1, host2, _ = balancer.hosts
+
+        with patch('clickhouse_driver.loadbalancing.time') as mocked_time:
+            mocked_time.return_value = 100
+            balancer.mark_failed(host1)
+            balancer.mark_failed(host2)
+            balancer.mark_failed(host1)
+            self.assertEqual(host1.unhealthy_until, 120)
+            self.assertEqual(host2.unhealthy_until, 110)
+
+            # Hosts in backoff are tried after others.
+            self.assertEqual(self.get_names(balancer),
+                             ['host3', 'host2', 'host1'])
+
+            mocked_time.return_value = 115
+            self.assertEqual(self.get_names(balancer),
+                             ['host2', 'host3', 'host1'])
+
+            # Backoff is limited.
+            for _ in range(100):
+                balancer.mark_failed(host1)
+            self.assertEqual(host1.unhealthy_until, 145)
+
+            balancer.mark_connected(host1, 0.1)
+            self.assertEqual(self.get_names(balancer),
+                             ['host1', 'host2', 'host3'])
+
+    def test_attempts(self):
+        balancer = LoadBalancer(self.hosts)
+        host1, host2, host3 = balancer.hosts
+        tried = []
+
+        for attempt in balancer.attempts():
+            with attempt:
+                tried.append(attempt.host.host)
+                if attempt.host is host1:
+                    raise errors.NetworkError('Connection refused')
+
+        self.assertEqual(tried, ['host1', 'host2'])
+        self.assertEqual(host1.failures, 1)
+        self.assertIsNotNone(host2.latency)
+        self.assertIsNone(host3.latency)
+
+    def test_all_attempts_failed(self):
+        balancer = LoadBalancer(self.hosts)
+
+        with self.assertRaises(errors.SocketTimeoutError):
+            for attempt in balancer.attempts():
+                with attempt:
+                    raise errors.SocketTimeoutError('Timed out')
+
+        self.assertEqual([x.failures for x in balancer.hosts], [1, 1, 1])
+
+    def test_attempt_other_error(self):
+        balancer = LoadBalancer(self.hosts)
+
+        with self.assertRaises(ValueError):
+            for attempt in balancer.attempts():
+                with attempt:
+                    raise ValueError()
+
+        self.assertEqual([x.failures for x in balancer.hosts], [0, 0, 0])
+
+
+class FailoverTestCase(BaseTestCase):
+    def test_failover(self):
+        client = Client(
+            'localhost', 1, self.database, self.user, self.password,
+            alt_hosts='{}:{}'.format(self.host, self.port)
+        )
+
+        try:
+            self.assertEqual(client.execute('SELECT 1'), [(1, )])
+            self.assertEqual(client.connection.port, self.port)
+
+            host = client.connection.load_balancer.hosts[0]
+            self.assertEqual(host.failures, 1)
+        finally:
+            client.disconnect()
+
+    def test_all_hosts_failed(self):
+        client = Client('localhost', 1, alt_hosts='localhost:2')
+
+        with self.assertRaises(errors.NetworkError):
+            client.execute('SELECT 1')
+
+        hosts = client.connection.load_balancer.hosts
+        self.assertEqual([x.failures for x in hosts], [1, 1])
@@ -0,0 +1,126 @@
+from threading import Thread
+from time import time
+
+from mock import patch
+
+from clickhouse_driver import errors
+from clickhouse_driver.pool import ClientPool
+from tests.testcase import BaseTestCase
+
+
+class ClientPoolTestCase(BaseTestCase):
+    def create_pool(self, **kwargs):
+        return ClientPool(
+            self.host, self.port, self.database, self.user, self.password,
+            **kwargs
+        )
+
+    def test_execute(self):
+        pool = self.create_pool(max_size=2)
+        self.assertEqual(pool.execute('SELECT 1'), [(1, )])
+        self.assertEqual(pool.size, 1)
+        pool.disconnect()
+
+    def test_connection_is_reused(self):
+        pool = self.create_pool(max_size=2)
+
+        with pool.get_client() as client:
+            client.execute('SELECT 1')
+            connection = client.connection.socket
+
+        with pool.get_client() as client:
+            client.execute('SELECT 1')
+            self.assertIs(client.connection.socket, connection)
+
+        pool.disconnect()
+
+    def test_threads(self):
+        pool = self.create_pool(max_size=3)
+        results = []
+
+        def run():
+            for _ in range(10):
+                results.append(pool.execute('SELECT 1'))
+
+        threads = [Thread(target=run) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, [[(1, )]] * 60)
+        self.assertLessEqual(pool.size, 3)
+        pool.disconnect()
+
+    def test_no_free_client(self):
+        pool = self.create_pool(max_size=1)
+
+        with pool.get_client():
+            with self.assertRaises(errors.NoFreeConnectionError):
+                pool.acquire(timeout=0.1)
+
+        self.assertEqual(pool.execute('SELECT 1'), [(1, )])
+        pool.disconnect()
+
+    def test_idle_timeout(self):
+        pool = self.create_pool(min_size=1, max_size=2, idle_timeout=0)
+
+        first = pool.acquire()
+        second = pool.acquire()
+        first.execute('SELECT 1')
+        second.execute('SELECT 1')
+
+        pool.release(first)
+        pool.release(second)
+
+        # Only min_size clients are kept.
+        self.assertEqual(pool.size, 1)
+        self.assertFalse(first.connection.connected)
+        pool.disconnect()
+
+    def test_idle_timeout_on_acquire(self):
+        pool = self.create_pool(max_size=2, idle_timeout=10)
+
+        first = pool.acquire()
+        second = pool.acquire()
+        first.execute('SELECT 1')
+        second.execute('SELECT 1')
+
+        pool.release(first)
+        pool.release(second)
+        self.assertEqual(pool.size, 2)
+
+        with patch('clickhouse_driver.pool.time') as mocked_time:
+            mocked_time.return_value = time() + 100
+            client = pool.acquire()
+
+        # Expired clients are closed instead of being reused.
+        self.assertIsNot(client, first)
+        self.assertIsNot(client, second)
+        self.assertFalse(first.connection.connected)
+        self.assertFalse(second.connection.connected)
+        self.assertEqual(pool.size, 1)
+
+        pool.release(client)
+        pool.disconnect()
+
+    def test_min_size_clients_are_connected(self):
+        pool = self.create_pool(min_size=2, max_size=3)
+        self.assertEqual(pool.size, 2)
+
+        first = pool.acquire()
+        second = pool.acquire()
+        self.assertTrue(first.connection.connected)
+        self.assertTrue(second.connection.connected)
+
+        pool.release(first)
+        pool.release(second)
+        pool.disconnect()
+
+    def test_min_size_connection_failed(self):
+        with self.assertRaises(errors.NetworkError):
+            ClientPool('localhost', 1, min_size=1)
+
+    def test_sizes_validation(self):
+        with self.assertRaises(ValueError):
+            self.create_pool(min_size=2, max_size=1)
@@ -0,0 +1,150 @@
+from unittest import TestCase
+
+from clickhouse_driver.block import ColumnOrientedBlock
+from clickhouse_driver.connection import Packet
+from clickhouse_driver.errors import ResultLimitExceededError
+from clickhouse_driver.progress import Progress
+from clickhouse_driver.result import (
+    SpilledResult, SpillingProgressQueryResult, SpillingQueryResult
+)
+from tests.testcase import BaseTestCase
+
+
+def make_packets(columns_with_types, blocks):
+    rv = []
+    for data in [[]] + blocks:
+        packet = Packet()
+        packet.block = ColumnOrientedBlock(
+            columns_with_types, data, received_from_server=True
+        )
+        rv.append(packet)
+
+    return rv
+
+
+class SpillingQueryResultTestCase(TestCase):
+    columns_with_types = [('a', 'UInt8'), ('b', 'String')]
+
+    def get_result(self, blocks, **kwargs):
+        packets = make_packets(self.columns_with_types, blocks)
+        return SpillingQueryResult(packets, **kwargs).get_result()
+
+    def test_iterate(self):
+        blocks = [[(1, 2), ('a', 'b')], [(3, ), ('c', )]]
+
+        with self.get_result(blocks) as rv:
+            self.assertIsInstance(rv, SpilledResult)
+            self.assertEqual(len(rv), 3)
+
+            rows = [(1, 'a'), (2, 'b'), (3, 'c')]
+            self.assertEqual(list(rv), rows)
+            # Result can be iterated again.
+            self.assertEqual(list(rv), rows)
+
+            self.assertEqual(list(rv.iter_columns()), blocks)
+
+    def test_empty(self):
+        rv, columns_with_types = self.get_result([], with_column_types=True)
+
+        self.assertEqual(list(rv), [])
+        self.assertEqual(len(rv), 0)
+        self.assertEqual(columns_with_types, self.columns_with_types)
+        rv.close()
+
+    def test_interleaved_iteration(self):
+        blocks = [[(1, 2), ('a', 'b')], [(3, ), ('c', )]]
+
+        with self.get_result(blocks) as rv:
+            rows = [(1, 'a'), (2, 'b'), (3, 'c')]
+            self.assertEqual(list(zip(rv, rv)), list(zip(rows, rows)))
+
+    def test_columnar(self):
+        blocks = [[(1, 2), ('a', 'b')], [(3, ), ('c', )]]
+
+        with self.get_result(blocks, columnar=True) as rv:
+            self.assertEqual(len(rv), 3)
+            self.assertEqual(list(rv), blocks)
+            self.assertEqual(list(rv.iter_rows()), [
+                (1, 'a'), (2, 'b'), (3, 'c')
+            ])
+
+    def test_progress(self):
+        packets = make_packets(self.columns_with_types, [[(1, ), ('a', )]])
+
+        progress_packet = Packet()
+        progress_packet.progress = Progress()
+        progress_packet.progress.rows = 1
+        packets.insert(1, progress_packet)
+
+        result = SpillingProgressQueryResult(iter(packets))
+        self.assertEqual(list(result), [(1, 0)])
+
+        with result.get_result() as rv:
+            self.assertIsInstance(rv, SpilledResult)
+            self.assertEqual(list(rv), [(1, 'a')])
+
+    def test_row_type(self):
+        rv = self.get_result([[(1, ), ('a', )]], row_type='dict')
+        self.assertEqual(list(rv), [{'a': 1, 'b': 'a'}])
+        rv.close()
+
+    def test_closed(self):
+        rv = self.get_result([[(1, ), ('a', )]])
+        rv.close()
+
+        with self.assertRaises(ValueError):
+            list(rv)
+
+    def test_limits(self):
+        with self.assertRaises(ResultLimitExceededError):
+            self.get_result([[(1, 2), ('a', 'b')]] * 3, max_rows=5)
+
+
+class SpillToDiskTestCase(BaseTestCase):
+    def test_spill_to_disk(self):
+        query = (
+            'SELECT number, toString(number) FROM system.numbers '
+            'LIMIT 10000 SETTINGS max_block_size = 1000'
+        )
+        rv = self.client.execute(query, settings={'spill_to_disk': True})
+
+        # Connection is free while result is read.
+        self.assertEqual(self.client.execute('SELECT 1'), [(1, )])
+
+        with rv:
+            self.assertEqual(len(rv), 10000)
+            self.assertEqual(
+                list(rv), [(i, str(i)) for i in range(10000)]
+            )
+
+    def test_spill_to_disk_columnar(self):
+        query = 'SELECT number FROM system.numbers LIMIT 3'
+        rv = self.client.execute(
+            query, columnar=True, settings={'spill_to_disk': True}
+        )
+
+        with rv:
+            self.assertEqual(list(rv), [[(0, 1, 2)]])
+
+    def test_spill_to_disk_with_progress(self):
+        progress = self.client.execute_with_progress(
+            'SELECT 2', settings={'spill_to_disk': True}
+        )
+        self.assertEqual(list(progress), [(1, 0)])
+
+        with progress.get_result() as rv:
+            self.assertEqual(list(rv), [(2, )])
+
+
+class ResultTypeTestCase(BaseTestCase):
+    def test_rows_are_list(self):
+        query = 'SELECT number FROM system.numbers LIMIT 3'
+
+        rv = self.client.execute(query)
+        self.assertIsInstance(rv, list)
+        self.assertEqual(rv + [(3, )], [(0, ), (1, ), (2, ), (3, )])
+
+        rv = self.client.execute(query, settings={'row_type': 'dict'})
+        self.assertIsInstance(rv, list)
+        rv.sort(key=lambda x: -x['number'])
+        self.assertEqual(rv[0], {'number': 2})
@@ -1,4 +1,6 @@
-from clickhouse_driver.errors import ServerException, ErrorCodes
+from clickhouse_driver.errors import (
+    ServerException, ErrorCodes, ResultLimitExceededError
+)
 from tests.testcase import BaseTestCase
 from tests.util import require_server_version
 
@@ -118,3 +120,57 @@ class LimitsTestCase(BaseTestCase):
 
         rv = self.client.execute('SELECT arrayJoin(range(10))')
         self.assertEqual(len(rv), 10)
+
+    def test_max_stored_rows(self):
+        query = (
+            'SELECT number FROM system.numbers LIMIT 100000 '
+            'SETTINGS max_block_size = 1000'
+        )
+        settings = {'max_stored_rows': 5000}
+
+        with self.assertRaises(ResultLimitExceededError) as e:
+            self.client.execute(query, settings=settings)
+
+        self.assertEqual(e.exception.code, ErrorCodes.TOO_MANY_ROWS_OR_BYTES)
+        self.assertIn('max_stored_rows', str(e.exception))
+
+        # Connection is kept after query cancellation.
+        self.assertTrue(self.client.connection.connected)
+        rv = self.client.execute('SELECT 1')
+        self.assertEqual(rv, [(1, )])
+
+        settings = {'max_stored_rows': 100000}
+        rv = self.client.execute(query, settings=settings)
+        self.assertEqual(len(rv), 100000)
+
+    def test_max_stored_bytes(self):
+        query = (
+            "SELECT repeat('x', 1000) FROM system.numbers LIMIT 10000 "
+            "SETTINGS max_block_size = 100"
+        )
+        settings = {'max_stored_bytes': 100000}
+
+        with self.assertRaises(ResultLimitExceededError) as e:
+            self.client.execute(query, settings=settings, columnar=True)
+
+        self.assertIn('max_stored_bytes', str(e.exception))
+
+    def test_max_stored_rows_with_progress(self):
+        progress = self.client.execute_with_progress(
+            'SELECT number FROM system.numbers LIMIT 100000 '
+            'SETTINGS max_block_size = 1000',
+            settings={'max_stored_rows': 5000}
+        )
+
+        with self.assertRaises(ResultLimitExceededError):
+            progress.get_result()
+
+        rv = self.client.execute('SELECT 1')
+        self.assertEqual(rv, [(1, )])
+
+    def test_max_stored_rows_not_applied_to_iter(self):
+        rv = self.client.execute_iter(
+            'SELECT number FROM system.numbers LIMIT 10',
+            settings={'max_stored_rows': 5}
+        )
+        self.assertEqual(len(list(rv)), 10)
@@ -0,0 +1,56 @@
+from io import BytesIO
+from unittest import TestCase
+
+from mock import Mock
+
+from clickhouse_driver.reader import read_varint, py_read_varint
+from clickhouse_driver.writer import write_varint, py_write_varint
+from tests.test_connect import FakeBufferedReader, FakePyBufferedReader
+
+
+class VarIntTestCase(TestCase):
+    reader_cls = FakeBufferedReader
+
+    read_varint = staticmethod(read_varint)
+    write_varint = staticmethod(write_varint)
+
+    numbers = [
+        (0, b'\x00'), (1, b'\x01'), (127, b'\x7f'), (128, b'\x80\x01'),
+        (300, b'\xac\x02'), ((1 << 64) - 1, b'\xff' * 9 + b'\x01')
+    ]
+
+    def test_write(self):
+        for number, expected in self.numbers:
+            buf = BytesIO()
+            self.write_varint(number, buf)
+            self.assertEqual(buf.getvalue(), expected)
+
+    def test_read(self):
+        data = b''.join(x[1] for x in self.numbers)
+
+        # Varints span over buffers.
+        rdr = self.reader_cls([data[:3], data[3:7], data[7:]])
+        read = [self.read_varint(rdr) for _ in self.numbers]
+        self.assertEqual(read, [x[0] for x in self.numbers])
+
+    def test_read_too_long(self):
+        rdr = self.reader_cls([b'\xff' * 11])
+        with self.assertRaises(ValueError):
+            self.read_varint(rdr)
+
+        fin = Mock()
+        fin.read_one.return_value = 0xff
+        with self.assertRaises(ValueError):
+            self.read_varint(fin)
+
+    def test_read_from_any_object(self):
+        fin = Mock()
+        fin.read_one.side_effect = [0xac, 0x02]
+        self.assertEqual(self.read_varint(fin), 300)
+
+
+class PyVarIntTestCase(VarIntTestCase):
+    reader_cls = FakePyBufferedReader
+
+    read_varint = staticmethod(py_read_varint)
+    write_varint = staticmethod(py_write_varint)
@@ -1,6 +1,9 @@
 from functools import wraps
 import logging
-from io import StringIO
+from io import BytesIO, StringIO
+
+from clickhouse_driver.bufferedreader import BufferedReader, PyBufferedReader
+from clickhouse_driver.bufferedwriter import BufferedWriter, PyBufferedWriter
 
 
 def require_server_version(*version_required):
@@ -49,3 +52,53 @@ class LoggingCapturer(object):
 
 
 capture_logging = LoggingCapturer
+
+
+class BytesReaderMixin(object):
+    """
+    Reads data by ``bufsize`` chunks as socket does.
+    """
+
+    def __init__(self, data, bufsize):
+        self.data = BytesIO(data)
+        super(BytesReaderMixin, self).__init__(bufsize)
+
+    def read_into_buffer(self):
+        data = self.data.read(len(self.buffer))
+        self.current_buffer_size = len(data)
+        self.buffer[:len(data)] = data
+
+        if self.current_buffer_size == 0:
+            raise EOFError('Unexpected EOF while reading bytes')
+
+
+class BytesReader(BytesReaderMixin, BufferedReader):
+    pass
+
+
+class PyBytesReader(BytesReaderMixin, PyBufferedReader):
+    pass
+
+
+class BytesWriterMixin(object):
+    """
+    Records chunks passed to stream.
+    """
+
+    def __init__(self, bufsize):
+        self.chunks = []
+        super(BytesWriterMixin, self).__init__(bufsize)
+
+    def write_into_stream(self, chunks):
+        self.chunks.append([bytes(bytearray(x)) for x in chunks])
+
+    def getvalue(self):
+        return b''.join(b''.join(x) for x in self.chunks)
+
+
+class BytesWriter(BytesWriterMixin, BufferedWriter):
+    pass
+
+
+class PyBytesWriter(BytesWriterMixin, PyBufferedWriter):
+    pass